@@ -0,0 +1,158 @@
+"""Benchmark the throughput (in ticks per second) of the custom indicators.
+
+The indicators are imported from `src`, or with `--baseline` from a git revision, so
+that an optimisation can be compared with the code it replaced. Indicators that can't
+be imported or updated at a revision are reported as n/a.
+
+Typical usage example:
+>>> python benchmarks/indicators.py --baseline HEAD~1
+"""
+
+import argparse
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+N_TICKS = 20_000
+N_REPEATS = 5
+
+# The module, class, and keyword arguments of each indicator.
+INDICATORS = {
+    "ALMA": ("jfdi.indicators.alma", "ALMA", {"period": 300}),
+    "MMI": ("jfdi.indicators.mmi", "MMI", {"period": 300}),
+    "HighPass": ("jfdi.indicators.ehler.high_pass", "HighPass", {"period": 20}),
+    "LowPass": ("jfdi.indicators.ehler.low_pass", "LowPass", {"period": 20}),
+    "UltimateBands": (
+        "jfdi.indicators.ehler.ultimate_bands",
+        "UltimateBands",
+        {"period": 20},
+    ),
+    "UltimateOscillator": (
+        "jfdi.indicators.ehler.ultimate_oscillator",
+        "UltimateOscillator",
+        {"edge": 20, "width": 2},
+    ),
+    "UltimateRange": (
+        "jfdi.indicators.ehler.ultimate_range",
+        "UltimateRange",
+        {"period_centre": 20, "period_str": 20},
+    ),
+    "ZLEMA": ("jfdi.indicators.ehler.zlema", "ZLEMA", {"period": 20}),
+}
+
+
+def make_prices(n: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100 + np.cumsum(rng.normal(scale=0.1, size=n))
+
+
+def time_indicators(n_ticks: int) -> dict[str, float | None]:
+    """Return the ticks per second of each indicator, or `None` if it fails."""
+    from nautilus_trader.model import Bar, BarType, Price, Quantity
+
+    prices = make_prices(n_ticks).tolist()
+    bar_type = BarType.from_str("SPY.ARCA-1-MINUTE-LAST-EXTERNAL")
+    bars = [
+        Bar(
+            bar_type=bar_type,
+            open=Price(price, 2),
+            high=Price(price + 0.1, 2),
+            low=Price(price - 0.1, 2),
+            close=Price(price, 2),
+            volume=Quantity(1_000, 0),
+            ts_event=i + 1,
+            ts_init=i + 1,
+        )
+        for i, price in enumerate(prices)
+    ]
+
+    results = {}
+    for name, (module, cls, kwargs) in INDICATORS.items():
+        elapsed = np.inf
+
+        # The best of a few runs is the least affected by everything else going on.
+        for _ in range(N_REPEATS):
+            try:
+                indicator = getattr(importlib.import_module(module), cls)(**kwargs)
+
+                # Bar indicators need more than a price, so they're timed on bars.
+                if name == "UltimateRange":
+                    update, inputs = indicator.handle_bar, bars
+                else:
+                    update, inputs = indicator.update_raw, prices
+
+                start = time.perf_counter()
+                for x in inputs:
+                    update(x)
+                elapsed = min(elapsed, time.perf_counter() - start)
+            except Exception:
+                elapsed = None
+                break
+
+        results[name] = None if elapsed is None else n_ticks / elapsed
+
+    return results
+
+
+def time_baseline(revision: str, n_ticks: int) -> dict[str, float | None]:
+    """Time the indicators as they were at a git revision, in a fresh interpreter."""
+    with tempfile.TemporaryDirectory() as directory:
+        archive = subprocess.run(  # noqa: S603
+            ["git", "archive", revision, "src"],  # noqa: S607
+            cwd=ROOT,
+            capture_output=True,
+            check=True,
+        )
+        subprocess.run(  # noqa: S603
+            ["tar", "-x", "-C", directory],  # noqa: S607
+            input=archive.stdout,
+            check=True,
+        )
+
+        output = subprocess.run(  # noqa: S603
+            [sys.executable, __file__, "--json", "--ticks", str(n_ticks)],
+            env={**os.environ, "PYTHONPATH": str(Path(directory) / "src")},
+            capture_output=True,
+            check=True,
+            text=True,
+        )
+
+    return json.loads(output.stdout)
+
+
+def format_rate(rate: float | None) -> str:
+    return "n/a" if rate is None else f"{rate:,.0f}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--baseline", help="A git revision to compare against.")
+    parser.add_argument("--ticks", type=int, default=N_TICKS)
+    parser.add_argument("--json", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    current = time_indicators(args.ticks)
+
+    if args.json:
+        print(json.dumps(current))
+        sys.exit()
+
+    baseline = time_baseline(args.baseline, args.ticks) if args.baseline else {}
+
+    print(f"{args.ticks} ticks")
+    print(f"{'indicator':<20}{'baseline/s':>14}{'current/s':>14}{'speed-up':>10}")
+
+    for name, rate in current.items():
+        before = baseline.get(name)
+        speed_up = f"{rate / before:.1f}x" if rate and before else ""
+        print(
+            f"{name:<20}{format_rate(before):>14}{format_rate(rate):>14}{speed_up:>10}"
+        )
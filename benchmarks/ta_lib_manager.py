@@ -0,0 +1,158 @@
+"""Benchmark the per-bar and export latency of the TA-Lib indicator manager.
+
+Typical usage example:
+>>> python benchmarks/ta_lib_manager.py
+"""
+
+import time
+from collections import deque
+
+import numpy as np
+from nautilus_trader.model import Bar, BarType, Price, Quantity
+
+from jfdi.extensions.indicators.ta_lib.manager import (
+    TAFunctionWrapper,
+    TALibIndicatorManager,
+)
+
+BAR_TYPE = BarType.from_str("SPY.ARCA-1-MINUTE-LAST-EXTERNAL")
+INDICATORS = ["SMA_200", "ROC_50", "BBANDS_20_2.0_2.0_0_UPPER", "ATR_14"]
+N_BARS = 5_000
+PERIOD = 5
+
+
+class LegacyTALibIndicatorManager(TALibIndicatorManager):
+    """The manager as it was, concatenating deques of one-row arrays."""
+
+    def set_indicators(self, indicators: tuple[TAFunctionWrapper, ...]) -> None:
+        super().set_indicators(indicators)
+
+        self._input_deque = deque(maxlen=self._input_buffer.capacity)
+        self._output_deque = deque(maxlen=self._buffer_size)
+
+    def generate_output_array(self, truncate: bool) -> np.recarray | None:
+        if truncate:
+            output_array = np.concatenate(list(self._output_deque)[-self.period :])
+        else:
+            output_array = np.concatenate(list(self._output_deque))
+
+        output_array.flags.writeable = False
+        return output_array
+
+    def _update_ta_outputs(self, append: bool = True) -> None:
+        combined_output = np.zeros(1, dtype=self._output_dtypes)
+        for name in self.input_names():
+            combined_output[name] = self._input_deque[-1][name].item()
+
+        input_array = np.concatenate(self._input_deque)
+        for indicator in self._indicators:
+            inputs_dict = {name: input_array[name] for name in input_array.dtype.names}
+            indicator.fn.set_input_arrays(inputs_dict)
+            results = indicator.fn.run()
+
+            if len(indicator.output_names) == 1:
+                combined_output[indicator.output_names[0]] = results[-1]
+            else:
+                for i, output_name in enumerate(indicator.output_names):
+                    combined_output[output_name] = results[i][-1]
+
+        if append:
+            self._output_deque.append(combined_output)
+        else:
+            self._output_deque[-1] = combined_output
+
+        self._output_array = None
+
+    def handle_bar(self, bar: Bar) -> None:
+        bar_data = np.array(
+            [
+                (
+                    bar.ts_event,
+                    bar.ts_init,
+                    bar.open.as_double(),
+                    bar.high.as_double(),
+                    bar.low.as_double(),
+                    bar.close.as_double(),
+                    bar.volume.as_double(),
+                ),
+            ],
+            dtype=self.input_dtypes(),
+        )
+
+        if bar.ts_event == self._last_ts_event:
+            self._input_deque[-1] = bar_data
+            self._update_ta_outputs(append=False)
+        elif bar.ts_event > self._last_ts_event:
+            self._input_deque.append(bar_data)
+            self._increment_count()
+            self._update_ta_outputs()
+
+        self._last_ts_event = bar.ts_event
+
+
+def make_bars(n: int, seed: int = 0) -> list[Bar]:
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(scale=0.1, size=n))
+    spread = rng.uniform(0.01, 0.5, size=n)
+
+    return [
+        Bar(
+            bar_type=BAR_TYPE,
+            open=Price(close[i], 2),
+            high=Price(close[i] + spread[i], 2),
+            low=Price(close[i] - spread[i], 2),
+            close=Price(close[i], 2),
+            volume=Quantity(1_000, 0),
+            ts_event=i + 1,
+            ts_init=i + 1,
+        )
+        for i in range(n)
+    ]
+
+
+def time_manager(
+    cls: type[TALibIndicatorManager], bars: list[Bar]
+) -> tuple[np.ndarray, float]:
+    """Return the latency of each `handle_bar` call and of a complete export.
+
+    Each `handle_bar` call is followed by reading the latest value, as consumers do.
+    Latencies are in microseconds.
+    """
+    manager = cls(bar_type=BAR_TYPE, period=PERIOD)
+    manager.set_indicators(TAFunctionWrapper.from_list_of_str(INDICATORS))
+
+    latencies = np.empty(len(bars))
+    for i, bar in enumerate(bars):
+        start = time.perf_counter_ns()
+        manager.handle_bar(bar)
+        if manager.initialized:
+            manager.value(INDICATORS[0])
+        latencies[i] = (time.perf_counter_ns() - start) / 1_000
+
+    start = time.perf_counter_ns()
+    manager.generate_output_array(truncate=False)
+    export_latency = (time.perf_counter_ns() - start) / 1_000
+
+    return latencies, export_latency
+
+
+if __name__ == "__main__":
+    bars = make_bars(N_BARS)
+
+    print(f"{N_BARS} bars, indicators: {INDICATORS}")
+    print(
+        f"{'implementation':<16}{'mean us':>10}{'p50 us':>10}{'p99 us':>10}"
+        f"{'export us':>12}"
+    )
+
+    for label, cls in [
+        ("legacy", LegacyTALibIndicatorManager),
+        ("current", TALibIndicatorManager),
+    ]:
+        latencies, export_latency = time_manager(cls, bars)
+        print(
+            f"{label:<16}{latencies.mean():>10.1f}"
+            f"{np.percentile(latencies, 50):>10.1f}"
+            f"{np.percentile(latencies, 99):>10.1f}"
+            f"{export_latency:>12.1f}"
+        )
@@ -1,6 +1,9 @@
+import math
+from bisect import bisect_right
+
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
-from nautilus_trader.common.actor import Actor, ActorConfig
 from nautilus_trader.common.events import TimeEvent
 from nautilus_trader.core import UUID4
 from nautilus_trader.core.data import Data
@@ -16,19 +19,126 @@ from nautilus_trader.model import (
 from nautilus_trader.model.custom import customdataclass
 from nautilus_trader.model.events import AccountState
 
+from jfdi.actors.publishing import PublishingActor, PublishingActorConfig
+
 
 @customdataclass
 class BorrowingFeeData(Data):
     fee: float = 0
 
 
-class BorrowingFeeActorConfig(ActorConfig):
+class BorrowingRates:
+    __slots__ = (
+        "_cumulative_spread_list",
+        "_cumulative_spreads",
+        "_lower_limit_list",
+        "_lower_limits",
+        "_spread_list",
+        "_spreads",
+        "rate_basis",
+    )
+
+    def __init__(
+        self,
+        tier_limits: list[float],
+        tier_spreads: list[float],
+        # IB use a rate basis of 360 days, not 365.
+        rate_basis: int = 360,
+    ):
+        """Tiered interest rates that are a spread over a benchmark rate.
+
+        The interest on each tier is the benchmark rate plus the tier's spread, so the
+        daily fee is the benchmark's interest on the whole loan plus a piecewise-linear
+        function of the loan for the spreads. The spreads' interest at the start of
+        each tier is built once, so a fee is a lookup of the loan's tier and one
+        multiply-add, however many tiers there are.
+
+        Args:
+            tier_limits: The upper limit of each tier but the last (increasing).
+            tier_spreads: The spread of each tier over the benchmark rate (one more
+                than the limits).
+            rate_basis: The number of days in a year of interest.
+
+        Raises:
+            ValueError: If the limits aren't increasing, or there isn't one more
+                spread than limits.
+        """
+        lower_limits = np.concatenate([[0.0], np.asarray(tier_limits, dtype=float)])
+        spreads = np.asarray(tier_spreads, dtype=float)
+
+        if not np.all(np.diff(lower_limits) > 0):
+            raise ValueError("Invalid tier_limits. Choose one of: increasing limits")
+
+        if len(spreads) != len(lower_limits):
+            raise ValueError(
+                "Invalid tier_spreads. Choose one of: one more spread than tier limits"
+            )
+
+        self.rate_basis = rate_basis
+
+        self._lower_limits = lower_limits
+        self._spreads = spreads
+        self._cumulative_spreads = np.concatenate(
+            [[0.0], np.cumsum(np.diff(lower_limits) * spreads[:-1])]
+        )
+
+        # Bisecting short lists is quicker than NumPy for a single loan.
+        self._lower_limit_list = self._lower_limits.tolist()
+        self._spread_list = self._spreads.tolist()
+        self._cumulative_spread_list = self._cumulative_spreads.tolist()
+
+    def fee(self, borrowed_funds: float, benchmark_rate: float) -> float:
+        """Calculate the daily fee of a loan."""
+        if borrowed_funds <= 0:
+            return 0.0
+
+        tier = bisect_right(self._lower_limit_list, borrowed_funds) - 1
+
+        spread_interest = (
+            self._cumulative_spread_list[tier]
+            + (borrowed_funds - self._lower_limit_list[tier]) * self._spread_list[tier]
+        )
+
+        return (borrowed_funds * benchmark_rate + spread_interest) / self.rate_basis
+
+    def fees(
+        self,
+        borrowed_funds: npt.ArrayLike,
+        benchmark_rates: npt.ArrayLike,
+    ) -> npt.NDArray[np.float64]:
+        """Calculate the daily fees of loans of any shape.
+
+        The benchmark rates are broadcast against the loans, so each scenario can have
+        its own (or each day its own).
+        """
+        borrowed_funds = np.maximum(np.asarray(borrowed_funds, dtype=float), 0.0)
+
+        tiers = np.searchsorted(self._lower_limits, borrowed_funds, side="right") - 1
+
+        spread_interest = (
+            self._cumulative_spreads[tiers]
+            + (borrowed_funds - self._lower_limits[tiers]) * self._spreads[tiers]
+        )
+
+        return (
+            borrowed_funds * np.asarray(benchmark_rates, dtype=float) + spread_interest
+        ) / self.rate_basis
+
+
+class BorrowingFeeActorConfig(PublishingActorConfig):
     venue: Venue
     start_time: pd.Timestamp
     component_id: ComponentId
+    # IBKR Pro's benchmark rate for USD, and the rate from when it changes to
+    # another, if it does during the backtest.
+    benchmark_rate: float = 0.0433
+    benchmark_rate_changes: dict[pd.Timestamp, float] | None = None
+    # The tiers' upper limits (USD), and their spreads over the benchmark rate.
+    tier_limits: tuple[float, ...] = (100_000, 1_000_000, 50_000_000, 250_000_000)
+    tier_spreads: tuple[float, ...] = (0.015, 0.01, 0.0075, 0.005, 0.005)
 
 
-class BorrowingFeeActor(Actor):
+class BorrowingFeeActor(PublishingActor):
     def __init__(self, config: BorrowingFeeActorConfig) -> None:
         """Interactive Brokers Pro Tiered margin loan fee actor (USD).
 
@@ -41,7 +151,23 @@ class BorrowingFeeActor(Actor):
         self.borrowing_fee_key = f"{self.config.venue}_BORROWING_FEE"
         self.timer_key = f"{self.id}_TIMER"
 
+        self.rates = BorrowingRates(self.config.tier_limits, self.config.tier_spreads)
+
+        changes = sorted((self.config.benchmark_rate_changes or {}).items())
+        self._benchmark_rate_ts = np.array(
+            [pd.Timestamp(ts).value for ts, _ in changes], dtype=np.int64
+        )
+        self._benchmark_rates = [rate for _, rate in changes]
+
     def on_start(self) -> None:
+        self.borrowing_fee_data_type = DataType(
+            BorrowingFeeData,
+            metadata={
+                "venue": self.config.venue,
+                "currency_code": self.currency.code,
+            },
+        )
+
         self.clock.set_timer(
             name=self.timer_key,
             interval=pd.Timedelta(days=1),
@@ -58,18 +184,19 @@ class BorrowingFeeActor(Actor):
 
                 account_balance = account.balance(self.currency)
 
-                total_initial_notional_value = 0
-
-                for position in self.cache.positions_open(self.config.venue):
-                    total_initial_notional_value += (
-                        position.avg_px_open * position.quantity
-                    )
-
-                borrowed_funds = total_initial_notional_value - account_balance.total
+                total_initial_notional_value = math.fsum(
+                    position.avg_px_open * position.quantity.as_double()
+                    for position in self.cache.positions_open(self.config.venue)
+                )
 
-                borrowed_funds = float(borrowed_funds) if borrowed_funds > 0 else 0
+                borrowed_funds = max(
+                    total_initial_notional_value - account_balance.total.as_double(),
+                    0.0,
+                )
 
-                borrowing_fee = self.calculate_borrowing_fee(float(borrowed_funds))
+                borrowing_fee = self.calculate_borrowing_fee(
+                    borrowed_funds, self.get_benchmark_rate(event.ts_event)
+                )
 
                 borrowing_fee_data = BorrowingFeeData(
                     ts_event=event.ts_event,
@@ -77,16 +204,7 @@ class BorrowingFeeActor(Actor):
                     fee=borrowing_fee,
                 )
 
-                self.publish_data(
-                    DataType(
-                        BorrowingFeeData,
-                        metadata={
-                            "venue": self.config.venue,
-                            "currency_code": self.currency.code,
-                        },
-                    ),
-                    borrowing_fee_data,
-                )
+                self.publish_data(self.borrowing_fee_data_type, borrowing_fee_data)
 
                 # The exchange isn't accessible from inside actors, so I'm updating the
                 # message bus manually.
@@ -126,34 +244,38 @@ class BorrowingFeeActor(Actor):
                     msg=account_state,
                 )
 
-    def calculate_borrowing_fee(self, borrowed_funds: float) -> float:
+    def get_benchmark_rate(self, ts: int) -> float:
+        """Return the benchmark rate at a UNIX timestamp (in nanoseconds)."""
+        change = int(np.searchsorted(self._benchmark_rate_ts, ts, side="right")) - 1
+
+        if change < 0:
+            return self.config.benchmark_rate
+
+        return self._benchmark_rates[change]
+
+    def calculate_borrowing_fee(
+        self,
+        borrowed_funds: float,
+        benchmark_rate: float | None = None,
+    ) -> float:
         """Calculate the daily borrowing fee for a given amount of borrowed funds."""
-        if borrowed_funds <= 0:
-            return 0
-
-        # Tiered interest rates in percentage terms (that should change with the
-        # benchmark rate).
-        rates = [
-            (100_000, 0.0583),  # <100_000 USD, %
-            (1_000_000, 0.0533),  # 100_000<1_000_000 USD, %
-            (50_000_000, 0.0508),  # 1_000_000<50_000_000 USD, %
-            (250_000_000, 0.0483),  # 50_000_000<250_000_000 USD, %
-            (np.inf, 0.0483),  # 250_000_000< USD, %
-        ]
-
-        borrowing_fee = 0.0
-        remaining_funds = borrowed_funds
-        previous_tier_limit = 0
-
-        for tier_limit, rate in rates:
-            if remaining_funds <= 0:
-                break
-
-            tier_amount = min(tier_limit - previous_tier_limit, remaining_funds)
-
-            # They use a rate basis of 360 days, not 365.
-            borrowing_fee += tier_amount * rate / 360
-            remaining_funds -= tier_amount
-            previous_tier_limit = tier_limit
-
-        return borrowing_fee
+        if benchmark_rate is None:
+            benchmark_rate = self.config.benchmark_rate
+
+        return self.rates.fee(borrowed_funds, benchmark_rate)
+
+    def calculate_borrowing_fees(
+        self,
+        borrowed_funds: npt.ArrayLike,
+        benchmark_rates: npt.ArrayLike | None = None,
+    ) -> npt.NDArray[np.float64]:
+        """Calculate the daily borrowing fees of an array of borrowed funds.
+
+        This is for post-processing backtests, such as the daily financing costs of
+        many scenarios at once. The benchmark rates are broadcast against the
+        borrowed funds.
+        """
+        if benchmark_rates is None:
+            benchmark_rates = self.config.benchmark_rate
+
+        return self.rates.fees(borrowed_funds, benchmark_rates)
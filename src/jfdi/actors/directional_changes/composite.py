@@ -0,0 +1,225 @@
+from nautilus_trader.core.data import Data
+from nautilus_trader.model import BarType, ComponentId, DataType
+
+from jfdi.actors.directional_changes.extrema import ExtremaData, ExtremaType
+from jfdi.actors.directional_changes.extrema_difference import ExtremaDifferenceData
+from jfdi.actors.directional_changes.extrema_second_difference import (
+    ExtremaSecondDifferenceData,
+)
+from jfdi.actors.directional_changes.overshoot_differences import (
+    OvershootDifferenceData,
+)
+from jfdi.actors.publishing import PublishingActor, PublishingActorConfig
+
+
+class DirectionalChangeActorConfig(PublishingActorConfig):
+    bar_type: BarType
+    threshold: float
+    component_id: ComponentId
+    # The (previous_type, current_type) of each extrema difference (and of its second
+    # difference) to publish.
+    type_pairs: tuple[tuple[ExtremaType, ExtremaType], ...] = (
+        (ExtremaType.HIGH, ExtremaType.HIGH),
+        (ExtremaType.LOW, ExtremaType.LOW),
+        (ExtremaType.LOW, ExtremaType.HIGH),
+        (ExtremaType.HIGH, ExtremaType.LOW),
+    )
+    # The `current_overshoot` of each overshoot difference to publish.
+    current_overshoots: tuple[bool, ...] = (False, True)
+
+
+class DirectionalChangeActor(PublishingActor):
+    def __init__(self, config: DirectionalChangeActorConfig) -> None:
+        """Publish the differences, second differences, and overshoot differences.
+
+        Does the work of an `ExtremaDifferenceActor` and an
+        `ExtremaSecondDifferenceActor` for each type pair, and of an
+        `OvershootDifferenceActor` for each overshoot setting, and publishes the same
+        data to the same data types. Rather than each of them subscribing to the
+        extrema, and the second differences subscribing to the differences, this
+        subscribes to the extrema once and passes each extremum along itself.
+
+        The data types are built once, and everything that an extremum leads to is
+        published together after it's been handled.
+
+        Args:
+            bar_type: The bars that the extrema are created from.
+            threshold: The theshold that the extrema are created from.
+            component_id: The ID to assign to this component.
+            type_pairs: The previous and current types of the differences to publish.
+            current_overshoots: Whether to compare the current overshoot or extrema
+                to the previous overshoot, for each overshoot difference to publish.
+        """
+        super().__init__(config)
+
+        self.differences = [
+            (
+                ExtremaDifferences(previous_type, current_type),
+                SecondDifferences(),
+            )
+            for previous_type, current_type in self.config.type_pairs
+        ]
+        self.overshoot_differences = [
+            OvershootDifferences(current_overshoot)
+            for current_overshoot in self.config.current_overshoots
+        ]
+
+    def on_start(self) -> None:
+        metadata = {
+            "bar_type": self.config.bar_type,
+            "threshold": self.config.threshold,
+        }
+
+        self.extrema_data_type = DataType(ExtremaData, metadata=metadata)
+        self.difference_data_type = DataType(ExtremaDifferenceData, metadata=metadata)
+        self.second_difference_data_type = DataType(
+            ExtremaSecondDifferenceData, metadata=metadata
+        )
+        self.overshoot_difference_data_type = DataType(
+            OvershootDifferenceData, metadata=metadata
+        )
+
+        self.subscribe_data(self.extrema_data_type)
+
+    def on_stop(self) -> None:
+        self.unsubscribe_data(self.extrema_data_type)
+
+    def on_data(self, data: Data) -> None:
+        if not isinstance(data, ExtremaData):
+            return
+
+        batch = []
+
+        for differences, second_differences in self.differences:
+            difference = differences.update(data)
+
+            if difference is not None:
+                batch.append((self.difference_data_type, difference))
+
+                second_difference = second_differences.update(difference)
+
+                if second_difference is not None:
+                    batch.append((self.second_difference_data_type, second_difference))
+
+        for overshoot_differences in self.overshoot_differences:
+            difference = overshoot_differences.update(data)
+
+            if difference is not None:
+                batch.append((self.overshoot_difference_data_type, difference))
+
+        for data_type, derived_data in batch:
+            self.publish_data(data_type, derived_data)
+
+
+class ExtremaDifferences:
+    __slots__ = ("current", "current_type", "previous", "previous_type")
+
+    def __init__(self, previous_type: ExtremaType, current_type: ExtremaType):
+        """The differences between extrema, as `ExtremaDifferenceActor` publishes.
+
+        Args:
+            previous_type: Whether to measure from previous highs or lows.
+            current_type: Whether to measure from current highs or lows.
+        """
+        self.previous_type = previous_type.value
+        self.current_type = current_type.value
+
+        self.previous: ExtremaData | None = None
+        self.current: ExtremaData | None = None
+
+    def update(self, data: ExtremaData) -> ExtremaDifferenceData | None:
+        """Return the difference that the extremum completes, if it completes one."""
+        if self.current_type == self.previous_type:
+            if data.extrema_type != self.current_type:
+                return None
+
+            self.previous = self.current
+            self.current = data
+        elif data.extrema_type == self.current_type:
+            self.current = data
+        elif data.extrema_type == self.previous_type:
+            self.previous = data
+        else:
+            return None
+
+        previous = self.previous
+        current = self.current
+
+        if previous is None or current is None or current.ts_init <= previous.ts_init:
+            return None
+
+        return ExtremaDifferenceData(
+            ts_event=current.ts_event,
+            ts_init=current.ts_init,
+            difference=current.extrema - previous.extrema,
+            lag=current.ts_init - previous.ts_init,
+            previous_type=self.previous_type,
+            current_type=self.current_type,
+        )
+
+
+class SecondDifferences:
+    __slots__ = ("current", "previous")
+
+    def __init__(self):
+        """The second differences, as `ExtremaSecondDifferenceActor` publishes."""
+        self.previous: ExtremaDifferenceData | None = None
+        self.current: ExtremaDifferenceData | None = None
+
+    def update(self, data: ExtremaDifferenceData) -> ExtremaSecondDifferenceData | None:
+        """Return the second difference, once there are two differences."""
+        self.previous = self.current
+        self.current = data
+
+        previous = self.previous
+
+        if previous is None:
+            return None
+
+        return ExtremaSecondDifferenceData(
+            ts_event=data.ts_event,
+            ts_init=data.ts_init,
+            second_difference=data.difference - previous.difference,
+            second_lag=data.ts_init - previous.ts_init,
+            previous_type=data.previous_type,
+            current_type=data.current_type,
+        )
+
+
+class OvershootDifferences:
+    __slots__ = ("current_overshoot", "previous")
+
+    def __init__(self, current_overshoot: bool):
+        """The overshoot differences, as `OvershootDifferenceActor` publishes.
+
+        Args:
+            current_overshoot: Whether to compare the current overshoot or extrema to
+                the previous overshoot.
+        """
+        self.current_overshoot = current_overshoot
+
+        self.previous: ExtremaData | None = None
+
+    def update(self, data: ExtremaData) -> OvershootDifferenceData | None:
+        """Return the difference from the previous overshoot, if there is one."""
+        previous = self.previous
+        self.previous = data
+
+        if previous is None:
+            return None
+
+        if self.current_overshoot:
+            difference = data.overshoot - previous.overshoot
+            length = data.ts_init - previous.ts_init
+        else:
+            difference = data.extrema - previous.overshoot
+            length = data.ts_event - previous.ts_init
+
+        return OvershootDifferenceData(
+            ts_event=data.ts_event,
+            ts_init=data.ts_init,
+            difference=difference,
+            length=length,
+            previous_type=previous.extrema_type,
+            current_type=data.extrema_type,
+        )
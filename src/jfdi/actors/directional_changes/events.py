@@ -0,0 +1,353 @@
+from collections.abc import Sequence
+from itertools import product
+from typing import NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+import pyarrow as pa
+
+from jfdi.actors.directional_changes.extrema import ExtremaType
+
+# Bars are searched for reversals in blocks of at least this many bars.
+min_block_size = 32
+
+extrema_schema = pa.schema(
+    [
+        ("threshold", pa.float64()),
+        ("ts_event", pa.uint64()),
+        ("ts_init", pa.uint64()),
+        ("extrema", pa.float64()),
+        ("overshoot", pa.float64()),
+        ("extrema_type", pa.int64()),
+    ]
+)
+extrema_difference_schema = pa.schema(
+    [
+        ("threshold", pa.float64()),
+        ("ts_event", pa.uint64()),
+        ("ts_init", pa.uint64()),
+        ("difference", pa.float64()),
+        ("lag", pa.int64()),
+        ("previous_type", pa.int64()),
+        ("current_type", pa.int64()),
+    ]
+)
+extrema_second_difference_schema = pa.schema(
+    [
+        ("threshold", pa.float64()),
+        ("ts_event", pa.uint64()),
+        ("ts_init", pa.uint64()),
+        ("second_difference", pa.float64()),
+        ("second_lag", pa.int64()),
+        ("previous_type", pa.int64()),
+        ("current_type", pa.int64()),
+    ]
+)
+overshoot_difference_schema = pa.schema(
+    [
+        ("threshold", pa.float64()),
+        ("ts_event", pa.uint64()),
+        ("ts_init", pa.uint64()),
+        ("difference", pa.float64()),
+        ("length", pa.int64()),
+        ("previous_type", pa.int64()),
+        ("current_type", pa.int64()),
+        ("current_overshoot", pa.bool_()),
+    ]
+)
+
+_high = ExtremaType.HIGH.value
+_low = ExtremaType.LOW.value
+_type_pairs = list(product([_high, _low], repeat=2))
+
+
+class DirectionalChangeTables(NamedTuple):
+    extrema: pa.Table
+    extrema_differences: pa.Table
+    extrema_second_differences: pa.Table
+    overshoot_differences: pa.Table
+
+
+def directional_change_events(
+    high: npt.ArrayLike,
+    low: npt.ArrayLike,
+    close: npt.ArrayLike,
+    ts_event: npt.ArrayLike,
+    thresholds: Sequence[float],
+) -> DirectionalChangeTables:
+    """Find the directional-change events of a bar history without a backtest.
+
+    The events are those that an `ExtremaActor` publishes for each threshold, and
+    those that the `ExtremaDifferenceActor`, `ExtremaSecondDifferenceActor` and
+    `OvershootDifferenceActor` of each threshold publish in turn. Each table has the
+    fields of the data class it stands in for, along with a `threshold` column:
+
+    - `extrema`: `ExtremaData`.
+    - `extrema_differences`: `ExtremaDifferenceData` for all four combinations of
+      `previous_type` and `current_type`.
+    - `extrema_second_differences`: `ExtremaSecondDifferenceData` for all four
+      combinations as well.
+    - `overshoot_differences`: `OvershootDifferenceData` for both settings of the
+      actor's `current_overshoot`, which is a column.
+
+    Rather than stepping through the bars one at a time, each threshold's trend is
+    followed from one reversal to the next. The watermarks over a block of bars are a
+    running maximum (or minimum), and the reversal is the first bar that breaks them
+    by the threshold. Blocks start at twice the length of the previous trend and
+    double until a reversal is found, so each bar is visited about once per
+    threshold.
+
+    Args:
+        high: The bars' high prices.
+        low: The bars' low prices.
+        close: The bars' close prices.
+        ts_event: The bars' (strictly increasing) event timestamps.
+        thresholds: The thresholds that determine the scale of events.
+
+    Raises:
+        ValueError: If the arrays aren't all the same length.
+    """
+    log_high = np.log(np.asarray(high, dtype=np.float64))
+    log_low = np.log(np.asarray(low, dtype=np.float64))
+    log_close = np.log(np.asarray(close, dtype=np.float64))
+    ts_event = np.asarray(ts_event, dtype=np.uint64)
+
+    if not len(log_high) == len(log_low) == len(log_close) == len(ts_event):
+        raise ValueError("Invalid bars. Choose one of: arrays of the same length")
+
+    extrema = {}
+    for threshold in thresholds:
+        extrema_indices, reversal_indices, extrema_types = _find_extrema(
+            log_high, log_low, threshold
+        )
+
+        extrema[threshold] = {
+            "ts_event": ts_event[extrema_indices],
+            "ts_init": ts_event[reversal_indices],
+            "extrema": np.where(
+                extrema_types == _high,
+                log_high[extrema_indices],
+                log_low[extrema_indices],
+            ),
+            "overshoot": log_close[reversal_indices],
+            "extrema_type": extrema_types,
+        }
+
+    return DirectionalChangeTables(
+        extrema=_to_table(extrema, extrema_schema),
+        extrema_differences=_to_table(
+            {
+                threshold: _concat(
+                    _extrema_differences(events, previous_type, current_type)
+                    for previous_type, current_type in _type_pairs
+                )
+                for threshold, events in extrema.items()
+            },
+            extrema_difference_schema,
+        ),
+        extrema_second_differences=_to_table(
+            {
+                threshold: _concat(
+                    _second_differences(
+                        _extrema_differences(events, previous_type, current_type)
+                    )
+                    for previous_type, current_type in _type_pairs
+                )
+                for threshold, events in extrema.items()
+            },
+            extrema_second_difference_schema,
+        ),
+        overshoot_differences=_to_table(
+            {
+                threshold: _concat(
+                    _overshoot_differences(events, current_overshoot)
+                    for current_overshoot in (False, True)
+                )
+                for threshold, events in extrema.items()
+            },
+            overshoot_difference_schema,
+        ),
+    )
+
+
+def _find_extrema(
+    log_high: npt.NDArray[np.float64],
+    log_low: npt.NDArray[np.float64],
+    threshold: float,
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.int64]]:
+    """Return the bars of the extrema, the bars that confirmed them, and their types.
+
+    The comparisons are the ones `ExtremaActor` makes, on the same floats, so exactly
+    the same bars are found.
+    """
+    lower_factor = 1 - threshold
+    upper_factor = 1 + threshold
+    n_bars = len(log_high)
+
+    extrema_indices = []
+    reversal_indices = []
+    extrema_types = []
+
+    if n_bars == 0:
+        return _to_indices(extrema_indices, reversal_indices, extrema_types)
+
+    # The first bar sets both watermarks, and then it's checked like any other bar.
+    is_up_trend = not log_low[0] < lower_factor * log_high[0]
+    if not is_up_trend:
+        extrema_indices.append(0)
+        reversal_indices.append(0)
+        extrema_types.append(_high)
+
+    start = 0
+    block_size = min_block_size
+
+    while start < n_bars - 1:
+        # Bar `j` is compared with the watermark of the bars from `start` to `j - 1`.
+        first = start + 1
+        watermark = log_high[start] if is_up_trend else log_low[start]
+
+        while True:
+            stop = min(first + block_size, n_bars)
+
+            if is_up_trend:
+                watermarks = np.maximum.accumulate(log_high[first - 1 : stop - 1])
+                np.maximum(watermarks, watermark, out=watermarks)
+                breaks = log_low[first:stop] < lower_factor * watermarks
+            else:
+                watermarks = np.minimum.accumulate(log_low[first - 1 : stop - 1])
+                np.minimum(watermarks, watermark, out=watermarks)
+                breaks = log_high[first:stop] > upper_factor * watermarks
+
+            offset = int(breaks.argmax())
+            if breaks[offset] or stop == n_bars:
+                break
+
+            # The next block carries on from this block's watermark.
+            watermark = watermarks[-1]
+            first = stop
+            block_size *= 2
+
+        if not breaks[offset]:
+            break
+
+        reversal = first + offset
+
+        # Watermarks only move to strictly higher highs (or lower lows), so the
+        # extremum is the first bar with the highest high (or lowest low).
+        if is_up_trend:
+            extrema_indices.append(start + int(log_high[start:reversal].argmax()))
+            extrema_types.append(_high)
+        else:
+            extrema_indices.append(start + int(log_low[start:reversal].argmin()))
+            extrema_types.append(_low)
+        reversal_indices.append(reversal)
+
+        block_size = max(min_block_size, 2 * (reversal - start))
+        is_up_trend = not is_up_trend
+        start = reversal
+
+    return _to_indices(extrema_indices, reversal_indices, extrema_types)
+
+
+def _to_indices(
+    extrema_indices: list[int],
+    reversal_indices: list[int],
+    extrema_types: list[int],
+) -> tuple[npt.NDArray[np.intp], npt.NDArray[np.intp], npt.NDArray[np.int64]]:
+    return (
+        np.array(extrema_indices, dtype=np.intp),
+        np.array(reversal_indices, dtype=np.intp),
+        np.array(extrema_types, dtype=np.int64),
+    )
+
+
+def _extrema_differences(
+    events: dict[str, np.ndarray],
+    previous_type: int,
+    current_type: int,
+) -> dict[str, np.ndarray]:
+    """Return what an `ExtremaDifferenceActor` would publish."""
+    if previous_type == current_type:
+        previous = np.flatnonzero(events["extrema_type"] == current_type)
+        current = previous[1:]
+        previous = previous[:-1]
+    else:
+        # Highs and lows alternate, so each extremum follows one of the other type.
+        current = np.flatnonzero(events["extrema_type"] == current_type)
+        current = current[current > 0]
+        previous = current - 1
+
+    ts_init = events["ts_init"].astype(np.int64)
+
+    return {
+        "ts_event": events["ts_event"][current],
+        "ts_init": events["ts_init"][current],
+        "difference": events["extrema"][current] - events["extrema"][previous],
+        "lag": ts_init[current] - ts_init[previous],
+        "previous_type": np.full(len(current), previous_type, dtype=np.int64),
+        "current_type": np.full(len(current), current_type, dtype=np.int64),
+    }
+
+
+def _second_differences(differences: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """Return what an `ExtremaSecondDifferenceActor` would publish."""
+    ts_init = differences["ts_init"].astype(np.int64)
+
+    return {
+        "ts_event": differences["ts_event"][1:],
+        "ts_init": differences["ts_init"][1:],
+        "second_difference": np.diff(differences["difference"]),
+        "second_lag": np.diff(ts_init),
+        "previous_type": differences["previous_type"][1:],
+        "current_type": differences["current_type"][1:],
+    }
+
+
+def _overshoot_differences(
+    events: dict[str, np.ndarray],
+    current_overshoot: bool,
+) -> dict[str, np.ndarray]:
+    """Return what an `OvershootDifferenceActor` would publish."""
+    current = events["overshoot" if current_overshoot else "extrema"][1:]
+    current_ts = events["ts_init" if current_overshoot else "ts_event"][1:]
+
+    return {
+        "ts_event": events["ts_event"][1:],
+        "ts_init": events["ts_init"][1:],
+        "difference": current - events["overshoot"][:-1],
+        "length": current_ts.astype(np.int64) - events["ts_init"][:-1].astype(np.int64),
+        "previous_type": events["extrema_type"][:-1],
+        "current_type": events["extrema_type"][1:],
+        "current_overshoot": np.full(len(current), current_overshoot),
+    }
+
+
+def _concat(columns: list[dict[str, np.ndarray]]) -> dict[str, np.ndarray]:
+    """Concatenate columns, in the order the events were published."""
+    columns = list(columns)
+    concatenated = {
+        name: np.concatenate([column[name] for column in columns])
+        for name in columns[0]
+    }
+
+    order = np.argsort(concatenated["ts_init"], kind="stable")
+
+    return {name: values[order] for name, values in concatenated.items()}
+
+
+def _to_table(
+    columns: dict[float, dict[str, np.ndarray]],
+    schema: pa.Schema,
+) -> pa.Table:
+    tables = [
+        pa.table(
+            {
+                "threshold": np.full(len(threshold_columns["ts_init"]), threshold),
+                **threshold_columns,
+            },
+            schema=schema,
+        )
+        for threshold, threshold_columns in columns.items()
+    ]
+
+    return pa.concat_tables(tables) if tables else schema.empty_table()
@@ -1,11 +1,13 @@
+import math
 from enum import Enum, unique
 
 import numpy as np
-from nautilus_trader.common.actor import Actor, ActorConfig
 from nautilus_trader.core.data import Data
-from nautilus_trader.model import Bar, BarType, ComponentId, DataType, Price
+from nautilus_trader.model import Bar, BarType, ComponentId, DataType
 from nautilus_trader.model.custom import customdataclass
 
+from jfdi.actors.publishing import PublishingActor, PublishingActorConfig
+
 
 @unique
 class TrendType(Enum):
@@ -26,13 +28,16 @@ class ExtremaData(Data):
     extrema_type: int  # ExtremaType
 
 
-class ExtremaActorConfig(ActorConfig):
+class ExtremaActorConfig(PublishingActorConfig):
     bar_type: BarType
-    threshold: float
+    threshold: float | None = None
+    # Track several thresholds on the same bars in one vectorised pass, rather than
+    # with an actor per threshold.
+    thresholds: list[float] | None = None
     component_id: ComponentId
 
 
-class ExtremaActor(Actor):
+class ExtremaActor(PublishingActor):
     def __init__(self, config: ExtremaActorConfig) -> None:
         """Publish extrema by measuring from the high and low watermarks.
 
@@ -44,104 +49,159 @@ class ExtremaActor(Actor):
         Each data object consists of two values: the `extrema` price at `ts_event`, and
         the `overshoot` price, the price when the reversal was confirmed, at `ts_init`.
 
+        The watermarks of every threshold are held in arrays, so that the log prices of
+        each bar are taken once and compared with all of them at once. Each threshold
+        publishes to its own data type, as an actor with that `threshold` would.
+
         Args:
             bar_type: The bars to monitor.
             threshold: An arbitrary theshold that determines the scale of events.
+            thresholds: Several thresholds to monitor instead of `threshold`.
             component_id: The ID to assign to this component.
+
+        Raises:
+            ValueError: If not exactly one of `threshold` and `thresholds` is given.
         """
         super().__init__(config)
 
+        if (self.config.threshold is None) == (self.config.thresholds is None):
+            raise ValueError("Invalid thresholds. Choose one of: threshold, thresholds")
+
         self.swing_point_key = f"{self.config.bar_type}-SWING-POINT"
 
-        self.trend = TrendType.UP
+        thresholds = (
+            self.config.thresholds
+            if self.config.thresholds is not None
+            else [self.config.threshold]
+        )
+
+        self.thresholds = np.array(thresholds, dtype=np.float64)
+
+        n_thresholds = len(self.thresholds)
+
+        # The factors that the watermarks are multiplied by to confirm a reversal.
+        self._lower_factors = 1 - self.thresholds
+        self._upper_factors = 1 + self.thresholds
+
+        self.is_up_trend = np.full(n_thresholds, True)
 
-        self.high_water_mark = 0
-        self.low_water_mark = 0
+        # The watermarks are log prices, and are set by the first bar.
+        self.high_water_marks = np.zeros(n_thresholds)
+        self.low_water_marks = np.zeros(n_thresholds)
 
-        self.ts_start = 0
-        self.ts_end = 0
+        self.ts_starts = np.zeros(n_thresholds, dtype=np.uint64)
+        self.ts_ends = np.zeros(n_thresholds, dtype=np.uint64)
+
+        self._has_inputs = False
+
+        # No threshold does anything unless the low falls below `_low_trigger` or the
+        # high rises above `_high_trigger`, which most bars don't.
+        self._low_trigger = math.inf
+        self._high_trigger = -math.inf
 
     def on_start(self) -> None:
+        self.data_types = [
+            DataType(
+                ExtremaData,
+                metadata={
+                    "bar_type": self.config.bar_type,
+                    "threshold": threshold,
+                },
+            )
+            for threshold in self.thresholds.tolist()
+        ]
+
         self.subscribe_bars(self.config.bar_type)
 
     def on_stop(self) -> None:
         self.unsubscribe_bars(self.config.bar_type)
 
     def on_bar(self, bar: Bar) -> None:
-        bar = transform_bar(bar)
-
-        if self.high_water_mark == 0:
-            self.high_water_mark = bar.high
-        if self.low_water_mark == 0:
-            self.low_water_mark = bar.low
-        if self.ts_start == 0:
-            self.ts_start = bar.ts_event
-        if self.ts_end == 0:
-            self.ts_end = bar.ts_event
-
-        if self.trend == TrendType.UP:
-            if bar.low < (1 - self.config.threshold) * self.high_water_mark:
-                self.trend = TrendType.DOWN
-                self.low_water_mark = bar.low
-                self.ts_end = bar.ts_event
-
-                self.publish_data(
-                    DataType(
-                        ExtremaData,
-                        metadata={
-                            "bar_type": self.config.bar_type,
-                            "threshold": self.config.threshold,
-                        },
-                    ),
-                    ExtremaData(
-                        ts_event=self.ts_start,
-                        ts_init=bar.ts_event,
-                        extrema=self.high_water_mark.as_double(),
-                        overshoot=bar.close.as_double(),
-                        extrema_type=ExtremaType.HIGH.value,
-                    ),
+        # I'm using NumPy's log rather than math's, which can differ in the last bit,
+        # so that `directional_change_events` finds the same extrema.
+        high = float(np.log(bar.high.as_double()))
+        low = float(np.log(bar.low.as_double()))
+
+        if low >= self._low_trigger and high <= self._high_trigger:
+            return
+
+        ts_event = bar.ts_event
+
+        high_water_marks = self.high_water_marks
+        low_water_marks = self.low_water_marks
+
+        if not self._has_inputs:
+            self._has_inputs = True
+
+            high_water_marks[:] = high
+            low_water_marks[:] = low
+            self.ts_starts[:] = ts_event
+            self.ts_ends[:] = ts_event
+
+        is_up_trend = self.is_up_trend
+        is_down_trend = ~is_up_trend
+
+        turned_down = is_up_trend & (low < self._lower_factors * high_water_marks)
+        turned_up = is_down_trend & (high > self._upper_factors * low_water_marks)
+
+        if turned_down.any() or turned_up.any():
+            self._publish_extrema(
+                turned_down,
+                turned_up,
+                overshoot=float(np.log(bar.close.as_double())),
+                ts_event=ts_event,
+            )
+
+        # A reversal starts a new watermark in the other direction, and otherwise the
+        # watermark in the direction of the trend is extended.
+        new_highs = (is_up_trend & ~turned_down & (high > high_water_marks)) | turned_up
+        new_lows = (is_down_trend & ~turned_up & (low < low_water_marks)) | turned_down
+
+        high_water_marks[new_highs] = high
+        self.ts_starts[new_highs] = ts_event
+        low_water_marks[new_lows] = low
+        self.ts_ends[new_lows] = ts_event
+
+        is_up_trend ^= turned_down | turned_up
+
+        self._low_trigger = float(
+            np.where(
+                is_up_trend,
+                self._lower_factors * high_water_marks,
+                low_water_marks,
+            ).max()
+        )
+        self._high_trigger = float(
+            np.where(
+                is_up_trend,
+                high_water_marks,
+                self._upper_factors * low_water_marks,
+            ).min()
+        )
+
+    def _publish_extrema(
+        self,
+        turned_down: np.ndarray,
+        turned_up: np.ndarray,
+        overshoot: float,
+        ts_event: int,
+    ) -> None:
+        for index in np.flatnonzero(turned_down | turned_up):
+            if turned_down[index]:
+                extrema_data = ExtremaData(
+                    ts_event=int(self.ts_starts[index]),
+                    ts_init=ts_event,
+                    extrema=float(self.high_water_marks[index]),
+                    overshoot=overshoot,
+                    extrema_type=ExtremaType.HIGH.value,
                 )
             else:
-                if bar.high > self.high_water_mark:
-                    self.high_water_mark = bar.high
-                    self.ts_start = bar.ts_event
-        else:
-            if bar.high > (1 + self.config.threshold) * self.low_water_mark:
-                self.trend = TrendType.UP
-                self.high_water_mark = bar.high
-                self.ts_start = bar.ts_event
-
-                self.publish_data(
-                    DataType(
-                        ExtremaData,
-                        metadata={
-                            "bar_type": self.config.bar_type,
-                            "threshold": self.config.threshold,
-                        },
-                    ),
-                    ExtremaData(
-                        ts_event=self.ts_end,
-                        ts_init=bar.ts_event,
-                        extrema=self.low_water_mark.as_double(),
-                        overshoot=bar.close.as_double(),
-                        extrema_type=ExtremaType.LOW.value,
-                    ),
+                extrema_data = ExtremaData(
+                    ts_event=int(self.ts_ends[index]),
+                    ts_init=ts_event,
+                    extrema=float(self.low_water_marks[index]),
+                    overshoot=overshoot,
+                    extrema_type=ExtremaType.LOW.value,
                 )
-            else:
-                if bar.low < self.low_water_mark:
-                    self.low_water_mark = bar.low
-                    self.ts_end = bar.ts_event
-
-
-def transform_bar(bar: Bar) -> Bar:
-    """Get the logarithm of the bar."""
-    bar_dict = Bar.to_dict(bar)
-
-    bar_dict["open"] = str(np.log(bar.close.as_double()))
-    bar_dict["high"] = str(np.log(bar.high.as_double()))
-    bar_dict["low"] = str(np.log(bar.low.as_double()))
-    bar_dict["close"] = str(np.log(bar.close.as_double()))
-
-    bar = Bar.from_dict(bar_dict)
 
-    return bar
+            self.publish_data(self.data_types[index], extrema_data)
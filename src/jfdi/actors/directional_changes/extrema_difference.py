@@ -1,9 +1,9 @@
-from nautilus_trader.common.actor import Actor, ActorConfig
 from nautilus_trader.core.data import Data
 from nautilus_trader.model import BarType, ComponentId, DataType
 from nautilus_trader.model.custom import customdataclass
 
 from jfdi.actors.directional_changes.extrema import ExtremaData, ExtremaType
+from jfdi.actors.publishing import PublishingActor, PublishingActorConfig
 
 
 @customdataclass
@@ -14,7 +14,7 @@ class ExtremaDifferenceData(Data):
     current_type: int  # ExtremaType
 
 
-class ExtremaDifferenceActorConfig(ActorConfig):
+class ExtremaDifferenceActorConfig(PublishingActorConfig):
     bar_type: BarType
     threshold: float
     previous_type: ExtremaType
@@ -22,7 +22,7 @@ class ExtremaDifferenceActorConfig(ActorConfig):
     component_id: ComponentId
 
 
-class ExtremaDifferenceActor(Actor):
+class ExtremaDifferenceActor(PublishingActor):
     def __init__(self, config: ExtremaDifferenceActorConfig) -> None:
         """Publish the differences between extrema.
 
@@ -47,26 +47,18 @@ class ExtremaDifferenceActor(Actor):
         self.current = None
 
     def on_start(self) -> None:
-        self.subscribe_data(
-            DataType(
-                ExtremaData,
-                metadata={
-                    "bar_type": self.config.bar_type,
-                    "threshold": self.config.threshold,
-                },
-            )
-        )
+        metadata = {
+            "bar_type": self.config.bar_type,
+            "threshold": self.config.threshold,
+        }
+
+        self.extrema_data_type = DataType(ExtremaData, metadata=metadata)
+        self.difference_data_type = DataType(ExtremaDifferenceData, metadata=metadata)
+
+        self.subscribe_data(self.extrema_data_type)
 
     def on_stop(self) -> None:
-        self.unsubscribe_data(
-            DataType(
-                ExtremaData,
-                metadata={
-                    "bar_type": self.config.bar_type,
-                    "threshold": self.config.threshold,
-                },
-            )
-        )
+        self.unsubscribe_data(self.extrema_data_type)
 
     def on_data(self, data: Data) -> None:
         if isinstance(data, ExtremaData):
@@ -78,13 +70,7 @@ class ExtremaDifferenceActor(Actor):
 
                     if self.previous and self.current:
                         self.publish_data(
-                            DataType(
-                                ExtremaDifferenceData,
-                                metadata={
-                                    "bar_type": self.config.bar_type,
-                                    "threshold": self.config.threshold,
-                                },
-                            ),
+                            self.difference_data_type,
                             ExtremaDifferenceData(
                                 ts_event=self.current.ts_event,
                                 ts_init=self.current.ts_init,
@@ -95,7 +81,9 @@ class ExtremaDifferenceActor(Actor):
                             ),
                         )
 
-                        return
+                # Otherwise, the other type's extrema would publish the last difference
+                # again.
+                return
 
             # If we're comparing higs to lows or lows to highs:
             elif data.extrema_type == self.config.current_type.value:
@@ -106,13 +94,7 @@ class ExtremaDifferenceActor(Actor):
             if self.previous and self.current:
                 if self.current.ts_init > self.previous.ts_init:
                     self.publish_data(
-                        DataType(
-                            ExtremaDifferenceData,
-                            metadata={
-                                "bar_type": self.config.bar_type,
-                                "threshold": self.config.threshold,
-                            },
-                        ),
+                        self.difference_data_type,
                         ExtremaDifferenceData(
                             ts_event=self.current.ts_event,
                             ts_init=self.current.ts_init,
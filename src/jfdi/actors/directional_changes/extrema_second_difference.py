@@ -1,10 +1,10 @@
-from nautilus_trader.common.actor import Actor, ActorConfig
 from nautilus_trader.core.data import Data
 from nautilus_trader.model import BarType, ComponentId, DataType
 from nautilus_trader.model.custom import customdataclass
 
 from jfdi.actors.directional_changes.extrema import ExtremaType
 from jfdi.actors.directional_changes.extrema_difference import ExtremaDifferenceData
+from jfdi.actors.publishing import PublishingActor, PublishingActorConfig
 
 
 @customdataclass
@@ -15,7 +15,7 @@ class ExtremaSecondDifferenceData(Data):
     current_type: int  # ExtremaType
 
 
-class ExtremaSecondDifferenceActorConfig(ActorConfig):
+class ExtremaSecondDifferenceActorConfig(PublishingActorConfig):
     bar_type: BarType
     threshold: float
     previous_type: ExtremaType
@@ -23,7 +23,7 @@ class ExtremaSecondDifferenceActorConfig(ActorConfig):
     component_id: ComponentId
 
 
-class ExtremaSecondDifferenceActor(Actor):
+class ExtremaSecondDifferenceActor(PublishingActor):
     def __init__(self, config: ExtremaSecondDifferenceActorConfig) -> None:
         """Publish the differences of differences between extrema.
 
@@ -45,26 +45,20 @@ class ExtremaSecondDifferenceActor(Actor):
         self.current = None
 
     def on_start(self) -> None:
-        self.subscribe_data(
-            DataType(
-                ExtremaDifferenceData,
-                metadata={
-                    "bar_type": self.config.bar_type,
-                    "threshold": self.config.threshold,
-                },
-            )
+        metadata = {
+            "bar_type": self.config.bar_type,
+            "threshold": self.config.threshold,
+        }
+
+        self.difference_data_type = DataType(ExtremaDifferenceData, metadata=metadata)
+        self.second_difference_data_type = DataType(
+            ExtremaSecondDifferenceData, metadata=metadata
         )
 
+        self.subscribe_data(self.difference_data_type)
+
     def on_stop(self) -> None:
-        self.unsubscribe_data(
-            DataType(
-                ExtremaDifferenceData,
-                metadata={
-                    "bar_type": self.config.bar_type,
-                    "threshold": self.config.threshold,
-                },
-            )
-        )
+        self.unsubscribe_data(self.difference_data_type)
 
     def on_data(self, data: Data) -> None:
         if isinstance(data, ExtremaDifferenceData):
@@ -77,13 +71,7 @@ class ExtremaSecondDifferenceActor(Actor):
 
                 if self.previous and self.current:
                     self.publish_data(
-                        DataType(
-                            ExtremaSecondDifferenceData,
-                            metadata={
-                                "bar_type": self.config.bar_type,
-                                "threshold": self.config.threshold,
-                            },
-                        ),
+                        self.second_difference_data_type,
                         ExtremaSecondDifferenceData(
                             ts_event=self.current.ts_event,
                             ts_init=self.current.ts_init,
@@ -1,9 +1,9 @@
-from nautilus_trader.common.actor import Actor, ActorConfig
 from nautilus_trader.core.data import Data
 from nautilus_trader.model import BarType, ComponentId, DataType
 from nautilus_trader.model.custom import customdataclass
 
 from jfdi.actors.directional_changes.extrema import ExtremaData
+from jfdi.actors.publishing import PublishingActor, PublishingActorConfig
 
 
 @customdataclass
@@ -14,14 +14,14 @@ class OvershootDifferenceData(Data):
     current_type: int  # ExtremaType
 
 
-class OvershootDifferenceActorConfig(ActorConfig):
+class OvershootDifferenceActorConfig(PublishingActorConfig):
     bar_type: BarType
     threshold: float
     current_overshoot: bool
     component_id: ComponentId
 
 
-class OvershootDifferenceActor(Actor):
+class OvershootDifferenceActor(PublishingActor):
     def __init__(self, config: OvershootDifferenceActorConfig) -> None:
         """Publish the differences between extrema and overshoots.
 
@@ -45,38 +45,26 @@ class OvershootDifferenceActor(Actor):
         self.previous = None
 
     def on_start(self) -> None:
-        self.subscribe_data(
-            DataType(
-                ExtremaData,
-                metadata={
-                    "bar_type": self.config.bar_type,
-                    "threshold": self.config.threshold,
-                },
-            )
+        metadata = {
+            "bar_type": self.config.bar_type,
+            "threshold": self.config.threshold,
+        }
+
+        self.extrema_data_type = DataType(ExtremaData, metadata=metadata)
+        self.overshoot_difference_data_type = DataType(
+            OvershootDifferenceData, metadata=metadata
         )
 
+        self.subscribe_data(self.extrema_data_type)
+
     def on_stop(self) -> None:
-        self.unsubscribe_data(
-            DataType(
-                ExtremaData,
-                metadata={
-                    "bar_type": self.config.bar_type,
-                    "threshold": self.config.threshold,
-                },
-            )
-        )
+        self.unsubscribe_data(self.extrema_data_type)
 
     def on_data(self, data: Data) -> None:
         if isinstance(data, ExtremaData):
             if self.previous:
                 self.publish_data(
-                    DataType(
-                        OvershootDifferenceData,
-                        metadata={
-                            "bar_type": self.config.bar_type,
-                            "threshold": self.config.threshold,
-                        },
-                    ),
+                    self.overshoot_difference_data_type,
                     OvershootDifferenceData(
                         ts_event=data.ts_event,
                         ts_init=data.ts_init,
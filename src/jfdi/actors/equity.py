@@ -1,18 +1,27 @@
+import math
+from collections.abc import Callable
+
 import pandas as pd
-from nautilus_trader.common.actor import Actor, ActorConfig
+from nautilus_trader.common.actor import Actor
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.common.events import TimeEvent
 from nautilus_trader.core.data import Data
 from nautilus_trader.core.message import Event
 from nautilus_trader.model import (
+    Bar,
     ComponentId,
     Currency,
     DataType,
     InstrumentId,
+    MarkPriceUpdate,
     Money,
+    QuoteTick,
     Venue,
 )
 from nautilus_trader.model.custom import customdataclass
+from nautilus_trader.model.events import OrderFilled, PositionEvent
+
+from jfdi.actors.publishing import PublishingActor, PublishingActorConfig
 
 
 @customdataclass
@@ -22,61 +31,62 @@ class EquityData(Data):
     equity: float = 0
 
 
-class EquityActorConfig(ActorConfig):
+class EquityActorConfig(PublishingActorConfig):
     account_venue: Venue
     exchange_rate_venue: Venue
     # Multi-currency accounts have no base currency.
     reporting_currency: Currency
     start_time: pd.Timestamp
     component_id: ComponentId
+    # How often to publish, which can be as often as every few seconds to monitor
+    # intraday risk.
+    interval: pd.Timedelta = pd.Timedelta(days=1)
 
 
-class EquityActor(Actor):
+class EquityActor(PublishingActor):
     def __init__(self, config: EquityActorConfig) -> None:
         """Publish the account's equity.
 
         This actor publishes data on time events to avoid calculating every bar, and
         keeps the account and exchange rate venues separate to support Interactive
-        Brokers.
+        Brokers. The equity comes from an `EquityTracker`.
         """
         super().__init__(config)
 
         self.equity_key = f"{self.config.account_venue}-EQUITY"
         self.timer_key = f"{self.id}-TIMER"
 
+        self.equity_tracker = EquityTracker(
+            self,
+            self.config.account_venue,
+            self.config.exchange_rate_venue,
+            self.config.reporting_currency,
+        )
+
     def on_start(self) -> None:
+        self.equity_data_type = DataType(
+            EquityData,
+            metadata={
+                "venue": self.config.account_venue,
+                "currency_code": self.config.reporting_currency.code,
+            },
+        )
+
+        self.equity_tracker.start()
+
         self.clock.set_timer(
             name=self.timer_key,
-            interval=pd.Timedelta(days=1),
+            interval=self.config.interval,
             start_time=self.config.start_time,
         )
 
     def on_stop(self) -> None:
-        pass
+        self.equity_tracker.stop()
 
     def on_event(self, event: Event) -> None:
         if isinstance(event, TimeEvent):
             if event.name == self.timer_key:
-                balances_total = self.portfolio.account(
-                    self.config.account_venue
-                ).balances_total()
-
-                # Accounts at IB trade at multiple venues in NT, which all have separate
-                # profits and losses.
-                venues = {
-                    instrument.id.venue for instrument in self.cache.instruments()
-                }
-
-                unrealised_pnls = get_all_unrealised_pnls(self, venues)
-
-                equities = get_equities(balances_total, unrealised_pnls)
-
-                equity = get_equity(
-                    self,
-                    equities,
-                    self.config.exchange_rate_venue,
-                    self.config.reporting_currency,
-                )
+                equity = self.equity_tracker.equity()
 
                 if equity is None:
                     self.log.warning("NO EXCHANGE RATES AVAILABLE.", LogColor.CYAN)
@@ -88,16 +98,167 @@ class EquityActor(Actor):
                     equity=equity.as_double(),
                 )
 
-                self.publish_data(
-                    DataType(
-                        EquityData,
-                        metadata={
-                            "venue": self.config.account_venue,
-                            "currency_code": self.config.reporting_currency.code,
-                        },
-                    ),
-                    equity_data,
-                )
+                self.publish_data(self.equity_data_type, equity_data)
+
+
+class EquityTracker:
+    def __init__(
+        self,
+        actor: Actor,
+        account_venue: Venue,
+        exchange_rate_venue: Venue,
+        reporting_currency: Currency,
+    ) -> None:
+        """An account's equity, kept up to date from the actor's message bus.
+
+        Rather than looking up every venue in the cache and asking the portfolio for
+        their unrealised PnLs every time the equity is needed, I follow the
+        instruments with open positions from position events. Their fills, quotes and
+        bars mark their PnLs as stale, and only stale PnLs are fetched from the
+        portfolio, so the cost of the equity grows with the number of changed
+        positions and currencies rather than the size of the universe.
+
+        Args:
+            actor: The actor (or strategy) whose portfolio, cache and message bus to
+                use, once it's registered.
+            account_venue: The venue of the account.
+            exchange_rate_venue: The venue whose quotes convert the equity.
+            reporting_currency: The currency to report the equity in.
+        """
+        self.actor = actor
+        self.account_venue = account_venue
+        self.exchange_rate_venue = exchange_rate_venue
+        self.reporting_currency = reporting_currency
+
+        self.open_instrument_ids: set[InstrumentId] = set()
+        self.unrealised_pnls = UnrealisedPnLs()
+
+        self._handlers = {
+            "events.order.*": self._on_order_event,
+            "events.position.*": self._on_position_event,
+            "data.mark_prices.*": self._on_price,
+            "data.quotes.*": self._on_price,
+            "data.bars.*EXTERNAL": self._on_bar,
+        }
+
+    def start(self) -> None:
+        """Follow the open positions, from the actor's `on_start`."""
+        self.open_instrument_ids = {
+            position.instrument_id for position in self.actor.cache.positions_open()
+        }
+        self.unrealised_pnls.stale.update(self.open_instrument_ids)
+
+        # The portfolio's own handlers have a higher priority, so it's up to date by
+        # the time that these are called, and these have a higher priority than the
+        # actor's, so an actor that reads the equity on a bar sees that bar.
+        for topic, handler in self._handlers.items():
+            self.actor.msgbus.subscribe(topic=topic, handler=handler, priority=1)
+
+    def stop(self) -> None:
+        """Stop following the open positions, from the actor's `on_stop`."""
+        for topic, handler in self._handlers.items():
+            self.actor.msgbus.unsubscribe(topic=topic, handler=handler)
+
+    def equity(self) -> Money | None:
+        """Calculate the account's equity in the reporting currency.
+
+        Returns `None` if an exchange rate isn't available.
+        """
+        balances_total = self.actor.portfolio.account(
+            self.account_venue
+        ).balances_total()
+
+        self.unrealised_pnls.refresh(
+            self.open_instrument_ids, self.actor.portfolio.unrealized_pnl
+        )
+
+        equities = get_equities(balances_total, self.unrealised_pnls.money())
+
+        return get_equity(
+            self.actor, equities, self.exchange_rate_venue, self.reporting_currency
+        )
+
+    def _on_order_event(self, event: Event) -> None:
+        if isinstance(event, OrderFilled):
+            self.unrealised_pnls.stale.add(event.instrument_id)
+
+    def _on_position_event(self, event: PositionEvent) -> None:
+        instrument_id = event.instrument_id
+
+        # Accounts at IB trade at multiple venues in NT, so positions at any venue
+        # count.
+        if self.actor.cache.positions_open(instrument_id=instrument_id):
+            self.open_instrument_ids.add(instrument_id)
+        else:
+            self.open_instrument_ids.discard(instrument_id)
+
+        self.unrealised_pnls.stale.add(instrument_id)
+
+    def _on_price(self, data: MarkPriceUpdate | QuoteTick) -> None:
+        if data.instrument_id in self.open_instrument_ids:
+            self.unrealised_pnls.stale.add(data.instrument_id)
+
+    def _on_bar(self, bar: Bar) -> None:
+        instrument_id = bar.bar_type.instrument_id
+
+        if instrument_id in self.open_instrument_ids:
+            self.unrealised_pnls.stale.add(instrument_id)
+
+
+class UnrealisedPnLs:
+    def __init__(self) -> None:
+        """The unrealised PnLs of the open instruments, totalled by currency.
+
+        Each instrument's PnL replaces its previous one, and only the totals of the
+        currencies that changed are summed again.
+        """
+        self.totals: dict[Currency, float] = {}
+        # The instruments whose PnLs may have changed since they were last updated.
+        self.stale: set[InstrumentId] = set()
+
+        self._pnls: dict[Currency, dict[InstrumentId, float]] = {}
+        self._currencies: dict[InstrumentId, Currency] = {}
+
+    def update(self, instrument_id: InstrumentId, pnl: Money | None) -> None:
+        """Replace the instrument's PnL, or remove it if it's `None`."""
+        changed = set()
+
+        currency = self._currencies.pop(instrument_id, None)
+        if currency is not None:
+            del self._pnls[currency][instrument_id]
+            changed.add(currency)
+
+        if pnl is not None:
+            self._currencies[instrument_id] = pnl.currency
+            self._pnls.setdefault(pnl.currency, {})[instrument_id] = pnl.as_double()
+            changed.add(pnl.currency)
+
+        for currency in changed:
+            if self._pnls[currency]:
+                self.totals[currency] = math.fsum(self._pnls[currency].values())
+            else:
+                del self._pnls[currency]
+                del self.totals[currency]
+
+    def refresh(
+        self,
+        open_instrument_ids: set[InstrumentId],
+        unrealized_pnl: Callable[[InstrumentId], Money | None],
+    ) -> None:
+        """Update the stale PnLs, removing those of instruments that aren't open."""
+        for instrument_id in self.stale:
+            if instrument_id in open_instrument_ids:
+                self.update(instrument_id, unrealized_pnl(instrument_id))
+            else:
+                self.update(instrument_id, None)
+
+        self.stale.clear()
+
+    def money(self) -> dict[Currency, Money]:
+        """Return the totals as money."""
+        return {
+            currency: Money(total, currency) for currency, total in self.totals.items()
+        }
 
 
 def get_all_unrealised_pnls(
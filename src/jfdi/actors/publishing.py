@@ -0,0 +1,92 @@
+import time
+
+from nautilus_trader.common.actor import Actor, ActorConfig
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
+from nautilus_trader.model import DataType
+
+
+class PublishStats:
+    __slots__ = ("count", "max_ns", "total_ns")
+
+    def __init__(self):
+        """The number of times that a topic was published to, and how long it took."""
+        self.count = 0
+        self.total_ns = 0
+        self.max_ns = 0
+
+    @property
+    def mean_ns(self) -> float:
+        return self.total_ns / self.count if self.count else 0.0
+
+    def record(self, elapsed_ns: int) -> None:
+        self.count += 1
+        self.total_ns += elapsed_ns
+
+        if elapsed_ns > self.max_ns:
+            self.max_ns = elapsed_ns
+
+    def __repr__(self) -> str:
+        return (
+            f"{type(self).__name__}(count={self.count}, mean_ns={self.mean_ns:.0f}, "
+            f"max_ns={self.max_ns})"
+        )
+
+
+class PublishingActorConfig(ActorConfig, kw_only=True, frozen=True):
+    # Count the publishes to each topic and time them (which includes the handlers of
+    # every subscriber, as the message bus is synchronous).
+    profile_publishing: bool = False
+
+
+class PublishingActor(Actor):
+    def __init__(self, config: PublishingActorConfig) -> None:
+        """The base class of actors that publish to data types they build once.
+
+        Subclasses build their data types in `on_start`, where the config (and cache)
+        is available, and publish with `publish_data` as usual. Each data type's topic
+        is built the first time it's published to, and is then looked up by the data
+        type, whose hash is precomputed, so publishing doesn't format the metadata
+        again. The data is checked as it is by `Actor.publish_data`.
+
+        If `profile_publishing` is set, `publish_stats` holds the `PublishStats` of each
+        topic.
+        """
+        super().__init__(config)
+
+        self.publish_stats: dict[str, PublishStats] = {}
+        self._topics: dict[DataType, str] = {}
+
+    def publish_data(self, data_type: DataType, data: Data) -> None:
+        """Publish the data to the data type's topic on the message bus.
+
+        Raises:
+            TypeError: If the data is `None`, or isn't of the data type's type.
+            ValueError: If the actor isn't registered.
+        """
+        PyCondition.not_none(data_type, "data_type")
+        PyCondition.not_none(data, "data")
+        PyCondition.type(data, data_type.type, "data", "data.type")
+        PyCondition.is_true(
+            self.trader_id is not None, "The actor has not been registered"
+        )
+
+        topic = self._topics.get(data_type)
+
+        if topic is None:
+            topic = self._topics[data_type] = f"data.{data_type.topic}"
+
+        if not self.config.profile_publishing:
+            self.msgbus.publish(topic, data)
+            return
+
+        start = time.perf_counter_ns()
+        self.msgbus.publish(topic, data)
+        elapsed_ns = time.perf_counter_ns() - start
+
+        stats = self.publish_stats.get(topic)
+
+        if stats is None:
+            stats = self.publish_stats[topic] = PublishStats()
+
+        stats.record(elapsed_ns)
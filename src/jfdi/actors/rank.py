@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from nautilus_trader.common.actor import Actor, ActorConfig
 from nautilus_trader.core.data import Data
 from nautilus_trader.model import (
     Bar,
@@ -12,36 +11,55 @@ from nautilus_trader.model import (
 )
 from nautilus_trader.model.enums import AggregationSource
 
+from jfdi.actors.publishing import PublishingActor, PublishingActorConfig
+from jfdi.extensions.aggregation.time_slice import (
+    IncompleteSlicePolicy,
+    TimeSlice,
+    TimeSliceAggregator,
+)
 from jfdi.extensions.indicators.ta_lib.manager import (
     TAFunctionWrapper,
     TALibIndicatorManager,
 )
+from jfdi.extensions.indicators.ta_lib.registry import talib_indicator_registry
+from jfdi.indicators.cross_sectional import (
+    CrossSectionalBuffer,
+    cross_sectional_kernels,
+    rank_descending,
+)
 
 # Class variables can only be basic data types or instrument ids, so I'll create
-# the rank data class during the backtest.
+# the rank data class during the backtest. Each instrument is an index into the
+# actor's `instrument_ids` (the symbol table), and `ranks` lines up with them.
 # @customdataclass
 # class RankData(Data):
-#     instrument_ids: np.ndarray = field(
-#         default_factory=lambda: np.full(len(instruments), "", str)
+#     instrument_indices: np.ndarray = field(
+#         default_factory=lambda: np.arange(len(instruments), dtype=np.uint16)
 #     )
 #     ranks: np.ndarray = field(
 #         default_factory=lambda: np.full(len(instruments), 0, int),
 #     )
 
 
-class RankActorConfig(ActorConfig):
+class RankActorConfig(PublishingActorConfig):
     instrument_ids: list[InstrumentId]
     bar_spec: BarSpecification
     # indicator_class: Indicator
     # indicator_kwargs: dict
     indicator_class: str
     data_class: Data
-    dtype_instrument_id: str
+    dtype_instrument_index: str
     dtype_rank: str
     component_id: ComponentId
+    # Rank with one vectorised pass over a price matrix instead of an indicator
+    # manager per instrument (only for the indicators in `cross_sectional_kernels`).
+    cross_sectional: bool = False
+    # What to do when some instruments' bars haven't arrived.
+    incomplete_slice_policy: IncompleteSlicePolicy = IncompleteSlicePolicy.DROP
+    slice_timeout: pd.Timedelta | None = None
 
 
-class RankActor(Actor):
+class RankActor(PublishingActor):
     def __init__(self, config: RankActorConfig) -> None:
         """Publish the ranks of a series of instruments."""
         super().__init__(config)
@@ -64,26 +82,84 @@ class RankActor(Actor):
         # Use talib's indicators.
         self.indicator_managers = {}
 
-        for instrument_id, bar_type in self.bar_types.items():
-            self.indicator_managers[instrument_id] = TALibIndicatorManager(
-                bar_type=bar_type,
-                skip_uniform_price_bar=False,
-                skip_zero_close_bar=False,
-            )
-            self.indicator_managers[instrument_id].set_indicators(
-                [TAFunctionWrapper.from_str(self.config.indicator_class)]
+        if self.config.cross_sectional:
+            self._init_cross_sectional()
+        else:
+            for instrument_id, bar_type in self.bar_types.items():
+                self.indicator_managers[instrument_id] = TALibIndicatorManager(
+                    bar_type=bar_type,
+                    skip_uniform_price_bar=False,
+                    skip_zero_close_bar=False,
+                    # Rank actors on the same bars share their indicator outputs.
+                    registry=talib_indicator_registry,
+                )
+                self.indicator_managers[instrument_id].set_indicators(
+                    [TAFunctionWrapper.from_str(self.config.indicator_class)]
+                )
+
+        self.ranks_key = f"{self.config.component_id}_RANKS"
+
+        # Rank data refers to instruments by their index in `instrument_ids`, which
+        # never changes, so the same array is published every time.
+        self.instrument_index_array = np.arange(
+            len(self.config.instrument_ids),
+            dtype=np.dtype(self.config.dtype_instrument_index),
+        )
+        self.rank_array = np.arange(
+            1,
+            len(self.config.instrument_ids) + 1,
+            dtype=np.dtype(self.config.dtype_rank),
+        )
+
+    def _init_cross_sectional(self) -> None:
+        taf = TAFunctionWrapper.from_str(self.config.indicator_class)
+
+        if taf.name not in cross_sectional_kernels:
+            raise ValueError(
+                f"Invalid indicator_class for cross-sectional ranking. Choose one of: "
+                f"{list(cross_sectional_kernels)}"
             )
 
-        self.last_timestamps = {
-            instrument_id: pd.NaT for instrument_id in self.config.instrument_ids
+        self.kernel, get_window = cross_sectional_kernels[taf.name]
+        self.timeperiod = taf.fn.parameters["timeperiod"]
+
+        self.instrument_indices = {
+            instrument_id: index
+            for index, instrument_id in enumerate(self.config.instrument_ids)
         }
 
-        self.ranks_key = f"{self.config.component_id}_RANKS"
+        self.prices = CrossSectionalBuffer(
+            len(self.config.instrument_ids), get_window(self.timeperiod)
+        )
 
     def on_start(self) -> None:
+        self.rank_data_type = DataType(
+            self.config.data_class,
+            metadata={
+                "bar_spec": self.config.bar_spec,
+                # "indicator_class": self.config.indicator_class.__name__,
+                # "indicator_kwargs": self.config.indicator_kwargs,
+                "indicator_class": self.config.indicator_class,
+                "dtype_instrument_index": self.config.dtype_instrument_index,
+                "dtype_rank": self.config.dtype_rank,
+            },
+        )
+
+        self.time_slices = TimeSliceAggregator(
+            keys=self.config.instrument_ids,
+            callback=self.on_time_slice,
+            policy=self.config.incomplete_slice_policy,
+            clock=self.clock,
+            timeout=self.config.slice_timeout,
+            name=f"{self.id}-TIME-SLICE",
+        )
+
         for instrument_id, bar_type in self.bar_types.items():
             self.subscribe_bars(bar_type)
 
+            if self.config.cross_sectional:
+                continue
+
             self.register_indicator_for_bars(
                 self.bar_types[instrument_id],
                 # self.indicators[instrument_id],
@@ -95,53 +171,46 @@ class RankActor(Actor):
             self.unsubscribe_bars(bar_type)
 
     def on_bar(self, bar: Bar) -> None:
-        if self.indicators_initialized():
-            instrument_id = bar.bar_type.instrument_id
-
-            self.last_timestamps[instrument_id] = bar.ts_event
-
-            # Wait until every instrument's data has arrived.
-            if len(set(self.last_timestamps.values())) == 1:
-                values = {
-                    # instrument_id: self.indicators[instrument_id].value
-                    instrument_id: self.indicator_managers[instrument_id].value(
-                        self.config.indicator_class
-                    )
-                    for instrument_id in self.config.instrument_ids
-                }
-
-                ranks = {
-                    instrument_id: rank
-                    for rank, (instrument_id, _) in enumerate(
-                        sorted(values.items(), key=lambda item: item[1], reverse=True),
-                        start=1,
-                    )
-                }
-
-                rank_data = self.config.data_class(
-                    ts_event=bar.ts_event,
-                    ts_init=bar.ts_init,
-                    instrument_ids=np.array(
-                        list(ranks.keys()),
-                        dtype=np.dtype(self.config.dtype_instrument_id),
-                    ),
-                    ranks=np.array(
-                        list(ranks.values()),
-                        dtype=np.dtype(self.config.dtype_rank),
-                    ),
-                )
+        instrument_id = bar.bar_type.instrument_id
+
+        if self.config.cross_sectional:
+            self.prices.update(
+                self.instrument_indices[instrument_id],
+                bar.ts_event,
+                bar.close.as_double(),
+            )
 
-                self.publish_data(
-                    DataType(
-                        self.config.data_class,
-                        metadata={
-                            "bar_spec": self.config.bar_spec,
-                            # "indicator_class": self.config.indicator_class.__name__,
-                            # "indicator_kwargs": self.config.indicator_kwargs,
-                            "indicator_class": self.config.indicator_class,
-                            "dtype_instrument_id": self.config.dtype_instrument_id,
-                            "dtype_rank": self.config.dtype_rank,
-                        },
-                    ),
-                    rank_data,
+        # Wait until every instrument's data has arrived.
+        self.time_slices.update(instrument_id, bar)
+
+    def on_time_slice(self, time_slice: TimeSlice) -> None:
+        if self.config.cross_sectional:
+            initialized = self.prices.initialized
+        else:
+            initialized = self.indicators_initialized()
+
+        if initialized:
+            if self.config.cross_sectional:
+                values = self.kernel(self.prices.matrix(), self.timeperiod)
+            else:
+                values = np.array(
+                    [
+                        # self.indicators[instrument_id].value
+                        self.indicator_managers[instrument_id].value(
+                            self.config.indicator_class
+                        )
+                        for instrument_id in self.config.instrument_ids
+                    ]
                 )
+
+            ranks = np.empty_like(self.rank_array)
+            ranks[rank_descending(values)] = self.rank_array
+
+            rank_data = self.config.data_class(
+                ts_event=time_slice.ts_event,
+                ts_init=time_slice.ts_init,
+                instrument_indices=self.instrument_index_array,
+                ranks=ranks,
+            )
+
+            self.publish_data(self.rank_data_type, rank_data)
@@ -1,6 +1,5 @@
 import numpy as np
 import pandas as pd
-from nautilus_trader.common.actor import Actor, ActorConfig
 from nautilus_trader.core.data import Data
 from nautilus_trader.model import (
     Bar,
@@ -12,8 +11,14 @@ from nautilus_trader.model import (
 )
 from nautilus_trader.model.custom import customdataclass
 from nautilus_trader.model.enums import AggregationSource
-from scipy.spatial import distance
-from sklearn.covariance import LedoitWolf
+
+from jfdi.actors.publishing import PublishingActor, PublishingActorConfig
+from jfdi.extensions.aggregation.time_slice import (
+    IncompleteSlicePolicy,
+    TimeSlice,
+    TimeSliceAggregator,
+)
+from jfdi.indicators.covariance import RollingCovariance, mahalanobis_squared
 
 
 @customdataclass
@@ -21,15 +26,18 @@ class TurbulenceData(Data):
     turbulence: float = 0
 
 
-class TurbulenceActorConfig(ActorConfig):
+class TurbulenceActorConfig(PublishingActorConfig):
     instrument_ids: list[InstrumentId]
     bar_spec: BarSpecification
     fast_period: int
     slow_period: int
     component_id: ComponentId
+    # What to do when some instruments' bars haven't arrived.
+    incomplete_slice_policy: IncompleteSlicePolicy = IncompleteSlicePolicy.DROP
+    slice_timeout: pd.Timedelta | None = None
 
 
-class TurbulenceActor(Actor):
+class TurbulenceActor(PublishingActor):
     def __init__(self, config: TurbulenceActorConfig) -> None:
         """Publish the ranks of a series of instruments."""
         super().__init__(config)
@@ -44,22 +52,42 @@ class TurbulenceActor(Actor):
             for instrument_id in self.config.instrument_ids
         }
 
-        self.last_closes = {
-            instrument_id: np.nan for instrument_id in self.config.instrument_ids
+        self.instrument_indices = {
+            instrument_id: index
+            for index, instrument_id in enumerate(self.config.instrument_ids)
         }
 
-        self.last_timestamps = {
-            instrument_id: pd.NaT for instrument_id in self.config.instrument_ids
-        }
+        self.last_closes = np.full(len(self.config.instrument_ids), np.nan)
+        # The returns since the last time slice.
+        self.latest_returns = np.zeros(len(self.config.instrument_ids))
 
-        self.returns = {
-            instrument_id: np.full(self.config.slow_period, np.nan)
-            for instrument_id in self.config.instrument_ids
-        }
+        # The window of returns (of length `slow_period`) and their running moments.
+        self.returns = RollingCovariance(
+            len(self.config.instrument_ids), self.config.slow_period
+        )
 
         self.turbulence_key = f"{self.config.component_id}_TURBULENCE"
 
     def on_start(self) -> None:
+        self.turbulence_data_type = DataType(
+            TurbulenceData,
+            metadata={
+                # "instrument_ids": self.config.instrument_ids,
+                "bar_spec": self.config.bar_spec,
+                "fast_period": self.config.fast_period,
+                "slow_period": self.config.slow_period,
+            },
+        )
+
+        self.time_slices = TimeSliceAggregator(
+            keys=self.config.instrument_ids,
+            callback=self.on_time_slice,
+            policy=self.config.incomplete_slice_policy,
+            clock=self.clock,
+            timeout=self.config.slice_timeout,
+            name=f"{self.id}-TIME-SLICE",
+        )
+
         for bar_type in self.bar_types.values():
             self.subscribe_bars(bar_type)
 
@@ -68,67 +96,58 @@ class TurbulenceActor(Actor):
             self.unsubscribe_bars(bar_type)
 
     def on_bar(self, bar: Bar) -> None:
-        instrument_id = bar.bar_type.instrument_id
+        # Wait until every instrument's data has arrived.
+        self.time_slices.update(bar.bar_type.instrument_id, bar)
 
-        if self.last_closes[instrument_id]:
-            self.returns[instrument_id][1:] = self.returns[instrument_id][:-1]
-            self.returns[instrument_id][0] = (
-                bar.close  # np.log(bar.close.as_double())
-                - self.last_closes[instrument_id]
-            ) / self.last_closes[instrument_id]
+    def on_time_slice(self, time_slice: TimeSlice) -> None:
+        # Instruments missing from an emitted slice haven't moved since their last
+        # bar, which is also what their forward-filled bars say. The first return is
+        # NaN, which keeps the window from being used until every instrument has a
+        # full window of returns.
+        self.latest_returns[:] = 0
+        self.latest_returns[np.isnan(self.last_closes)] = np.nan
 
-        self.last_closes[instrument_id] = bar.close  # np.log(bar.close.as_double())
-        self.last_timestamps[instrument_id] = bar.ts_event
+        for instrument_id, bar in time_slice.data.items():
+            index = self.instrument_indices[instrument_id]
 
-        # Wait until every instrument's data has arrived.
-        if all(not np.isnan(arr).any() for arr in self.returns.values()):
-            if len(set(self.last_timestamps.values())) == 1:
-                # The data's been transposed to ensure it has shape:
-                # (self.config.slow_period, len(self.config.instrument_ids))
-                matrix_returns = np.vstack(list(self.returns.values()))
-
-                # In order to calculate the cumulative return I need to reverse the
-                # lastest returns (of length `fast_period`) before taking the geometric
-                # product.
-                # r = matrix_returns[:, 0]
-                r = (
-                    np.prod(
-                        1 + matrix_returns[:, : self.config.fast_period][:, ::-1],
-                        axis=1,
-                    )
-                    - 1
-                )
-
-                # The mean return is calculated over the whole matrix (of length
-                # `slow_period`).
-                # mu = np.mean(matrix_returns, axis=1)
-                mu = np.median(matrix_returns, axis=1)
-
-                # sigma = np.cov(matrix_returns)
-                sigma = LedoitWolf().fit(matrix_returns.T).covariance_
-
-                sigma_inv = np.linalg.inv(sigma)
-
-                # Where the result must be scaled down by the `fast_period`.
-                turbulence = (
-                    1 / (len(self.config.instrument_ids) * self.config.fast_period)
-                ) * distance.mahalanobis(r, mu, sigma_inv) ** 2
-
-                turbulence_data = TurbulenceData(
-                    ts_event=bar.ts_event,
-                    ts_init=bar.ts_init,
-                    turbulence=turbulence,
-                )
-
-                self.publish_data(
-                    DataType(
-                        TurbulenceData,
-                        metadata={
-                            # "instrument_ids": self.config.instrument_ids,
-                            "bar_spec": self.config.bar_spec,
-                            "fast_period": self.config.fast_period,
-                            "slow_period": self.config.slow_period,
-                        },
-                    ),
-                    turbulence_data,
-                )
+            close = bar.close.as_double()  # np.log(bar.close.as_double())
+
+            self.latest_returns[index] = (
+                close - self.last_closes[index]
+            ) / self.last_closes[index]
+
+            self.last_closes[index] = close
+
+        if not np.isnan(self.latest_returns).any():
+            self.returns.update(self.latest_returns)
+
+        if self.returns.initialized:
+            # The returns have shape:
+            # (self.config.slow_period, len(self.config.instrument_ids))
+            matrix_returns = self.returns.view()
+
+            # The cumulative return is the geometric product of the latest returns
+            # (of length `fast_period`).
+            # r = matrix_returns[-1]
+            r = np.prod(1 + matrix_returns[-self.config.fast_period :], axis=0) - 1
+
+            # The mean return is calculated over the whole matrix (of length
+            # `slow_period`).
+            # mu = np.mean(matrix_returns, axis=0)
+            mu = np.median(matrix_returns, axis=0)
+
+            # sigma = self.returns.covariance()
+            sigma, _ = self.returns.ledoit_wolf()
+
+            # Where the result must be scaled down by the `fast_period`.
+            turbulence = (
+                1 / (len(self.config.instrument_ids) * self.config.fast_period)
+            ) * mahalanobis_squared(r, mu, sigma)
+
+            turbulence_data = TurbulenceData(
+                ts_event=time_slice.ts_event,
+                ts_init=time_slice.ts_init,
+                turbulence=turbulence,
+            )
+
+            self.publish_data(self.turbulence_data_type, turbulence_data)
@@ -1,4 +1,6 @@
-from nautilus_trader.common.actor import Actor, ActorConfig
+import numpy as np
+import numpy.typing as npt
+from nautilus_trader.common.actor import Actor
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.core.data import Data
 from nautilus_trader.model import (
@@ -13,6 +15,7 @@ from nautilus_trader.model.custom import customdataclass
 from nautilus_trader.model.instruments import Instrument
 
 from jfdi.actors.equity import EquityData
+from jfdi.actors.publishing import PublishingActor, PublishingActorConfig
 
 
 @customdataclass
@@ -21,7 +24,7 @@ class WeightData(Data):
     weight: float = 0
 
 
-class WeightActorConfig(ActorConfig):
+class WeightActorConfig(PublishingActorConfig):
     instrument_id: InstrumentId
     # This has to be its own argument because `IB_VENUE` is not `instrument_id.venue`.
     account_venue: Venue
@@ -32,7 +35,7 @@ class WeightActorConfig(ActorConfig):
     component_id: ComponentId
 
 
-class WeightActor(Actor):
+class WeightActor(PublishingActor):
     def __init__(self, config: WeightActorConfig) -> None:
         """Publish the instrument's portfolio weight on account equity releases.
 
@@ -44,6 +47,21 @@ class WeightActor(Actor):
         self.weight_key = f"{self.config.instrument_id}-WEIGHT"
 
     def on_start(self) -> None:
+        self.equity_data_type = DataType(
+            EquityData,
+            metadata={
+                "venue": self.config.account_venue,
+                "currency_code": self.config.reporting_currency.code,
+            },
+        )
+        self.weight_data_type = DataType(
+            WeightData,
+            metadata={
+                "venue": self.config.account_venue,
+                "currency_code": self.config.reporting_currency.code,
+            },
+        )
+
         self.instrument = self.cache.instrument(self.config.instrument_id)
 
         if self.instrument is None:
@@ -53,26 +71,10 @@ class WeightActor(Actor):
             self.stop()
             return
 
-        self.subscribe_data(
-            DataType(
-                EquityData,
-                metadata={
-                    "venue": self.config.account_venue,
-                    "currency_code": self.config.reporting_currency,
-                },
-            )
-        )
+        self.subscribe_data(self.equity_data_type)
 
     def on_stop(self) -> None:
-        self.unsubscribe_data(
-            DataType(
-                EquityData,
-                metadata={
-                    "venue": self.config.account_venue,
-                    "currency_code": self.config.reporting_currency,
-                },
-            )
-        )
+        self.unsubscribe_data(self.equity_data_type)
 
     def on_data(self, data: Data) -> None:
         if isinstance(data, EquityData):
@@ -95,17 +97,107 @@ class WeightActor(Actor):
                 weight=weight,
             )
 
-            self.publish_data(
-                DataType(
-                    WeightData,
-                    metadata={
-                        "venue": self.config.account_venue,
-                        "currency_code": self.config.reporting_currency.code,
-                    },
-                ),
-                weight_data,
+            self.publish_data(self.weight_data_type, weight_data)
+
+
+# Class variables can only be basic data types or instrument ids, so I'll create the
+# portfolio weights data class during the backtest, as with the rank data class.
+# @customdataclass
+# class PortfolioWeightsData(Data):
+#     instrument_ids: np.ndarray = field(
+#         default_factory=lambda: np.full(len(instruments), "", str)
+#     )
+#     weights: np.ndarray = field(
+#         default_factory=lambda: np.full(len(instruments), 0.0, float),
+#     )
+
+
+class PortfolioWeightsActorConfig(PublishingActorConfig):
+    instrument_ids: list[InstrumentId]
+    account_venue: Venue
+    exchange_rate_venue: Venue
+    reporting_currency: Currency
+    data_class: Data
+    dtype_instrument_id: str
+    component_id: ComponentId
+
+
+class PortfolioWeightsActor(PublishingActor):
+    def __init__(self, config: PortfolioWeightsActorConfig) -> None:
+        """Publish the portfolio weights of a series of instruments on equity releases.
+
+        This does the work of a `WeightActor` for each instrument in one pass, looking
+        up each cost currency's exchange rate once, and publishes the weights together
+        (in the order of `instrument_ids`) instead of one record per instrument.
+        """
+        super().__init__(config)
+
+        self.weights_key = f"{self.config.component_id}_WEIGHTS"
+
+        self.instrument_id_array = np.array(
+            [str(instrument_id) for instrument_id in self.config.instrument_ids],
+            dtype=np.dtype(self.config.dtype_instrument_id),
+        )
+
+    def on_start(self) -> None:
+        self.equity_data_type = DataType(
+            EquityData,
+            metadata={
+                "venue": self.config.account_venue,
+                "currency_code": self.config.reporting_currency.code,
+            },
+        )
+        self.weights_data_type = DataType(
+            self.config.data_class,
+            metadata={
+                "venue": self.config.account_venue,
+                "currency_code": self.config.reporting_currency.code,
+                "dtype_instrument_id": self.config.dtype_instrument_id,
+            },
+        )
+
+        self.instruments = []
+
+        for instrument_id in self.config.instrument_ids:
+            instrument = self.cache.instrument(instrument_id)
+
+            if instrument is None:
+                self.log.error(
+                    f"Could not find instrument. instrument_id: {instrument_id}"
+                )
+                self.stop()
+                return
+
+            self.instruments.append(instrument)
+
+        self.subscribe_data(self.equity_data_type)
+
+    def on_stop(self) -> None:
+        self.unsubscribe_data(self.equity_data_type)
+
+    def on_data(self, data: Data) -> None:
+        if isinstance(data, EquityData):
+            weights = get_weights(
+                self,
+                self.instruments,
+                data.equity,
+                self.config.exchange_rate_venue,
+                self.config.reporting_currency,
             )
 
+            if weights is None:
+                self.log.warning("NO EXCHANGE RATES AVAILABLE.", LogColor.CYAN)
+                return
+
+            weights_data = self.config.data_class(
+                ts_event=data.ts_event,
+                ts_init=data.ts_init,
+                instrument_ids=self.instrument_id_array,
+                weights=weights,
+            )
+
+            self.publish_data(self.weights_data_type, weights_data)
+
 
 def get_weight(
     actor: Actor,
@@ -132,3 +224,49 @@ def get_weight(
         / account_equity
     )
     return weight
+
+
+def get_weights(
+    actor: Actor,
+    instruments: list[Instrument],
+    account_equity: Money,
+    exchange_rate_venue: Venue,
+    reporting_currency: Currency,
+) -> npt.NDArray[np.float64] | None:
+    """Calculate the instruments' weights in the reporting currency in one pass.
+
+    The weights are those that `get_weight` calculates, but each cost currency's
+    exchange rate is only looked up once, and flat instruments are skipped.
+    """
+    exchange_rates = {}
+    weights = np.zeros(len(instruments))
+
+    for i, instrument in enumerate(instruments):
+        if actor.portfolio.is_flat(instrument.id):
+            continue
+
+        currency = instrument.get_cost_currency()
+        exchange_rate = exchange_rates.get(currency)
+
+        if exchange_rate is None:
+            exchange_rate = actor.cache.get_xrate(
+                venue=exchange_rate_venue,
+                from_currency=currency,
+                to_currency=reporting_currency,
+            )
+
+            if exchange_rate is None:
+                return None
+
+            exchange_rates[currency] = exchange_rate
+
+        weights[i] = (
+            # If the portfolio is short multiply the allocation by -1.
+            (actor.portfolio.is_net_long(instrument.id) * 2 - 1)
+            * actor.portfolio.net_exposure(instrument.id).as_double()
+            * exchange_rate
+        )
+
+    weights /= float(account_equity)
+
+    return weights
@@ -0,0 +1,269 @@
+from collections import defaultdict
+from collections.abc import Iterator
+from functools import cache
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from nautilus_trader.backtest.engine import BacktestEngine
+from nautilus_trader.model import Bar, BarType
+from nautilus_trader.model import instruments as nautilus_instruments
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+from nautilus_trader.serialization.arrow.serializer import ArrowSerializer
+
+# Prices and sizes are doubles, so that `Bar.from_raw_arrays_to_list` can build bars
+# straight from the columns, and each file's bar type and precisions are kept in its
+# schema metadata (under the same keys as NT's own bar schema).
+bar_schema = pa.schema(
+    [
+        ("open", pa.float64()),
+        ("high", pa.float64()),
+        ("low", pa.float64()),
+        ("close", pa.float64()),
+        ("volume", pa.float64()),
+        ("ts_event", pa.uint64()),
+        ("ts_init", pa.uint64()),
+    ]
+)
+
+
+def bars_to_table(bars: list[Bar]) -> pa.Table:
+    """Convert bars of a single bar type to a table of `bar_schema`, sorted by ts_init.
+
+    Raises:
+        ValueError: If there are no bars, or they're of more than one bar type.
+    """
+    if not bars:
+        raise ValueError("Invalid bars. There must be at least one bar.")
+
+    bar_type = bars[0].bar_type
+
+    if any(bar.bar_type != bar_type for bar in bars):
+        raise ValueError(f"Invalid bars. They must all be of one bar type: {bar_type}")
+
+    table = pa.table(
+        [
+            pa.array([bar.open.as_double() for bar in bars], pa.float64()),
+            pa.array([bar.high.as_double() for bar in bars], pa.float64()),
+            pa.array([bar.low.as_double() for bar in bars], pa.float64()),
+            pa.array([bar.close.as_double() for bar in bars], pa.float64()),
+            pa.array([bar.volume.as_double() for bar in bars], pa.float64()),
+            pa.array([bar.ts_event for bar in bars], pa.uint64()),
+            pa.array([bar.ts_init for bar in bars], pa.uint64()),
+        ],
+        schema=bar_schema.with_metadata(
+            {
+                "bar_type": str(bar_type),
+                "price_precision": str(bars[0].open.precision),
+                "size_precision": str(bars[0].volume.precision),
+            }
+        ),
+    )
+
+    return table.sort_by("ts_init")
+
+
+def write_arrow_ipc_file(filepath: Path, table: pa.Table) -> None:
+    """Write a table to an uncompressed Arrow IPC file, as a single record batch.
+
+    Uncompressed buffers can be memory-mapped and used in place, which compressed
+    buffers (and Parquet pages) can't.
+    """
+    filepath.parent.mkdir(parents=True, exist_ok=True)
+
+    with (
+        pa.OSFile(str(filepath), "wb") as sink,
+        pa.ipc.new_file(sink, table.schema) as writer,
+    ):
+        writer.write_table(table.combine_chunks(), max_chunksize=table.num_rows)
+
+
+def read_arrow_ipc_file(filepath: Path) -> pa.Table:
+    """Memory-map an Arrow IPC file, without copying its buffers."""
+    source = pa.memory_map(str(filepath), "r")
+
+    return pa.ipc.open_file(source).read_all()
+
+
+def materialise_market_data(
+    catalog: ParquetDataCatalog,
+    bar_types: list[BarType],
+    directory: Path,
+    start: pd.Timestamp | None = None,
+    end: pd.Timestamp | None = None,
+) -> None:
+    """Write the bars and instruments of a backtest to Arrow IPC files, once.
+
+    The files are meant to be memory-mapped by every process of a sweep (with
+    `MarketData`), so that the processes share one copy of the bars in the page
+    cache. A directory in /dev/shm keeps them in memory rather than on disk.
+
+    Typical usage example:
+    >>> materialise_market_data(get_catalog(), bar_types, Path("/dev/shm/sweep"))
+    """
+    instrument_ids = list(
+        dict.fromkeys(str(bar_type.instrument_id) for bar_type in bar_types)
+    )
+
+    instruments_by_class: defaultdict[type, list[Instrument]] = defaultdict(list)
+
+    for instrument in catalog.instruments(instrument_ids=instrument_ids):
+        instruments_by_class[type(instrument)].append(instrument)
+
+    for instrument_class, instruments in instruments_by_class.items():
+        write_arrow_ipc_file(
+            directory / "instruments" / f"{instrument_class.__name__}.arrow",
+            ArrowSerializer.serialize_batch(instruments, instrument_class),
+        )
+
+    for bar_type in bar_types:
+        bars = catalog.bars(bar_types=[str(bar_type)], start=start, end=end)
+
+        if bars:
+            # The file's name is only for people. The bar type is in its metadata.
+            filename = str(bar_type).replace("/", "_")
+            write_arrow_ipc_file(
+                directory / "bars" / f"{filename}.arrow", bars_to_table(bars)
+            )
+
+
+class BarTable:
+    __slots__ = ("bar_type", "price_precision", "size_precision", "table", "ts_init")
+
+    def __init__(self, table: pa.Table):
+        """A (memory-mapped) table of `bar_schema` that builds bars on demand."""
+        metadata = table.schema.metadata
+
+        self.table = table
+        self.bar_type = BarType.from_str(metadata[b"bar_type"].decode())
+        self.price_precision = int(metadata[b"price_precision"])
+        self.size_precision = int(metadata[b"size_precision"])
+
+        # A view of the mapped column.
+        self.ts_init = table["ts_init"].chunk(0).to_numpy()
+
+    def __len__(self) -> int:
+        return self.table.num_rows
+
+    def to_bars(self, start: int, stop: int) -> list[Bar]:
+        """Build the bars of the rows from start up to (but excluding) stop."""
+        table = self.table.slice(start, stop - start)
+
+        # NT only builds bars from writable arrays, so the slice's columns are
+        # copied, which is at most a chunk at a time.
+        columns = [
+            np.require(table[name].to_numpy(), requirements="W")
+            for name in bar_schema.names
+        ]
+
+        return Bar.from_raw_arrays_to_list(
+            self.bar_type, self.price_precision, self.size_precision, *columns
+        )
+
+
+class MarketData:
+    __slots__ = ("bar_tables", "instruments")
+
+    def __init__(self, directory: Path):
+        """The bars and instruments written by `materialise_market_data`.
+
+        The bar files are memory-mapped rather than read, so every process that
+        attaches to the same directory shares the same pages, and bars are only
+        built a chunk at a time, as the backtest reaches them.
+
+        Args:
+            directory: The directory that the market data was written to.
+        """
+        self.instruments: list[Instrument] = []
+
+        for filepath in sorted((directory / "instruments").glob("*.arrow")):
+            instrument_class = getattr(nautilus_instruments, filepath.stem, None)
+
+            if instrument_class is None:
+                raise ValueError(
+                    f"Invalid instrument class. Choose one of: "
+                    f"{nautilus_instruments.__all__}"
+                )
+
+            self.instruments.extend(
+                ArrowSerializer.deserialize(
+                    instrument_class, read_arrow_ipc_file(filepath)
+                )
+            )
+
+        self.bar_tables = [
+            BarTable(read_arrow_ipc_file(filepath))
+            for filepath in sorted((directory / "bars").glob("*.arrow"))
+        ]
+
+    def chunks(self, chunk_size: int) -> Iterator[list[Bar]]:
+        """Yield the bars of every bar type, a time window at a time.
+
+        Each window holds about chunk_size bars, but bars with the same ts_init are
+        never split across windows. The bars within a window aren't sorted.
+        """
+        ts_init = np.concatenate([bar_table.ts_init for bar_table in self.bar_tables])
+        ts_init.sort()
+
+        # The first ts_init of each window after the first.
+        boundaries = np.unique(ts_init[chunk_size::chunk_size])
+
+        positions = [
+            np.concatenate(
+                ([0], np.searchsorted(bar_table.ts_init, boundaries), [len(bar_table)])
+            )
+            for bar_table in self.bar_tables
+        ]
+
+        for window in range(len(boundaries) + 1):
+            bars = []
+
+            for bar_table, table_positions in zip(
+                self.bar_tables, positions, strict=True
+            ):
+                start, stop = table_positions[window], table_positions[window + 1]
+
+                if stop > start:
+                    bars.extend(bar_table.to_bars(start, stop))
+
+            yield bars
+
+
+@cache
+def attach_market_data(directory: str) -> MarketData:
+    """Return the market data in a directory, which is attached once per process."""
+    return MarketData(Path(directory))
+
+
+def add_instruments(engine: BacktestEngine, market_data: MarketData) -> None:
+    """Add the market data's instruments that the engine doesn't have yet."""
+    for instrument in market_data.instruments:
+        if engine.cache.instrument(instrument.id) is None:
+            engine.add_instrument(instrument)
+
+
+def run_streaming(
+    engine: BacktestEngine,
+    market_data: MarketData,
+    chunk_size: int = 100_000,
+) -> None:
+    """Run a backtest over market data in chunks, then end it.
+
+    Only one chunk of bars exists at a time, so the memory a run needs is bounded by
+    the chunk size rather than the length of the backtest.
+
+    Args:
+        engine: The engine, with its venues, instruments, actors and strategies.
+        market_data: The bars to run over.
+        chunk_size: The number of bars to add to the engine at a time.
+    """
+    for index, bars in enumerate(market_data.chunks(chunk_size)):
+        if index > 0:
+            engine.clear_data()
+
+        engine.add_data(bars)
+        engine.run(streaming=True)
+
+    engine.end()
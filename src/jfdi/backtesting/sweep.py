@@ -0,0 +1,304 @@
+import itertools
+import math
+import multiprocessing
+import os
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.config import NautilusConfig, resolve_path
+from nautilus_trader.core.data import Data
+from nautilus_trader.core.message import Event
+from nautilus_trader.model import Currency, Venue
+from nautilus_trader.model.events import OrderFilled
+from nautilus_trader.persistence.catalog import ParquetDataCatalog
+
+from jfdi.actors.equity import EquityData
+from jfdi.backtesting.market_data import (
+    add_instruments,
+    attach_market_data,
+    run_streaming,
+)
+from shared.data.drawdowns import get_drawdowns
+from shared.data.returns import get_returns
+
+summary_schema = pa.schema(
+    [
+        ("error", pa.string()),
+        # Equity, from the `EquityData` that an `EquityActor` publishes.
+        ("start_equity", pa.float64()),
+        ("end_equity", pa.float64()),
+        ("total_return", pa.float64()),
+        ("max_drawdown", pa.float64()),
+        # Weights, from the data that a `PortfolioWeightsActor` publishes.
+        ("mean_gross_weight", pa.float64()),
+        ("max_gross_weight", pa.float64()),
+        ("mean_turnover", pa.float64()),
+        # Fills, in the reporting currency.
+        ("fills", pa.int64()),
+        ("traded_notional", pa.float64()),
+        ("commissions", pa.float64()),
+    ]
+)
+
+
+class ParameterSweepConfig(NautilusConfig, kw_only=True, frozen=True):
+    # The fully qualified name of a function that takes a `BacktestEngine` and a grid
+    # point's parameters (as keyword arguments) and adds the venues, instruments,
+    # data, actors and strategies of the backtest, e.g.
+    # "my_package.sweeps:setup_buy_top_ranks". The instruments and data can be left
+    # to `market_data_path`.
+    setup_path: str
+    # The values of each parameter, e.g. {"top": [3, 5], "threshold": [0.02, 0.05]}.
+    grid: dict[str, list]
+    exchange_rate_venue: Venue
+    reporting_currency: Currency
+    # The topic pattern that portfolio weights data is published to.
+    weights_topic: str = "data.PortfolioWeightsData*"
+    engine: BacktestEngineConfig | None = None
+    max_workers: int | None = None
+    # The directory of market data written by `materialise_market_data`, which every
+    # worker memory-maps and streams to its engines chunk_size bars at a time.
+    market_data_path: str | None = None
+    chunk_size: int = 100_000
+
+
+def expand_grid(grid: dict[str, Sequence]) -> list[dict[str, Any]]:
+    """Return every combination of a grid's parameter values.
+
+    Typical usage example:
+    >>> expand_grid({"top": [3, 5], "indicator_class": ["ROC_10", "ROC_20"]})
+    [{'top': 3, 'indicator_class': 'ROC_10'}, {'top': 3, 'indicator_class': 'ROC_20'},
+    {'top': 5, 'indicator_class': 'ROC_10'}, {'top': 5, 'indicator_class': 'ROC_20'}]
+    """
+    return [
+        dict(zip(grid, values, strict=True))
+        for values in itertools.product(*grid.values())
+    ]
+
+
+@cache
+def get_catalog() -> ParquetDataCatalog:
+    """Return the `CATALOG_PATH` catalog, which is opened once per process.
+
+    The catalog is only ever read, so every worker of a sweep opens the same files,
+    and the operating system shares their pages between the workers.
+    """
+    return ParquetDataCatalog(os.environ["CATALOG_PATH"])
+
+
+class RunSummary:
+    __slots__ = (
+        "_last_weights",
+        "_xrates",
+        "cache",
+        "commissions",
+        "equities",
+        "exchange_rate_venue",
+        "fills",
+        "gross_weights",
+        "reporting_currency",
+        "traded_notional",
+        "turnovers",
+    )
+
+    def __init__(
+        self,
+        cache: Cache,
+        exchange_rate_venue: Venue,
+        reporting_currency: Currency,
+    ):
+        """The equity, weights and fills of a backtest, collected from the message bus.
+
+        Args:
+            cache: The engine's cache, for instruments and exchange rates.
+            exchange_rate_venue: The venue whose quotes convert fills.
+            reporting_currency: The currency to report fills in.
+        """
+        self.cache = cache
+        self.exchange_rate_venue = exchange_rate_venue
+        self.reporting_currency = reporting_currency
+
+        self.equities: list[float] = []
+        self.gross_weights: list[float] = []
+        self.turnovers: list[float] = []
+        self.fills = 0
+        self.traded_notional = 0.0
+        self.commissions = 0.0
+
+        self._last_weights: np.ndarray | None = None
+        self._xrates: dict[Currency, float] = {}
+
+    def on_equity(self, data: Data) -> None:
+        if isinstance(data, EquityData):
+            self.equities.append(data.equity)
+
+    def on_weights(self, data: Data) -> None:
+        weights = np.asarray(data.weights, dtype=np.float64)
+
+        self.gross_weights.append(float(np.abs(weights).sum()))
+
+        if self._last_weights is not None and self._last_weights.shape == weights.shape:
+            self.turnovers.append(float(np.abs(weights - self._last_weights).sum()))
+
+        self._last_weights = weights
+
+    def on_order_event(self, event: Event) -> None:
+        if not isinstance(event, OrderFilled):
+            return
+
+        self.fills += 1
+
+        instrument = self.cache.instrument(event.instrument_id)
+        notional = instrument.notional_value(event.last_qty, event.last_px)
+
+        self.traded_notional += notional.as_double() * self._xrate(notional.currency)
+        self.commissions += event.commission.as_double() * self._xrate(
+            event.commission.currency
+        )
+
+    def _xrate(self, currency: Currency) -> float:
+        # Fills are converted at the rate of the first fill in each currency, which
+        # is close enough for comparing runs.
+        xrate = self._xrates.get(currency)
+
+        if xrate is None:
+            if currency == self.reporting_currency:
+                xrate = 1.0
+            else:
+                xrate = self.cache.get_xrate(
+                    self.exchange_rate_venue, currency, self.reporting_currency
+                )
+                xrate = math.nan if xrate is None else xrate
+
+            self._xrates[currency] = xrate
+
+        return xrate
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return the summary as a row of `summary_schema`."""
+        row = dict.fromkeys(summary_schema.names, math.nan)
+        row["error"] = None
+        row["fills"] = self.fills
+        row["traded_notional"] = self.traded_notional
+        row["commissions"] = self.commissions
+
+        if self.equities:
+            equities = np.asarray(self.equities)
+
+            row["start_equity"] = equities[0]
+            row["end_equity"] = equities[-1]
+            row["total_return"] = equities[-1] / equities[0] - 1
+            row["max_drawdown"] = get_drawdowns(get_returns(pd.Series(equities))).min()
+
+        if self.gross_weights:
+            row["mean_gross_weight"] = np.mean(self.gross_weights)
+            row["max_gross_weight"] = np.max(self.gross_weights)
+
+        if self.turnovers:
+            row["mean_turnover"] = np.mean(self.turnovers)
+
+        return row
+
+
+def run_backtest(config: ParameterSweepConfig, parameters: dict[str, Any]) -> dict:
+    """Run one grid point's backtest and summarise it.
+
+    An exception is recorded in the summary's "error" column, rather than raised, so
+    that one bad grid point doesn't lose the rest of the sweep.
+    """
+    engine = BacktestEngine(config=config.engine)
+
+    try:
+        setup = resolve_path(config.setup_path)
+        setup(engine, **parameters)
+
+        if config.market_data_path is not None:
+            market_data = attach_market_data(config.market_data_path)
+            add_instruments(engine, market_data)
+
+        summary = RunSummary(
+            engine.cache, config.exchange_rate_venue, config.reporting_currency
+        )
+
+        msgbus = engine.kernel.msgbus
+        msgbus.subscribe(topic="data.EquityData*", handler=summary.on_equity)
+        msgbus.subscribe(topic=config.weights_topic, handler=summary.on_weights)
+        msgbus.subscribe(topic="events.order.*", handler=summary.on_order_event)
+
+        if config.market_data_path is None:
+            engine.run()
+        else:
+            run_streaming(engine, market_data, config.chunk_size)
+
+        return summary.to_dict()
+
+    except Exception as e:
+        row = dict.fromkeys(summary_schema.names, math.nan)
+        row["error"] = repr(e)
+        row["fills"] = None
+
+        return row
+
+    finally:
+        engine.dispose()
+
+
+def run_sweep(config: ParameterSweepConfig) -> pa.Table:
+    """Run a backtest for every point of a parameter grid, in parallel.
+
+    Each backtest runs in a worker process, with its own engine, so the runs share
+    nothing but the (read-only) catalog and market data. The table has a column for
+    each parameter, followed by the columns of `summary_schema`, and a row for each
+    grid point.
+
+    Typical usage example:
+    >>> config = ParameterSweepConfig(
+    ...     setup_path="my_package.sweeps:setup_buy_top_ranks",
+    ...     grid={"top": [3, 5], "threshold": [0.02, 0.05]},
+    ...     exchange_rate_venue=Venue("IDEALPRO"),
+    ...     reporting_currency=Currency.from_str("USD"),
+    ...     market_data_path="/dev/shm/sweep",
+    ... )
+    >>> materialise_market_data(get_catalog(), bar_types, Path(config.market_data_path))
+    >>> table = run_sweep(config)
+    """
+    grid_points = expand_grid(config.grid)
+
+    # Workers are spawned rather than forked, because NT's engines start threads,
+    # and a forked child only gets a copy of the thread that forked it.
+    with ProcessPoolExecutor(
+        max_workers=config.max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as executor:
+        rows = list(
+            executor.map(
+                run_backtest, itertools.repeat(config), grid_points, chunksize=1
+            )
+        )
+
+    columns = {
+        name: pa.array([_to_arrow_value(point[name]) for point in grid_points])
+        for name in config.grid
+    }
+
+    summaries = pa.Table.from_pylist(rows, schema=summary_schema)
+
+    for name in summaries.column_names:
+        columns[name] = summaries[name]
+
+    return pa.table(columns)
+
+
+def _to_arrow_value(value: Any) -> Any:
+    # Identifiers, bar specifications and the like are stored as strings.
+    if value is None or isinstance(value, bool | int | float | str):
+        return value
+
+    return str(value)
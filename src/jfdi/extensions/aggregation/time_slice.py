@@ -0,0 +1,181 @@
+from collections.abc import Callable, Hashable, Sequence
+from dataclasses import dataclass, field
+from enum import Enum, unique
+from typing import Any
+
+import pandas as pd
+from nautilus_trader.common.component import Clock
+from nautilus_trader.common.events import TimeEvent
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.core.data import Data
+
+
+@unique
+class IncompleteSlicePolicy(Enum):
+    """What to do with a time slice that's missing some keys."""
+
+    # Discard it.
+    DROP = 1
+    # Emit it with only the data that arrived.
+    EMIT = 2
+    # Emit it with each missing key's most recent data (if it has any).
+    FORWARD_FILL = 3
+
+
+@dataclass(frozen=True)
+class TimeSlice:
+    ts_event: int
+    # The `ts_init` of the data that completed (or most recently joined) the slice.
+    ts_init: int
+    data: dict[Hashable, Any]
+    missing: tuple[Hashable, ...] = field(default=())
+
+    @property
+    def complete(self) -> bool:
+        return not self.missing
+
+
+class TimeSliceAggregator:
+    def __init__(
+        self,
+        keys: Sequence[Hashable],
+        callback: Callable[[TimeSlice], None],
+        policy: IncompleteSlicePolicy = IncompleteSlicePolicy.DROP,
+        clock: Clock | None = None,
+        timeout: pd.Timedelta | None = None,
+        name: str = "TIME-SLICE",
+    ) -> None:
+        """Group data with the same `ts_event` into one cross-section per timestamp.
+
+        Data is expected to arrive once per key (e.g. instrument) and timestamp. A slice
+        is completed, and the callback is called once with it, when every key's data
+        has arrived. Arrivals are counted, so each update is O(1) however many keys
+        there are.
+
+        A slice is incomplete if data for a later timestamp arrives first, or if the
+        timeout (measured on the clock from the slice's first arrival) expires first.
+        Incomplete slices are then handled by the policy. Data for an earlier
+        timestamp than the open slice, or for a slice that's already been closed, is
+        late, and is counted and discarded.
+
+        Args:
+            keys: The keys that make up a complete slice.
+            callback: Called with each slice that's completed or emitted.
+            policy: What to do with incomplete slices.
+            clock: The clock to set timeout alerts on (required with `timeout`).
+            timeout: How long to wait for the rest of a slice after its first arrival.
+            name: The name of the timeout alert, which must be unique for the clock.
+
+        Raises:
+            ValueError: If `keys` is empty, or if `timeout` is given without a clock.
+        """
+        PyCondition.not_empty(keys, "keys")
+        if timeout is not None:
+            PyCondition.not_none(clock, "clock")
+
+        self.keys = tuple(keys)
+        self.callback = callback
+        self.policy = policy
+        self.clock = clock
+        self.timeout = timeout
+        self.timer_name = f"{name}-TIMEOUT"
+
+        self._indices = {key: index for index, key in enumerate(self.keys)}
+        self._latest: list[Any] = [None] * len(self.keys)
+        self._arrived = [False] * len(self.keys)
+        self._count = 0
+        self._ts_event: int | None = None
+        self._closed_ts_event = -1
+        self._ts_init = 0
+        self._data: dict[Hashable, Any] = {}
+
+        self.n_completed = 0
+        self.n_incomplete = 0
+        self.n_late = 0
+
+    def update(self, key: Hashable, data: Data) -> None:
+        """Add a key's data to the slice for its `ts_event`."""
+        index = self._indices[key]
+
+        if data.ts_event <= self._closed_ts_event or (
+            self._ts_event is not None and data.ts_event < self._ts_event
+        ):
+            self.n_late += 1
+            return
+
+        if self._ts_event is None or data.ts_event > self._ts_event:
+            if self._ts_event is not None:
+                self._close_incomplete()
+            self._open(data.ts_event)
+
+        self._latest[index] = data
+
+        # Revisions replace the data, but don't count as another arrival.
+        if not self._arrived[index]:
+            self._arrived[index] = True
+            self._count += 1
+
+        self._data[key] = data
+        self._ts_init = data.ts_init
+
+        if self._count == len(self.keys):
+            self.n_completed += 1
+            self._emit(missing=())
+
+    def _open(self, ts_event: int) -> None:
+        self._ts_event = ts_event
+        self._arrived = [False] * len(self.keys)
+        self._count = 0
+        self._data = {}
+
+        if self.timeout is not None:
+            self.clock.set_time_alert(
+                name=self.timer_name,
+                alert_time=self.clock.utc_now() + self.timeout,
+                callback=self._on_timeout,
+                override=True,
+            )
+
+    def _on_timeout(self, event: TimeEvent) -> None:
+        if self._ts_event is not None:
+            self._close_incomplete()
+
+    def _close_incomplete(self) -> None:
+        self.n_incomplete += 1
+
+        missing = tuple(
+            key
+            for key, arrived in zip(self.keys, self._arrived, strict=True)
+            if not arrived
+        )
+
+        if self.policy == IncompleteSlicePolicy.FORWARD_FILL:
+            for key in missing:
+                latest = self._latest[self._indices[key]]
+                if latest is not None:
+                    self._data[key] = latest
+
+        if self.policy == IncompleteSlicePolicy.DROP:
+            self._close()
+        else:
+            self._emit(missing=missing)
+
+    def _emit(self, missing: tuple[Hashable, ...]) -> None:
+        time_slice = TimeSlice(
+            ts_event=self._ts_event,
+            ts_init=self._ts_init,
+            data=self._data,
+            missing=missing,
+        )
+
+        # Only one slice is ever open, and it closes once it's been emitted.
+        self._close()
+
+        self.callback(time_slice)
+
+    def _close(self) -> None:
+        self._closed_ts_event = self._ts_event
+        self._ts_event = None
+
+        if self.clock is not None and self.timer_name in self.clock.timer_names:
+            self.clock.cancel_timer(self.timer_name)
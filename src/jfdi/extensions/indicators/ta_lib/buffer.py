@@ -0,0 +1,258 @@
+from collections import deque
+from collections.abc import Sequence
+
+import numpy as np
+from nautilus_trader.core.correctness import PyCondition
+
+
+class RingBuffer:
+    """A preallocated, column-oriented circular buffer.
+
+    Every column is a single contiguous array that's twice the buffer's capacity, and
+    each value is written to both halves. That way the latest `capacity` values are
+    always a contiguous slice, which can be handed to TA-Lib without concatenating or
+    copying anything.
+
+    Args:
+        dtypes: The name and data type of each column.
+        capacity: The number of rows to keep (greater than zero).
+
+    Raises:
+        ValueError: If `capacity` is not a positive integer.
+    """
+
+    def __init__(self, dtypes: Sequence[tuple[str, str]], capacity: int) -> None:
+        PyCondition.positive_int(capacity, "capacity")
+
+        self.capacity = capacity
+        self.names = tuple(name for name, _ in dtypes)
+
+        self._columns = {
+            name: np.zeros(2 * capacity, dtype=dtype) for name, dtype in dtypes
+        }
+        # Iterating over a tuple is quicker than looking up each column by name.
+        self._arrays = tuple(self._columns.values())
+
+        self.count = 0
+        self._head = -1
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, values: Sequence) -> None:
+        """Append a row, overwriting the oldest one if the buffer's full.
+
+        Args:
+            values: One value per column, in the order of `names`.
+        """
+        self._head = (self._head + 1) % self.capacity
+        self.count += 1
+
+        self._write(values)
+
+    def replace(self, values: Sequence) -> None:
+        """Overwrite the latest row.
+
+        Args:
+            values: One value per column, in the order of `names`.
+
+        Raises:
+            ValueError: If the buffer is empty.
+        """
+        PyCondition.positive_int(self.count, "count")
+
+        self._write(values)
+
+    def extend(self, columns: Sequence[np.ndarray]) -> None:
+        """Append many rows at once, as if each had been appended in turn.
+
+        Only the rows that'd still be buffered are written.
+
+        Args:
+            columns: One array per column, in the order of `names`, oldest first.
+        """
+        n = len(columns[0])
+        if n == 0:
+            return
+
+        k = min(n, self.capacity)
+        positions = (self._head + 1 + np.arange(n - k, n)) % self.capacity
+
+        for array, column in zip(self._arrays, columns, strict=True):
+            array[positions] = column[n - k :]
+            array[positions + self.capacity] = column[n - k :]
+
+        self._head = (self._head + n) % self.capacity
+        self.count += n
+
+    def _write(self, values: Sequence) -> None:
+        i = self._head
+        j = i + self.capacity
+
+        for array, value in zip(self._arrays, values, strict=True):
+            array[i] = value
+            array[j] = value
+
+    def last(self, name: str):
+        """Return the latest value of a column."""
+        return self._columns[name][self._head]
+
+    def view(self, name: str) -> np.ndarray:
+        """Return the buffered values of a column (oldest first) without copying.
+
+        The view is only valid until the next write, after which it will show the
+        updated contents of the buffer.
+        """
+        end = self._head + 1 + self.capacity
+
+        return self._columns[name][end - len(self) : end]
+
+    def views(self) -> dict[str, np.ndarray]:
+        """Return a view of every column (oldest first), keyed by name."""
+        return {name: self.view(name) for name in self.names}
+
+    def clear(self) -> None:
+        """Forget every row without releasing the preallocated memory."""
+        self.count = 0
+        self._head = -1
+
+
+class ChunkedArray:
+    """A growable structured array that's stored in fixed-size, preallocated chunks.
+
+    Rows are written in place, so appending doesn't allocate unless a chunk fills up.
+    When a new chunk is started the last `window - 1` rows are copied to its start,
+    which keeps the latest `window` rows contiguous and lets `tail` return a view
+    instead of a copy. Exporting every row concatenates one slice per chunk rather than
+    one array per row.
+
+    Args:
+        dtype: The structured data type of each row.
+        window: The maximum number of rows that `tail` can return (greater than zero).
+        max_rows: The number of rows to retain, or `None` to retain every row. Chunks
+            that only hold older rows are released.
+        chunk_size: The number of rows in each chunk. It's raised to twice the window
+            if it's smaller than that.
+
+    Raises:
+        ValueError: If `window`, `max_rows` or `chunk_size` is not a positive integer.
+    """
+
+    def __init__(
+        self,
+        dtype: np.dtype | Sequence,
+        window: int,
+        max_rows: int | None = None,
+        chunk_size: int = 4096,
+    ) -> None:
+        PyCondition.positive_int(window, "window")
+        PyCondition.positive_int(chunk_size, "chunk_size")
+        if max_rows is not None:
+            PyCondition.positive_int(max_rows, "max_rows")
+
+        self.dtype = np.dtype(dtype)
+        self.window = window
+        self.max_rows = max_rows
+        self.chunk_size = max(chunk_size, 2 * window)
+
+        # Each chunk is stored with the number of rows copied from the previous one.
+        self._chunks: deque[tuple[np.ndarray, int]] = deque()
+        self._size = 0
+
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count if self.max_rows is None else min(self.count, self.max_rows)
+
+    def append(self) -> np.void:
+        """Append a zeroed row and return it, so that its fields can be set in place."""
+        if not self._chunks or self._size == self.chunk_size:
+            self._add_chunk()
+
+        chunk = self._chunks[-1][0]
+        chunk[self._size] = 0
+        self._size += 1
+        self.count += 1
+
+        return chunk[self._size - 1]
+
+    def extend(self, rows: np.ndarray) -> None:
+        """Append many rows at once, copying them into the chunks in slices.
+
+        Args:
+            rows: A structured array with the same data type as this one.
+        """
+        start = 0
+        while start < len(rows):
+            if not self._chunks or self._size == self.chunk_size:
+                self._add_chunk()
+
+            stop = min(len(rows), start + self.chunk_size - self._size)
+            chunk = self._chunks[-1][0]
+            chunk[self._size : self._size + stop - start] = rows[start:stop]
+            self._size += stop - start
+            self.count += stop - start
+            start = stop
+
+    def last(self) -> np.void:
+        """Return the latest row, so that its fields can be overwritten in place.
+
+        Raises:
+            ValueError: If the array is empty.
+        """
+        PyCondition.positive_int(self.count, "count")
+
+        return self._chunks[-1][0][self._size - 1]
+
+    def _add_chunk(self) -> None:
+        chunk = np.zeros(self.chunk_size, dtype=self.dtype)
+        overlap = 0
+
+        if self._chunks:
+            overlap = min(self.window - 1, self._size)
+            chunk[:overlap] = self._chunks[-1][0][self._size - overlap : self._size]
+
+        self._chunks.append((chunk, overlap))
+        self._size = overlap
+
+        if self.max_rows is not None:
+            # The current chunk is empty, so the retained rows are all in older ones.
+            retained = sum(len(c) - o for c, o in list(self._chunks)[1:-1])
+            while len(self._chunks) > 1 and retained >= self.max_rows:
+                self._chunks.popleft()
+                retained -= self.chunk_size - self._chunks[0][1]
+
+    def tail(self, n: int) -> np.ndarray:
+        """Return the latest `n` rows (up to `window`) as a view.
+
+        Raises:
+            ValueError: If `n` is not positive or is greater than `window`.
+        """
+        PyCondition.positive_int(n, "n")
+        PyCondition.is_true(n <= self.window, f"n={n} must be <= window={self.window}")
+
+        if not self._chunks:
+            return np.zeros(0, dtype=self.dtype)
+
+        n = min(n, len(self))
+
+        return self._chunks[-1][0][self._size - n : self._size]
+
+    def to_array(self) -> np.ndarray:
+        """Return every retained row (oldest first) as a new array."""
+        if not self._chunks:
+            return np.zeros(0, dtype=self.dtype)
+
+        chunks = list(self._chunks)
+        pieces = [chunk[overlap:] for chunk, overlap in chunks[:-1]]
+        pieces.append(chunks[-1][0][chunks[-1][1] : self._size])
+
+        array = np.concatenate(pieces)
+
+        return array[-len(self) :] if len(self) else array[:0]
+
+    def clear(self) -> None:
+        """Forget every row and release the chunks."""
+        self._chunks.clear()
+        self._size = 0
+        self.count = 0
@@ -27,22 +27,25 @@ except ImportError as e:
     raise ImportError(error_message) from e
 
 import os
-from collections import deque
+from collections.abc import Mapping
 from typing import Any
 
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 from nautilus_trader.common.component import Logger
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.indicators.base.indicator import Indicator
 from nautilus_trader.model.data import Bar, BarType
 
+from jfdi.extensions.indicators.ta_lib.buffer import ChunkedArray, RingBuffer
 from jfdi.extensions.indicators.ta_lib.common import (
     output_suffix_map,
     taf_params_re,
     talib_indicator_manager_input_dtypes,
     talib_indicator_manager_input_names,
 )
+from jfdi.extensions.indicators.ta_lib.registry import TALibIndicatorRegistry
 
 
 class TAFunctionWrapper:
@@ -63,6 +66,8 @@ class TAFunctionWrapper:
       TA-Lib are used.
     - output_names (list[str]): A list of formatted output names for the technical indicator,
       generated based on the `name` and `params`.
+    - input_names (tuple[str, ...]): The price series the function reads, in the order
+      that the TA-Lib function API expects them.
 
     Notes:
     -----
@@ -85,6 +90,12 @@ class TAFunctionWrapper:
         self.fn = abstract.Function(name)
         self.fn.set_parameters(params or {})
         self.output_names = self._get_outputs_names(self.name, self.fn)
+        self.input_names = self._get_input_names(self.fn)
+
+        # The function API skips the abstract API's input validation and bookkeeping,
+        # which costs more than the calculation itself over short windows.
+        self._func = getattr(talib, self.name)
+        self._params = dict(self.fn.parameters)
 
     def __repr__(self):
         return f"TAFunctionWrapper({','.join(map(str, self.output_names))})"
@@ -138,6 +149,140 @@ class TAFunctionWrapper:
 
         return output_names
 
+    @staticmethod
+    def _get_input_names(fn: abstract.Function) -> tuple[str, ...]:
+        """Flatten the price series names of a TA-Lib function.
+
+        Parameters
+        ----------
+        fn : abstract.Function
+            The TA-Lib function object, whose `input_names` map each argument to either
+            a single price series name or a list of them.
+
+        Returns:
+        -------
+        tuple[str, ...]
+            The price series names in the order that the function API expects them.
+
+        """
+        input_names = []
+        for value in fn.input_names.values():
+            if isinstance(value, str):
+                input_names.append(value)
+            else:
+                input_names.extend(value)
+
+        return tuple(input_names)
+
+    def compute_last(self, inputs: Mapping[str, np.ndarray]) -> tuple[float, ...]:
+        """Calculate the latest value of each output.
+
+        Parameters
+        ----------
+        inputs : Mapping[str, np.ndarray]
+            The price series keyed by name, oldest first. Each array should be a
+            contiguous float64 array with at least `fn.lookback + 1` elements.
+
+        Returns:
+        -------
+        tuple[float, ...]
+            The latest value of each output, in the order of `output_names`.
+
+        """
+        results = self._func(
+            *[inputs[name] for name in self.input_names], **self._params
+        )
+
+        if len(self.output_names) == 1:
+            return (results[-1],)
+        else:
+            return tuple(result[-1] for result in results)
+
+    def compute_series(
+        self,
+        inputs: Mapping[str, np.ndarray],
+        n: int,
+        window: int,
+    ) -> tuple[np.ndarray, ...]:
+        """Calculate the last `n` values of each output, as if they'd been streamed.
+
+        When streamed, each value is calculated from at most the latest `window` inputs.
+        If the function is window invariant it's run once over every input, otherwise
+        it's run once per value over the same windows that streaming would have used.
+
+        Parameters
+        ----------
+        inputs : Mapping[str, np.ndarray]
+            The price series keyed by name, oldest first.
+        n : int
+            The number of values to calculate, which must not exceed the input length.
+        window : int
+            The number of inputs used to calculate each streamed value.
+
+        Returns:
+        -------
+        tuple[np.ndarray, ...]
+            The last `n` values of each output, in the order of `output_names`.
+
+        """
+        arrays = [inputs[name] for name in self.input_names]
+        length = len(arrays[0])
+
+        if self.is_window_invariant:
+            results = self._func(*arrays, **self._params)
+            if len(self.output_names) == 1:
+                results = (results,)
+
+            return tuple(result[length - n :] for result in results)
+
+        outputs = tuple(np.empty(n) for _ in self.output_names)
+        for i in range(n):
+            end = length - n + i + 1
+            start = max(0, end - window)
+            values = self.compute_last(
+                dict(zip(self.input_names, [a[start:end] for a in arrays], strict=True))
+            )
+            for output, value in zip(outputs, values, strict=True):
+                output[i] = value
+
+        return outputs
+
+    @property
+    def is_window_invariant(self) -> bool:
+        """Whether the latest value only depends on the latest `fn.lookback + 1` inputs.
+
+        Functions with recursive smoothing (e.g. EMA, RSI or ATR), or that accumulate
+        over their whole input (e.g. OBV), depend on how much history they're given.
+        The property is measured once per function and parameters, by comparing the
+        output over a random series with the outputs over its shortest windows.
+
+        """
+        key = tuple(self.output_names)
+        if key not in _window_invariance:
+            _window_invariance[key] = self._probe_window_invariance()
+
+        return _window_invariance[key]
+
+    def _probe_window_invariance(self) -> bool:
+        window = self.fn.lookback + 1
+        inputs = _make_probe_inputs(2 * window + 50)
+
+        expected = self._func(
+            *[inputs[name] for name in self.input_names], **self._params
+        )
+        if len(self.output_names) == 1:
+            expected = (expected,)
+
+        for i in range(window - 1, len(inputs["close"])):
+            values = self.compute_last(
+                {name: array[i - window + 1 : i + 1] for name, array in inputs.items()}
+            )
+            for output, value in zip(expected, values, strict=True):
+                if not np.isclose(output[i], value, rtol=1e-9, equal_nan=True):
+                    return False
+
+        return True
+
     @classmethod
     def from_str(cls, value: str) -> Any:
         """Construct an instance of the class based on a string representation of a TA-Lib
@@ -217,6 +362,25 @@ class TAFunctionWrapper:
         )
 
 
+# Whether each function (keyed by output names) is window invariant.
+_window_invariance: dict[tuple[str, ...], bool] = {}
+
+
+def _make_probe_inputs(n: int) -> dict[str, np.ndarray]:
+    """Generate a reproducible random walk of OHLCV prices."""
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(scale=0.01, size=n)))
+    spread = close * rng.uniform(0.001, 0.01, size=n)
+
+    return {
+        "open": np.roll(close, 1),
+        "high": close + spread,
+        "low": close - spread,
+        "close": close,
+        "volume": rng.uniform(1_000, 10_000, size=n),
+    }
+
+
 class TALibIndicatorManager(Indicator):
     """Provides Numpy array for the TA based on given schema.
 
@@ -227,11 +391,14 @@ class TALibIndicatorManager(Indicator):
     period : int, default -1
         The period for the indicator.
     buffer_size : int, optional
-        The buffer size for the indicator.
+        The number of outputs to retain. If unspecified, every output is retained.
     skip_uniform_price_bar : bool, default True
         If uniform price bars should be skipped.
     skip_zero_close_bar : bool, default True
         If zero sized bars should be skipped.
+    registry : TALibIndicatorRegistry, optional
+        The registry to share outputs with other managers on the same bar type through.
+        If unspecified, every output is computed by this manager.
 
     Raises:
     ------
@@ -249,6 +416,7 @@ class TALibIndicatorManager(Indicator):
         buffer_size: int | None = None,
         skip_uniform_price_bar: bool = True,
         skip_zero_close_bar: bool = True,
+        registry: TALibIndicatorRegistry | None = None,
     ) -> None:
         super().__init__([])
 
@@ -268,12 +436,16 @@ class TALibIndicatorManager(Indicator):
         self._last_ts_event: int = 0
         self._data_error_counter: int = 0
         self.count: int = 0
-        self._output_deque: deque[np.ndarray] = deque(maxlen=buffer_size)
+        self._buffer_size = buffer_size
+        self._registry = registry
+        # Managers only share outputs if they see the same bars.
+        self._source = (bar_type, skip_uniform_price_bar, skip_zero_close_bar)
 
         # Initialize on `set_indicators`
         self._stable_period: int | None = None
         self._output_dtypes: list | None = None
-        self._input_deque: deque[np.ndarray] | None = None
+        self._input_buffer: RingBuffer | None = None
+        self._output_store: ChunkedArray | None = None
         self._indicators: set | None = None
         self.output_names: tuple | None = None
 
@@ -285,7 +457,7 @@ class TALibIndicatorManager(Indicator):
 
         This method takes a tuple of TAFunctionWrapper objects, logs the action, and ensures
         that each element in the tuple is an instance of TAFunctionWrapper. It then updates
-        the indicators, output names, stable period, input deque, and output data types
+        the indicators, output names, stable period, input buffer, and output data types
         for the current instance based on the provided indicators.
 
         Parameters
@@ -301,8 +473,9 @@ class TALibIndicatorManager(Indicator):
         - Calculates the maximum lookback period across all indicators.
         - Initializes the output names based on the indicators.
         - Updates the stable period based on the maximum lookback and the instance's period.
-        - Initializes the input deque with a length equal to the stable period.
+        - Initializes the input buffer with a capacity of the maximum lookback plus one.
         - Sets the output data types, with special handling for the 'ts_event' column.
+        - Initializes the chunked output store that holds a row per output.
 
         This method also logs the setting and registration of indicators at the debug and
         info levels, respectively.
@@ -324,7 +497,7 @@ class TALibIndicatorManager(Indicator):
             lookback = max(lookback, indicator.fn.lookback)
 
         self._stable_period = lookback + self._period
-        self._input_deque = deque(maxlen=lookback + 1)
+        self._input_buffer = RingBuffer(self.input_dtypes(), capacity=lookback + 1)
         self.output_names = tuple(output_names)
 
         # Initialize the output dtypes
@@ -337,6 +510,17 @@ class TALibIndicatorManager(Indicator):
             )
             for col in self.output_names
         ]
+        self._output_store = ChunkedArray(
+            self._output_dtypes,
+            window=self._period,
+            max_rows=self._buffer_size,
+        )
+
+        if self._registry is not None:
+            for indicator in self._indicators:
+                self._registry.subscribe(
+                    self._source, indicator, self._input_buffer.capacity
+                )
 
         self._log.info(f"Registered {len(indicators)} indicators, {indicators}")
 
@@ -364,29 +548,27 @@ class TALibIndicatorManager(Indicator):
         return self._period
 
     def _update_ta_outputs(self, append: bool = True) -> None:
-        """Update the output deque with calculated technical analysis indicators.
+        """Update the output store with calculated technical analysis indicators.
 
         This private method computes and updates the output values for technical
-        analysis indicators based on the latest data in the input deque. It initializes
+        analysis indicators based on the latest data in the input buffer. It initializes
         a combined output array with base values (e.g., 'open', 'high', 'low', 'close',
-        'volume', 'ts_event') from the most recent input deque entry. Each indicator's
-        output is calculated and used to update the combined output array. The updated
-        data is either appended to or replaces the latest entry in the output deque,
-        depending on the value of the 'append' argument.
+        'volume', 'ts_event') from the most recent input buffer entry. Each indicator's
+        output is calculated from zero-copy views of the input buffer and written in
+        place to a row of the output store. The row is either appended to the store or
+        is its latest entry, depending on the value of the 'append' argument.
 
         Parameters
         ----------
         append : bool, default True
-            Determines whether to append the new output to the output deque (True)
+            Determines whether to append the new output to the output store (True)
             or replace the most recent output (False).
 
         The method performs the following steps:
-        - Initializes a combined output array with base values from the latest input
-          deque entry.
-        - Iterates through each indicator, calculates its output, and updates the
-          combined output array.
-        - Appends the combined output to the output deque or replaces its most recent
-          entry based on the 'append' flag.
+        - Appends a row to the output store, or selects its most recent row, based on
+          the 'append' flag.
+        - Sets the row's base values from the latest input buffer entry.
+        - Iterates through each indicator, calculates its output, and updates the row.
         - Resets the internal output array for reconstruction during the next access.
 
         This method logs actions at the debug level to track the calculation and
@@ -395,40 +577,41 @@ class TALibIndicatorManager(Indicator):
         """
         self._log.debug("Calculating outputs.")
 
-        if self._input_deque is None:
+        if self._input_buffer is None or self._output_store is None:
             return
 
-        combined_output = np.zeros(1, dtype=self._output_dtypes)
-        combined_output["ts_event"] = self._input_deque[-1]["ts_event"].item()
-        combined_output["ts_init"] = self._input_deque[-1]["ts_init"].item()
-        combined_output["open"] = self._input_deque[-1]["open"].item()
-        combined_output["high"] = self._input_deque[-1]["high"].item()
-        combined_output["low"] = self._input_deque[-1]["low"].item()
-        combined_output["close"] = self._input_deque[-1]["close"].item()
-        combined_output["volume"] = self._input_deque[-1]["volume"].item()
-
-        input_array = np.concatenate(self._input_deque)
-        assert self._indicators  # Type checking
-        for indicator in self._indicators:
-            self._log.debug(f"Calculating {indicator.name} outputs.")
-            inputs_dict = {name: input_array[name] for name in input_array.dtype.names}
-            indicator.fn.set_input_arrays(inputs_dict)
-            results = indicator.fn.run()
-
-            if len(indicator.output_names) == 1:
-                self._log.debug("Single output.")
-                combined_output[indicator.output_names[0]] = results[-1]
-            else:
-                self._log.debug("Multiple outputs.")
-                for i, output_name in enumerate(indicator.output_names):
-                    combined_output[output_name] = results[i][-1]
-
         if append:
             self._log.debug("Appending output.")
-            self._output_deque.append(combined_output)
+            combined_output = self._output_store.append()
         else:
-            self._log.debug("Prepending output.")
-            self._output_deque[-1] = combined_output
+            self._log.debug("Replacing output.")
+            combined_output = self._output_store.last()
+
+        last_row = tuple(
+            self._input_buffer.last(name) for name in self._input_buffer.names
+        )
+        for name, value in zip(self._input_buffer.names, last_row, strict=True):
+            combined_output[name] = value
+
+        inputs_dict = self._input_buffer.views()
+        assert self._indicators is not None  # Type checking
+        for indicator in self._indicators:
+            self._log.debug(f"Calculating {indicator.name} outputs.")
+            if self._registry is None:
+                results = indicator.compute_last(inputs_dict)
+            else:
+                results = self._registry.compute_last(
+                    self._source,
+                    indicator,
+                    self._input_buffer.capacity,
+                    inputs_dict,
+                    last_row,
+                )
+
+            for output_name, result in zip(
+                indicator.output_names, results, strict=True
+            ):
+                combined_output[output_name] = result
 
         # Reset output array to force rebuild on next access
         self._output_array = None
@@ -531,16 +714,18 @@ class TALibIndicatorManager(Indicator):
         """Generate the output array for the indicator, either truncated or complete.
 
         This method constructs a NumPy record array (`np.recarray`) from the accumulated outputs
-        stored in `self._output_deque`. It can generate either a truncated array, containing only
-        the data for the last `self.period` outputs, or a complete array with all accumulated data.
-        The method also sets the output array to be non-writeable to preserve data integrity.
+        stored in `self._output_store`. It can generate either a truncated array, containing only
+        the data for the last `self.period` outputs, or a complete array with all retained data.
+        Either way, the array is a copy, so it doesn't change when the store's latest row is
+        replaced by a bar with the same timestamp. The method also sets the output array to be
+        non-writeable to preserve data integrity.
 
         Parameters
         ----------
         truncate : bool
             A flag indicating whether to truncate the output array to the size of `self.period`.
             If True, only the last `self.period` outputs are included in the array. If False,
-            the entire contents of `self._output_deque` are used.
+            every output retained by `self._output_store` is used.
 
         Returns:
         -------
@@ -572,10 +757,11 @@ class TALibIndicatorManager(Indicator):
 
         if truncate:
             self._log.debug("Generating truncated output array.")
-            output_array = np.concatenate(list(self._output_deque)[-self.period :])
+            # The tail is a view of the store, whose rows are overwritten in place.
+            output_array = self._output_store.tail(self.period).copy()
         else:
             self._log.info("Generating complete output array.")
-            output_array = np.concatenate(list(self._output_deque))
+            output_array = self._output_store.to_array()
 
         # Make sure that the array is not writeable
         self._log.debug("Setting output array as not writeable.")
@@ -708,26 +894,21 @@ class TALibIndicatorManager(Indicator):
             self._log.warning(f"Skipping zero close bar: {bar!r}")
             return
 
-        bar_data = np.array(
-            [
-                (
-                    bar.ts_event,
-                    bar.ts_init,
-                    bar.open.as_double(),
-                    bar.high.as_double(),
-                    bar.low.as_double(),
-                    bar.close.as_double(),
-                    bar.volume.as_double(),
-                ),
-            ],
-            dtype=self.input_dtypes(),
+        bar_data = (
+            bar.ts_event,
+            bar.ts_init,
+            bar.open.as_double(),
+            bar.high.as_double(),
+            bar.low.as_double(),
+            bar.close.as_double(),
+            bar.volume.as_double(),
         )
 
         if bar.ts_event == self._last_ts_event:
-            self._input_deque[-1] = bar_data
+            self._input_buffer.replace(bar_data)
             self._update_ta_outputs(append=False)
         elif bar.ts_event > self._last_ts_event:
-            self._input_deque.append(bar_data)
+            self._input_buffer.append(bar_data)
             self._increment_count()
             self._update_ta_outputs()
         else:
@@ -736,3 +917,149 @@ class TALibIndicatorManager(Indicator):
             return
 
         self._last_ts_event = bar.ts_event
+
+    def handle_bars_batch(self, bars: list[Bar] | np.ndarray | pa.Table) -> None:
+        """Update the indicator with many bars at once, for instance to warm it up.
+
+        The bars are filtered exactly as `handle_bar` would filter them one at a time:
+        uniform price and zero close bars are skipped (if configured), out of sync bars
+        are counted as data errors, and a bar with the same `ts_event` as its
+        predecessor replaces it. Each TA-Lib function is then run once over the whole
+        history where that gives the same values as streaming, and once per bar
+        otherwise (see `TAFunctionWrapper.is_window_invariant`). The outputs are written
+        to the output store in bulk, and the input buffer, count, initialization and
+        last timestamp are left as if the bars had been streamed.
+
+        Parameters
+        ----------
+        bars : list[Bar] | np.ndarray | pa.Table
+            The bars to update the indicator with, in chronological order. Arrays and
+            tables should have the fields or columns named by `input_names`, with
+            timestamps in nanoseconds and prices as floats.
+
+        Raises:
+        ------
+        ValueError
+            Raised if 'bars' is None, or if the bar type of any 'Bar' does not match
+            the expected type.
+
+        """
+        PyCondition.not_none(bars, "bars")
+
+        columns = self._get_input_columns(bars)
+        n_bars = len(columns["ts_event"])
+
+        self._log.debug(f"Handling {n_bars} bars.")
+
+        skip = np.zeros(n_bars, dtype=bool)
+        if self._skip_uniform_price_bar:
+            skip |= (
+                (columns["open"] == columns["high"])
+                & (columns["high"] == columns["low"])
+                & (columns["low"] == columns["close"])
+            )
+        if self._skip_zero_close_bar:
+            skip |= columns["close"] == 0
+        if skip.any():
+            self._log.warning(f"Skipping {np.count_nonzero(skip)} bars.")
+
+        columns = {name: column[~skip] for name, column in columns.items()}
+        ts_event = columns["ts_event"]
+
+        # Bars are out of sync if they precede the latest bar that was accepted.
+        previous_ts_event = np.maximum.accumulate(
+            np.concatenate(([self._last_ts_event], ts_event[:-1])).astype(np.uint64)
+        )
+        in_sync = ts_event >= previous_ts_event
+        if not in_sync.all():
+            self._data_error_counter += np.count_nonzero(~in_sync)
+            self._log.error(f"Received {np.count_nonzero(~in_sync)} out of sync bars.")
+
+        ts_event = ts_event[in_sync]
+        if len(ts_event) == 0:
+            return
+
+        # Only the last of a run of bars with the same timestamp survives streaming.
+        last_of_run = np.append(ts_event[1:] != ts_event[:-1], True)
+        columns = {
+            name: column[in_sync][last_of_run] for name, column in columns.items()
+        }
+        last_ts_event = int(ts_event[-1])
+
+        if self.count > 0 and columns["ts_event"][0] == self._last_ts_event:
+            self._input_buffer.replace([column[0] for column in columns.values()])
+            self._update_ta_outputs(append=False)
+            columns = {name: column[1:] for name, column in columns.items()}
+
+        n = len(columns["ts_event"])
+        if n > 0:
+            self._log.debug(f"Calculating outputs for {n} bars.")
+
+            # The buffered bars are prepended as they're within the earliest windows.
+            inputs = {
+                name: np.concatenate((self._input_buffer.view(name), columns[name]))
+                for name in self.input_names()
+            }
+
+            outputs = np.zeros(n, dtype=self._output_dtypes)
+            for name in self.input_names():
+                outputs[name] = columns[name]
+
+            assert self._indicators is not None  # Type checking
+            for indicator in self._indicators:
+                self._log.debug(f"Calculating {indicator.name} outputs.")
+                results = indicator.compute_series(
+                    inputs, n, self._input_buffer.capacity
+                )
+
+                for output_name, result in zip(
+                    indicator.output_names, results, strict=True
+                ):
+                    outputs[output_name] = result
+
+            self._input_buffer.extend([columns[name] for name in self.input_names()])
+            self._output_store.extend(outputs)
+
+            self.count += n
+            if not self.initialized:
+                self._set_has_inputs(True)
+                if self.count >= self._stable_period:
+                    self._set_initialized(True)
+                    self._log.info(f"Initialized with {self.count} bars")
+
+            # Reset output array to force rebuild on next access
+            self._output_array = None
+
+        self._last_ts_event = last_ts_event
+
+    def _get_input_columns(
+        self,
+        bars: list[Bar] | np.ndarray | pa.Table,
+    ) -> dict[str, np.ndarray]:
+        """Convert bars to a contiguous array per input, keyed by input name."""
+        if isinstance(bars, pa.Table):
+            columns = {
+                name: bars.column(name).to_numpy() for name in self.input_names()
+            }
+        elif isinstance(bars, np.ndarray):
+            columns = {name: bars[name] for name in self.input_names()}
+        else:
+            for bar in bars:
+                PyCondition.equal(
+                    bar.bar_type, self._bar_type, "bar.bar_type", "self._bar_type"
+                )
+
+            columns = {
+                "ts_event": [bar.ts_event for bar in bars],
+                "ts_init": [bar.ts_init for bar in bars],
+                "open": [bar.open.as_double() for bar in bars],
+                "high": [bar.high.as_double() for bar in bars],
+                "low": [bar.low.as_double() for bar in bars],
+                "close": [bar.close.as_double() for bar in bars],
+                "volume": [bar.volume.as_double() for bar in bars],
+            }
+
+        return {
+            name: np.ascontiguousarray(columns[name], dtype=dtype)
+            for name, dtype in self.input_dtypes()
+        }
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Hashable, Mapping
+from typing import TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from jfdi.extensions.indicators.ta_lib.manager import TAFunctionWrapper
+
+
+class TALibIndicatorRegistry:
+    """A cache that shares TA-Lib outputs between indicator managers.
+
+    Managers that compute the same function with the same parameters on the same bar
+    stream ask the registry for each bar's values. The first manager to ask computes
+    them (a miss) and every other subscriber reuses them (a hit).
+
+    A cached value is reused only if it was computed from the same window of bars: the
+    latest bar must be identical, and so must the number of bars in the window that
+    the function can see. For window invariant functions that's at most the function's
+    lookback plus one, so managers with different buffer capacities still share them.
+
+    Typical usage example:
+    >>> manager = TALibIndicatorManager(bar_type, registry=talib_indicator_registry)
+    >>> talib_indicator_registry.statistics()
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[tuple, tuple[tuple, tuple[float, ...]]] = {}
+        self._subscribers: dict[tuple, int] = defaultdict(int)
+        self._hits: dict[tuple, int] = defaultdict(int)
+        self._misses: dict[tuple, int] = defaultdict(int)
+
+    @staticmethod
+    def _get_key(
+        source: Hashable,
+        indicator: TAFunctionWrapper,
+        window: int,
+    ) -> tuple:
+        # Window invariant functions give the same value for any window that covers
+        # their lookback, so the window's only part of the key for the others.
+        return (
+            source,
+            indicator,
+            None if indicator.is_window_invariant else window,
+        )
+
+    def subscribe(
+        self,
+        source: Hashable,
+        indicator: TAFunctionWrapper,
+        window: int,
+    ) -> None:
+        """Register interest in an indicator on a bar stream.
+
+        Args:
+            source: Identifies the bar stream, e.g. its bar type and filters.
+            indicator: The TA-Lib function and its parameters.
+            window: The capacity of the subscriber's input buffer.
+        """
+        self._subscribers[self._get_key(source, indicator, window)] += 1
+
+    def compute_last(
+        self,
+        source: Hashable,
+        indicator: TAFunctionWrapper,
+        window: int,
+        inputs: Mapping[str, np.ndarray],
+        last_row: tuple,
+    ) -> tuple[float, ...]:
+        """Return the latest value of each output, computing them at most once per bar.
+
+        Args:
+            source: Identifies the bar stream, e.g. its bar type and filters.
+            indicator: The TA-Lib function and its parameters.
+            window: The capacity of the subscriber's input buffer.
+            inputs: The subscriber's buffered price series keyed by name, oldest first.
+            last_row: The latest bar's timestamps and prices.
+
+        Returns:
+            The latest value of each output, in the order of `indicator.output_names`.
+        """
+        key = self._get_key(source, indicator, window)
+
+        length = len(inputs["close"])
+        if indicator.is_window_invariant:
+            length = min(length, indicator.fn.lookback + 1)
+        token = (length, last_row)
+
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] == token:
+            self._hits[key] += 1
+            return entry[1]
+
+        values = indicator.compute_last(inputs)
+        self._entries[key] = (token, values)
+        self._misses[key] += 1
+
+        return values
+
+    def statistics(self) -> pd.DataFrame:
+        """Summarise the subscribers, hits and misses of each shared indicator."""
+        keys = self._subscribers.keys() | self._hits.keys() | self._misses.keys()
+
+        df = pd.DataFrame(
+            [
+                {
+                    "source": str(source),
+                    "indicator": repr(indicator),
+                    "window": window,
+                    "subscribers": self._subscribers.get(key, 0),
+                    "hits": self._hits.get(key, 0),
+                    "misses": self._misses.get(key, 0),
+                }
+                for key in keys
+                for source, indicator, window in [key]
+            ],
+            columns=["source", "indicator", "window", "subscribers", "hits", "misses"],
+        )
+        df["hit_rate"] = df["hits"] / (df["hits"] + df["misses"]).replace(0, np.nan)
+
+        return df.sort_values(["source", "indicator"]).reset_index(drop=True)
+
+    @property
+    def hits(self) -> int:
+        return sum(self._hits.values())
+
+    @property
+    def misses(self) -> int:
+        return sum(self._misses.values())
+
+    def reset_statistics(self) -> None:
+        self._hits.clear()
+        self._misses.clear()
+
+    def clear(self) -> None:
+        """Forget every cached value, subscriber and statistic."""
+        self._entries.clear()
+        self._subscribers.clear()
+        self.reset_statistics()
+
+
+# The process-wide registry.
+talib_indicator_registry = TALibIndicatorRegistry()
@@ -0,0 +1,73 @@
+import numpy as np
+import numpy.typing as npt
+from nautilus_trader.model.orders.base import Order
+
+
+def get_cash_released(
+    net_positions: npt.NDArray[np.float64],
+    order_quantities: npt.NDArray[np.float64],
+    unit_costs: npt.NDArray[np.float64],
+) -> npt.NDArray[np.float64]:
+    """Calculate the cash (or margin) that each order releases.
+
+    An order releases the cost of the exposure it closes, and takes the cost of the
+    exposure it opens, so orders that take cash have negative values. Shorts take
+    margin just as longs take cash.
+
+    Args:
+        net_positions: The signed net position of each order's instrument.
+        order_quantities: The signed quantity of each order (negative for sells).
+        unit_costs: The cost of one unit of each order's instrument, in the
+            reporting currency: its notional value on a cash account, or its initial
+            margin on a margin account.
+    """
+    return (
+        np.abs(net_positions) - np.abs(net_positions + order_quantities)
+    ) * unit_costs
+
+
+class RebalancePlan:
+    __slots__ = ("_costs", "_orders", "first_wave")
+
+    def __init__(self, orders: list[Order], cash_released: npt.NDArray[np.float64]):
+        """The waves in which to submit a rebalance's orders.
+
+        The first wave is every order that releases cash, largest first. The orders
+        that take cash wait for the waves before them to close, and are then released
+        as far as the free margin goes. They're sorted from cheapest to most
+        expensive, so that as many orders as possible fit.
+
+        Args:
+            orders: The rebalance's orders.
+            cash_released: The cash that each order releases (see
+                `get_cash_released`).
+        """
+        releasing = np.flatnonzero(cash_released >= 0)
+        taking = np.flatnonzero(cash_released < 0)
+
+        releasing = releasing[np.argsort(-cash_released[releasing], kind="stable")]
+        taking = taking[np.argsort(-cash_released[taking], kind="stable")]
+
+        self.first_wave = [orders[i] for i in releasing]
+
+        self._orders = [orders[i] for i in taking]
+        # The cash that each order takes along with the orders before it.
+        self._costs = np.cumsum(-cash_released[taking])
+
+    def __len__(self) -> int:
+        """Return the number of orders that are still waiting to be submitted."""
+        return len(self._orders)
+
+    def next_wave(self, free_margin: float) -> list[Order]:
+        """Return the next orders that the free margin covers, and drop them."""
+        n_orders = int(np.searchsorted(self._costs, free_margin, side="right"))
+
+        if n_orders == 0:
+            return []
+
+        wave = self._orders[:n_orders]
+
+        self._orders = self._orders[n_orders:]
+        self._costs = self._costs[n_orders:] - self._costs[n_orders - 1]
+
+        return wave
@@ -1,40 +1,173 @@
+import numpy as np
+import numpy.typing as npt
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.enums import LogColor
 from nautilus_trader.model import InstrumentId, Money, Quantity, Venue
 from nautilus_trader.model.enums import OrderSide, PriceType
+from nautilus_trader.model.events import OrderEvent
+from nautilus_trader.model.identifiers import ClientOrderId
+from nautilus_trader.model.instruments import Instrument
 from nautilus_trader.model.objects import Currency
 from nautilus_trader.model.orders.base import Order
 from nautilus_trader.trading.strategy import Strategy, StrategyConfig
 
-from jfdi.actors.weight import get_weight
+from jfdi.actors.equity import get_equity
+from jfdi.actors.weight import get_weights
+from jfdi.extensions.strategies.rebalance import RebalancePlan, get_cash_released
 from shared.data.rounding import round_directional
 
 
 class WeightStrategyConfig(StrategyConfig):
     exchange_rate_venue: Venue
     reporting_currency: Currency
+    # The venue of the account whose free margin rebalances are planned around, if
+    # it's not the venue of the instruments (as at Interactive Brokers).
+    account_venue: Venue | None = None
+
+
+class InstrumentIndex:
+    __slots__ = ("_indices", "instrument_ids", "instruments", "size_precisions")
+
+    def __init__(self):
+        """A stable integer index for each instrument a strategy trades.
+
+        Instruments are appended the first time they're seen, so an instrument's index
+        never changes, and weights, prices and size precisions can be held in arrays
+        that line up with it.
+        """
+        self.instrument_ids: list[InstrumentId] = []
+        self.instruments: list[Instrument] = []
+        self.size_precisions = np.empty(0, dtype=np.int64)
+
+        self._indices: dict[InstrumentId, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.instrument_ids)
+
+    def indices(
+        self,
+        instrument_ids: list[InstrumentId],
+        cache: Cache,
+    ) -> npt.NDArray[np.intp]:
+        """Return the instruments' indices, adding those that haven't been seen.
+
+        Raises:
+            ValueError: If an instrument isn't in the cache.
+        """
+        new_instruments = []
+
+        for instrument_id in instrument_ids:
+            if instrument_id in self._indices:
+                continue
+
+            instrument = cache.instrument(instrument_id)
+
+            if instrument is None:
+                raise ValueError(
+                    f"Could not find instrument. instrument_id: {instrument_id}"
+                )
+
+            self._indices[instrument_id] = len(self.instrument_ids)
+            self.instrument_ids.append(instrument_id)
+            self.instruments.append(instrument)
+            new_instruments.append(instrument)
+
+        if new_instruments:
+            self.size_precisions = np.concatenate(
+                [
+                    self.size_precisions,
+                    [instrument.size_precision for instrument in new_instruments],
+                ]
+            )
+
+        return np.fromiter(
+            (self._indices[instrument_id] for instrument_id in instrument_ids),
+            dtype=np.intp,
+            count=len(instrument_ids),
+        )
+
+    def to_array(
+        self,
+        weights: dict[InstrumentId, float],
+        cache: Cache,
+    ) -> npt.NDArray[np.float64]:
+        """Return the weights in the order of the index, with zeros for the rest."""
+        indices = self.indices(list(weights), cache)
+
+        array = np.zeros(len(self))
+        array[indices] = list(weights.values())
+
+        return array
 
 
 class WeightStrategy(Strategy):
     def __init__(self, config: WeightStrategyConfig) -> None:
-        """A strategy wrapper that adds support for target weights."""
+        """A strategy wrapper that adds support for target weights.
+
+        Weights can be passed around as dicts, or as arrays in the order of
+        `instrument_index`, which is how they're calculated: the current weights come
+        from one `get_weights` pass, and order quantities are rounded in one call.
+        """
         super().__init__(config)
 
+        self.instrument_index = InstrumentIndex()
+
+        self._rebalance_plan: RebalancePlan | None = None
+        self._rebalance_venue: Venue | None = None
+        # The orders of the current wave that haven't closed yet.
+        self._wave_order_ids: set[ClientOrderId] = set()
+
     def get_current_weights(
         self,
         account_equity: Money,
     ) -> dict[InstrumentId, float]:
-        """Calculate the the portolfio's current weights (directional)."""
-        current_weights = {
-            position.instrument_id: get_weight(
-                self,
-                self.cache.instrument(position.instrument_id),
-                account_equity,
-                self.config.exchange_rate_venue,
-                self.config.reporting_currency,
-            )
-            for position in self.cache.positions_open(strategy_id=self.id)
-        }
+        """Calculate the the portolfio's current weights (directional).
 
-        return current_weights
+        The weights are `None` if an exchange rate isn't available.
+        """
+        instrument_ids = self._open_instrument_ids()
+        weights = self.get_current_weight_array(account_equity)
+
+        if weights is None:
+            return dict.fromkeys(instrument_ids)
+
+        indices = self.instrument_index.indices(instrument_ids, self.cache)
+
+        return dict(zip(instrument_ids, weights[indices].tolist(), strict=True))
+
+    def get_current_weight_array(
+        self,
+        account_equity: Money,
+    ) -> npt.NDArray[np.float64] | None:
+        """Calculate the portfolio's current weights in the order of the index.
+
+        Returns `None` if an exchange rate isn't available.
+        """
+        indices = self.instrument_index.indices(self._open_instrument_ids(), self.cache)
+
+        open_weights = get_weights(
+            self,
+            [self.instrument_index.instruments[index] for index in indices],
+            account_equity,
+            self.config.exchange_rate_venue,
+            self.config.reporting_currency,
+        )
+
+        if open_weights is None:
+            return None
+
+        weights = np.zeros(len(self.instrument_index))
+        weights[indices] = open_weights
+
+        return weights
+
+    def _open_instrument_ids(self) -> list[InstrumentId]:
+        return list(
+            dict.fromkeys(
+                position.instrument_id
+                for position in self.cache.positions_open(strategy_id=self.id)
+            )
+        )
 
     def get_target_weights(self) -> dict[InstrumentId, float]:
         """Calculate the portfolio's target weights (directional).
@@ -62,28 +195,82 @@ class WeightStrategy(Strategy):
 
         return order_weights
 
+    def get_order_weight_array(
+        self,
+        account_equity: Money,
+        target_weights: dict[InstrumentId, float],
+    ) -> npt.NDArray[np.float64] | None:
+        """Calculate the order sizes in portfolio weights, in the order of the index.
+
+        Returns `None` if an exchange rate isn't available.
+        """
+        target = self.instrument_index.to_array(target_weights, self.cache)
+        current = self.get_current_weight_array(account_equity)
+
+        if current is None:
+            return None
+
+        return target - current
+
     def create_orders(
         self,
         equity: float,
         order_weights: dict[InstrumentId, float],
     ) -> list[Order]:
         """Get the (market) orders from the supplied weight differences."""
-        orders = []
+        indices = self.instrument_index.indices(list(order_weights), self.cache)
 
-        for instrument_id, order_weight in order_weights.items():
-            instrument = self.cache.instrument(instrument_id)
-            last_price = self.cache.price(instrument_id, PriceType.LAST)
+        return self._create_orders(
+            equity, indices, np.fromiter(order_weights.values(), dtype=np.float64)
+        )
 
-            order_quantity = Quantity(
-                round_directional(
-                    equity * abs(order_weight) / last_price,
-                    instrument.size_precision,
-                ),
-                instrument.size_precision,
-            )
+    def create_orders_from_array(
+        self,
+        equity: float,
+        order_weights: npt.NDArray[np.float64],
+    ) -> list[Order]:
+        """Get the (market) orders from weight differences in the order of the index.
 
-            # Sometimes the prices of these instruments get so high that you
-            # can't make a trade if you're not trading fractional shares.
+        Instruments with an order weight of zero are skipped.
+        """
+        indices = np.flatnonzero(order_weights)
+
+        return self._create_orders(equity, indices, order_weights[indices])
+
+    def _create_orders(
+        self,
+        equity: float,
+        indices: npt.NDArray[np.intp],
+        order_weights: npt.NDArray[np.float64],
+    ) -> list[Order]:
+        instrument_ids = [self.instrument_index.instrument_ids[i] for i in indices]
+        size_precisions = self.instrument_index.size_precisions[indices]
+
+        last_prices = np.fromiter(
+            (
+                self.cache.price(instrument_id, PriceType.LAST).as_double()
+                for instrument_id in instrument_ids
+            ),
+            dtype=np.float64,
+            count=len(instrument_ids),
+        )
+
+        order_quantities = round_directional(
+            float(equity) * np.abs(order_weights) / last_prices,
+            size_precisions,
+        )
+
+        orders = []
+
+        for instrument_id, order_weight, order_quantity, size_precision in zip(
+            instrument_ids,
+            order_weights.tolist(),
+            order_quantities.tolist(),
+            size_precisions.tolist(),
+            strict=True,
+        ):
+            # Sometimes the prices of these instruments get so high that you can't
+            # make a trade if you're not trading fractional shares.
             if order_quantity != 0:
                 orders.append(
                     self.order_factory.market(
@@ -91,22 +278,181 @@ class WeightStrategy(Strategy):
                         order_side=(
                             OrderSide.BUY if order_weight > 0 else OrderSide.SELL
                         ),
-                        # Rounding up can create a larger notional than the
-                        # account balance, so I can't use `instrument.make_qty`.
-                        quantity=order_quantity,
+                        # Rounding up can create a larger notional than the account
+                        # balance, so I can't use `instrument.make_qty`.
+                        quantity=Quantity(order_quantity, size_precision),
                     )
                 )
 
         return orders
 
-    def get_equity_released(self, order: Order) -> float:
-        """Sort market orders to free up equity before trying to spend it."""
-        # Buy orders take equity unless the portfolio is net short that position.
-        return (
-            1
-            if not self.portfolio.net_position(order.instrument_id)
-            else (self.portfolio.is_net_long(order.instrument_id) * 2 - 1)
-            * (-1 if order.side == OrderSide.BUY else 1)
-            * self.cache.price(order.instrument_id, PriceType.LAST)
-            * order.quantity
+    def submit_rebalance(self, orders: list[Order]) -> None:
+        """Submit the orders in waves that the account's free margin covers.
+
+        Every order's cash impact is calculated once, up front. The orders that
+        release cash are submitted first, and those that take it are submitted once
+        the previous wave has closed, as many as the free margin then covers. Orders
+        that it never covers aren't submitted, rather than being rejected.
+
+        A new rebalance replaces the waves of the previous one that are yet to be
+        submitted, but its waves that take cash still wait for the open orders of
+        the previous one to close, as they hold margin.
+        """
+        if not orders:
+            return
+
+        cash_released = self.get_cash_released(orders)
+
+        if cash_released is None:
+            self.log.warning("NO EXCHANGE RATES AVAILABLE.", LogColor.CYAN)
+            return
+
+        self._rebalance_plan = RebalancePlan(orders, cash_released)
+        self._rebalance_venue = self._account_venue(orders)
+        self._submit_wave(self._rebalance_plan.first_wave)
+
+    def get_cash_released(
+        self,
+        orders: list[Order],
+    ) -> npt.NDArray[np.float64] | None:
+        """Calculate the cash that each order releases, in the reporting currency.
+
+        Orders on a margin account release (or take) the initial margin of their
+        exposure, at the instrument's leverage, rather than its notional value.
+
+        Returns `None` if an exchange rate isn't available.
+        """
+        instrument_ids = [order.instrument_id for order in orders]
+        indices = self.instrument_index.indices(instrument_ids, self.cache)
+
+        account = self.portfolio.account(self._account_venue(orders))
+        is_margin_account = account is not None and account.is_margin_account
+
+        exchange_rates = {}
+        unit_costs = np.empty(len(orders))
+
+        for i, (instrument_id, index) in enumerate(
+            zip(instrument_ids, indices.tolist(), strict=True)
+        ):
+            instrument = self.instrument_index.instruments[index]
+            currency = instrument.get_cost_currency()
+            exchange_rate = exchange_rates.get(currency)
+
+            if exchange_rate is None:
+                exchange_rate = self.cache.get_xrate(
+                    venue=self.config.exchange_rate_venue,
+                    from_currency=currency,
+                    to_currency=self.config.reporting_currency,
+                )
+
+                if exchange_rate is None:
+                    return None
+
+                exchange_rates[currency] = exchange_rate
+
+            unit_costs[i] = (
+                self.cache.price(instrument_id, PriceType.LAST).as_double()
+                * instrument.multiplier.as_double()
+                * exchange_rate
+            )
+
+            if is_margin_account:
+                leverage = account.leverage(instrument_id) or account.default_leverage
+                unit_costs[i] *= float(instrument.margin_init / leverage)
+
+        net_positions = np.fromiter(
+            (
+                float(self.portfolio.net_position(instrument_id))
+                for instrument_id in instrument_ids
+            ),
+            dtype=np.float64,
+            count=len(orders),
         )
+        order_quantities = np.fromiter(
+            (
+                order.quantity.as_double() * (1 if order.side == OrderSide.BUY else -1)
+                for order in orders
+            ),
+            dtype=np.float64,
+            count=len(orders),
+        )
+
+        return get_cash_released(net_positions, order_quantities, unit_costs)
+
+    def _account_venue(self, orders: list[Order]) -> Venue:
+        return self.config.account_venue or orders[0].instrument_id.venue
+
+    def get_free_margin(self, venue: Venue) -> float | None:
+        """Calculate the account's free balances in the reporting currency.
+
+        Returns `None` if the account or an exchange rate isn't available.
+        """
+        account = self.portfolio.account(venue)
+
+        if account is None:
+            return None
+
+        free_margin = get_equity(
+            self,
+            account.balances_free(),
+            self.config.exchange_rate_venue,
+            self.config.reporting_currency,
+        )
+
+        return None if free_margin is None else free_margin.as_double()
+
+    def on_order_event(self, event: OrderEvent) -> None:
+        if event.client_order_id not in self._wave_order_ids:
+            return
+
+        # Orders are initialised before they're added to the cache.
+        order = self.cache.order(event.client_order_id)
+
+        if order is None or not order.is_closed:
+            return
+
+        self._wave_order_ids.discard(event.client_order_id)
+
+        if not self._wave_order_ids:
+            self._submit_next_wave()
+
+    def _submit_wave(self, wave: list[Order]) -> None:
+        if not wave:
+            # The next wave waits for any open orders of a previous rebalance.
+            if not self._wave_order_ids:
+                self._submit_next_wave()
+            return
+
+        # The orders can close as they're submitted, so they're all added first (to
+        # any open orders of a previous rebalance).
+        self._wave_order_ids.update(order.client_order_id for order in wave)
+
+        # Order lists are for a single instrument, so the wave is submitted order by
+        # order.
+        for order in wave:
+            self.submit_order(order)
+
+    def _submit_next_wave(self) -> None:
+        plan = self._rebalance_plan
+
+        if not plan:
+            self._rebalance_plan = None
+            return
+
+        free_margin = self.get_free_margin(self._rebalance_venue)
+
+        if free_margin is None:
+            self.log.warning("NO FREE MARGIN AVAILABLE.", LogColor.CYAN)
+            self._rebalance_plan = None
+            return
+
+        wave = plan.next_wave(free_margin)
+
+        if not wave:
+            self.log.warning(
+                f"INSUFFICIENT FREE MARGIN FOR {len(plan)} ORDERS.", LogColor.CYAN
+            )
+            self._rebalance_plan = None
+            return
+
+        self._submit_wave(wave)
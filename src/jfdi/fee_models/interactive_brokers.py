@@ -1,3 +1,8 @@
+from bisect import bisect_left, bisect_right
+from enum import Enum
+
+import numpy as np
+import numpy.typing as npt
 from nautilus_trader.backtest.models import FeeModel
 from nautilus_trader.model import Currency, Money, Price, Quantity
 from nautilus_trader.model.instruments import (
@@ -9,14 +14,245 @@ from nautilus_trader.model.instruments import (
 from nautilus_trader.model.orders import Order
 
 
+class InstrumentKind(Enum):
+    EQUITY = 1
+    FUTURE = 2
+    OPTION = 3
+
+
+class Pricing(Enum):
+    FIXED = 1
+    TIERED = 2
+
+
+class CommissionSchedule:
+    __slots__ = (
+        "maximum_percent",
+        "minimum",
+        "premium_limits",
+        "premium_rates",
+        "volume_limits",
+        "volume_rates",
+    )
+
+    def __init__(
+        self,
+        volume_rates: tuple[float, ...],
+        volume_limits: tuple[float, ...] = (),
+        minimum: float = 0.0,
+        maximum_percent: float = np.inf,
+        premium_limits: tuple[float, ...] = (),
+        premium_rates: tuple[float, ...] = (),
+    ):
+        """A commission per share or contract, with a minimum and maximum per order.
+
+        Args:
+            volume_rates: The commission per unit for each tier of monthly volume.
+            volume_limits: The (inclusive) upper limit of monthly volume of each tier
+                but the last.
+            minimum: The minimum commission per order.
+            maximum_percent: The maximum commission per order, as a fraction of the
+                trade value.
+            premium_limits: The upper limit of the premium (per share) of each
+                cheaper option rate.
+            premium_rates: The commission per contract of options whose premiums are
+                below each premium limit (if it's less than the volume rate).
+        """
+        self.volume_rates = volume_rates
+        self.volume_limits = volume_limits
+        self.minimum = minimum
+        self.maximum_percent = maximum_percent
+        self.premium_limits = premium_limits
+        self.premium_rates = premium_rates
+
+    def commission(
+        self,
+        fill_qty: float,
+        fill_px: float,
+        multiplier: float = 1.0,
+        monthly_volume: float = 0.0,
+    ) -> float:
+        """Calculate the commission of a single fill."""
+        rate = self.volume_rates[bisect_left(self.volume_limits, monthly_volume)]
+
+        premium_tier = bisect_right(self.premium_limits, fill_px)
+
+        if premium_tier < len(self.premium_rates):
+            rate = min(rate, self.premium_rates[premium_tier])
+
+        # "In the event the calculated maximum per order is less than the minimum
+        # per order, the maximum per order will be assessed."
+        return min(
+            max(self.minimum, rate * fill_qty),
+            self.maximum_percent * fill_qty * fill_px * multiplier,
+        )
+
+    def commissions(
+        self,
+        fill_qty: npt.NDArray[np.float64],
+        fill_px: npt.NDArray[np.float64],
+        multiplier: npt.NDArray[np.float64],
+        monthly_volume: npt.NDArray[np.float64],
+    ) -> npt.NDArray[np.float64]:
+        """Calculate the commissions of arrays of fills."""
+        rates = np.asarray(self.volume_rates)[
+            np.searchsorted(self.volume_limits, monthly_volume, side="left")
+        ]
+
+        if self.premium_rates:
+            premium_rates = np.append(self.premium_rates, np.inf)[
+                np.searchsorted(self.premium_limits, fill_px, side="right")
+            ]
+            rates = np.minimum(rates, premium_rates)
+
+        return np.minimum(
+            np.maximum(self.minimum, rates * fill_qty),
+            self.maximum_percent * fill_qty * fill_px * multiplier,
+        )
+
+
+# IBKR Pro's US commissions (USD), without exchange, clearing and regulatory fees
+# (which the fixed futures rate includes).
+commission_schedules = {
+    Pricing.FIXED: {
+        InstrumentKind.EQUITY: CommissionSchedule(
+            volume_rates=(0.005,),
+            minimum=1.0,
+            maximum_percent=0.01,
+        ),
+        InstrumentKind.FUTURE: CommissionSchedule(volume_rates=(0.85,)),
+        InstrumentKind.OPTION: CommissionSchedule(
+            volume_rates=(0.65,),
+            minimum=1.0,
+            premium_limits=(0.05, 0.10),
+            premium_rates=(0.25, 0.50),
+        ),
+    },
+    Pricing.TIERED: {
+        InstrumentKind.EQUITY: CommissionSchedule(
+            volume_rates=(0.0035, 0.002, 0.0015, 0.001, 0.0005),
+            volume_limits=(300_000, 3_000_000, 20_000_000, 100_000_000),
+            minimum=0.35,
+            maximum_percent=0.01,
+        ),
+        InstrumentKind.FUTURE: CommissionSchedule(
+            volume_rates=(0.85, 0.65, 0.45, 0.25),
+            volume_limits=(1_000, 10_000, 20_000),
+        ),
+        InstrumentKind.OPTION: CommissionSchedule(
+            volume_rates=(0.65, 0.50, 0.25, 0.15),
+            volume_limits=(10_000, 50_000, 100_000),
+            minimum=1.0,
+            premium_limits=(0.05, 0.10),
+            premium_rates=(0.25, 0.50),
+        ),
+    },
+}
+
+
+def get_instrument_kind(instrument: Instrument) -> InstrumentKind | None:
+    """Return the kind of commission schedule that applies to the instrument."""
+    match instrument:
+        case Equity():
+            return InstrumentKind.EQUITY
+        case FuturesContract():
+            return InstrumentKind.FUTURE
+        case OptionContract():
+            return InstrumentKind.OPTION
+        case _:
+            return None
+
+
+def commissions(
+    fill_qty: npt.ArrayLike,
+    fill_px: npt.ArrayLike,
+    instrument_kind: npt.ArrayLike,
+    multiplier: npt.ArrayLike = 1.0,
+    monthly_volume: npt.ArrayLike = 0.0,
+    pricing: Pricing = Pricing.FIXED,
+) -> npt.NDArray[np.float64]:
+    """Calculate the commissions (USD) of many fills without the fee model.
+
+    This is for re-pricing the fills of post-trade analytics and parameter sweeps.
+    The arguments are broadcast against each other, and fills of other kinds of
+    instrument are free, as they are in `InteractiveBrokersFeeModel`.
+
+    Args:
+        fill_qty: The filled quantities (shares or contracts).
+        fill_px: The fill prices (the premiums per share, for options).
+        instrument_kind: The `InstrumentKind` members (or their values) of the fills'
+            instruments, with `None` (or 0) for other kinds of instrument.
+        multiplier: The instruments' multipliers.
+        monthly_volume: The month's volume of that kind of instrument before each
+            fill, which determines the tier of tiered pricing.
+        pricing: Whether to use fixed or tiered pricing.
+
+    Raises:
+        ValueError: If an instrument kind isn't an `InstrumentKind` (or its value).
+    """
+    fill_qty, fill_px, instrument_kind, multiplier, monthly_volume = (
+        np.broadcast_arrays(
+            np.asarray(fill_qty, dtype=np.float64),
+            np.asarray(fill_px, dtype=np.float64),
+            _to_kind_values(instrument_kind),
+            np.asarray(multiplier, dtype=np.float64),
+            np.asarray(monthly_volume, dtype=np.float64),
+        )
+    )
+
+    result = np.zeros(fill_qty.shape)
+
+    for kind, schedule in commission_schedules[pricing].items():
+        mask = instrument_kind == kind.value
+
+        if mask.any():
+            result[mask] = schedule.commissions(
+                fill_qty[mask], fill_px[mask], multiplier[mask], monthly_volume[mask]
+            )
+
+    return result
+
+
+def _to_kind_values(instrument_kind: npt.ArrayLike) -> npt.NDArray:
+    # `InstrumentKind` members (and `None`) are converted to their integer values.
+    array = np.asarray(instrument_kind)
+
+    # Integer arrays are already values (as are empty ones).
+    if array.dtype.kind in "iu" or array.size == 0:
+        return array
+
+    if array.dtype != object:
+        raise ValueError(
+            f"Invalid instrument kinds. Choose from: {list(InstrumentKind)}, or "
+            f"their values"
+        )
+
+    return np.fromiter(
+        (0 if kind is None else InstrumentKind(kind).value for kind in array.flat),
+        dtype=np.int64,
+        count=array.size,
+    ).reshape(array.shape)
+
+
 class InteractiveBrokersFeeModel(FeeModel):
-    def __init__(self) -> None:
-        """Interactive Brokers Pro Fixed custom fee model (USD)."""
+    def __init__(self, pricing: Pricing = Pricing.FIXED) -> None:
+        """Interactive Brokers Pro custom fee model (USD).
+
+        Equities, futures and options are charged on IBKR Pro's fixed or tiered
+        schedules, and other instruments are free. Tiered pricing follows each kind of
+        instrument's volume over the calendar month of the order's last event.
+
+        Args:
+            pricing: Whether to use fixed or tiered pricing.
+        """
         super().__init__()
 
-        self.share_commission = 0.005  # USD
-        self.minimum_fee_per_order = 1.000  # USD
-        self.maximum_fee_percent_per_order = 0.01  # %
+        self.pricing = pricing
+        self.schedules = commission_schedules[pricing]
+        self.currency = Currency.from_str("USD")
+
+        self.monthly_volumes: dict[InstrumentKind, float] = {}
+        self._month: np.datetime64 | None = None
 
     def get_commission(
         self,
@@ -25,33 +261,27 @@ class InteractiveBrokersFeeModel(FeeModel):
         fill_px: Price,
         instrument: Instrument,
     ) -> Money:
-        # fill_qty = float(order.quantity)
-
-        match instrument:
-            case Equity():
-                # "In the event the calculated maximum per order is less than
-                # the minimum per order, the maximum per order will be
-                # assessed."
-                commission = min(
-                    max(
-                        self.minimum_fee_per_order,  # min of $1
-                        self.share_commission
-                        * fill_qty.as_double(),  # $0.005 per share
-                    ),
-                    self.maximum_fee_percent_per_order
-                    * fill_qty.as_double()
-                    * fill_px.as_double(),  # max of 1%
-                )
-
-            # TODO - Implement futures contract fee model.
-            case FuturesContract():
-                commission = 0
-
-            # TODO - Implement options contract fee model.
-            case OptionContract():
-                commission = 0
-
-            case _:
-                commission = 0
-
-        return Money(commission, Currency.from_str("USD"))
+        kind = get_instrument_kind(instrument)
+
+        if kind is None:
+            return Money(0, self.currency)
+
+        month = np.datetime64(order.ts_last, "ns").astype("datetime64[M]")
+
+        if month != self._month:
+            self._month = month
+            self.monthly_volumes.clear()
+
+        quantity = fill_qty.as_double()
+        monthly_volume = self.monthly_volumes.get(kind, 0.0)
+
+        commission = self.schedules[kind].commission(
+            quantity,
+            fill_px.as_double(),
+            instrument.multiplier.as_double(),
+            monthly_volume,
+        )
+
+        self.monthly_volumes[kind] = monthly_volume + quantity
+
+        return Money(commission, self.currency)
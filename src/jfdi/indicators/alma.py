@@ -1,11 +1,11 @@
 import numpy as np
 from nautilus_trader.core.correctness import PyCondition
-from nautilus_trader.indicators.base.indicator import Indicator
-from nautilus_trader.model.data import Bar, QuoteTick, TradeTick
 from nautilus_trader.model.enums import PriceType
 
+from jfdi.indicators.rolling_window import RollingWindowIndicator
 
-class ALMA(Indicator):
+
+class ALMA(RollingWindowIndicator):
     def __init__(
         self,
         period: int,
@@ -29,16 +29,20 @@ class ALMA(Indicator):
         """
         PyCondition.positive_int(period, "period")
 
-        super().__init__(params=[period, offset, sigma, price_type])
+        super().__init__(
+            params=[period, offset, sigma, price_type],
+            window=period,
+            price_type=price_type,
+        )
 
         self.period = period
         self.offset = offset
         self.sigma = sigma
-        self.price_type = price_type
-
-        self._prices = np.full(self.period, np.nan)
 
         self._weights = self._compute_weights(self.period, self.offset, self.sigma)
+        # Since I typically have the first index as the most recent entry, I need to
+        # reverse the order of the weights.
+        self._weights_latest_first = self._weights[::-1].copy()
 
     @staticmethod
     def _compute_weights(period, offset, sigma):
@@ -56,39 +60,14 @@ class ALMA(Indicator):
         if not self.initialized:
             return np.nan
 
-        # Since I typically have the first index as the most recent entry, I need to
-        # reverse the order of the weights.
-        return np.dot(self._prices[::-1], self._weights)
-
-    def handle_quote_tick(self, tick: QuoteTick):
-        """Update the indicator with the given quote tick."""
-        PyCondition.not_none(tick, "tick")
-
-        self.update_raw(tick.extract_price(self.price_type).as_double())
-
-    def handle_trade_tick(self, tick: TradeTick):
-        """Update the indicator with the given trade tick."""
-        PyCondition.not_none(tick, "tick")
-
-        self.update_raw(tick.price.as_double())
-
-    def handle_bar(self, bar: Bar):
-        """Update the indicator with the given bar."""
-        PyCondition.not_none(bar, "bar")
-
-        self.update_raw(bar.close.as_double())
+        return np.dot(self._prices.latest_first(), self._weights_latest_first)
 
     def update_raw(self, value: float):
         """Update the indicator with the given raw value."""
-        self._prices[1:] = self._prices[:-1]
-        self._prices[0] = value
+        self._prices.append(value)
 
         if not self.initialized:
             self._set_has_inputs(True)
 
-            if not np.isnan(self._prices).any():
+            if self._prices.full:
                 self._set_initialized(True)
-
-    def _reset(self):
-        """Reset stateful values in the class."""
-        self._prices[:] = np.nan
@@ -0,0 +1,191 @@
+import numpy as np
+import numpy.typing as npt
+from nautilus_trader.core.correctness import PyCondition
+from scipy.linalg import cholesky, solve_triangular
+
+
+class RollingCovariance:
+    def __init__(
+        self,
+        n_features: int,
+        window: int,
+        refresh_period: int | None = None,
+    ):
+        """The covariance of the latest `window` observations of a random vector.
+
+        Rather than refitting the window on every update, the running sums of the
+        observations, their outer products, and their fourth moments are updated with
+        a rank-1 addition (and removal, once the window's full). That's O(N^2) per
+        update, and it's all that the empirical and Ledoit-Wolf covariance need.
+
+        Removals accumulate rounding errors, so the sums are recomputed from the
+        window every `refresh_period` updates, which is O(N^2) amortised when the
+        refresh period is at least the window.
+
+        Like `RingBuffer`, every observation is written twice, which keeps the window
+        contiguous.
+
+        Args:
+            n_features: The number of features (greater than zero).
+            window: The number of observations to keep (greater than one).
+            refresh_period: How often to recompute the sums (defaults to `window`).
+
+        Raises:
+            ValueError: If `n_features` or `refresh_period` is not a positive integer,
+                or if `window` is not greater than one.
+        """
+        PyCondition.positive_int(n_features, "n_features")
+        PyCondition.is_true(window > 1, f"window={window} must be > 1")
+        if refresh_period is not None:
+            PyCondition.positive_int(refresh_period, "refresh_period")
+
+        self.n_features = n_features
+        self.window = window
+        self.refresh_period = refresh_period or window
+
+        self._observations = np.zeros((2 * window, n_features))
+        self._head = -1
+        self.count = 0
+        self._n_updates = 0
+
+        self._sum = np.zeros(n_features)
+        self._sum_outer = np.zeros((n_features, n_features))
+        # The sums of |x|^2 * x and |x|^4, for the Ledoit-Wolf shrinkage.
+        self._sum_norm2_x = np.zeros(n_features)
+        self._sum_norm4 = 0.0
+
+    def __len__(self) -> int:
+        return min(self.count, self.window)
+
+    @property
+    def initialized(self) -> bool:
+        """Whether the window is full."""
+        return self.count >= self.window
+
+    def update(self, x: npt.ArrayLike) -> None:
+        """Add an observation, removing the oldest one if the window's full."""
+        x = np.asarray(x, dtype=np.float64)
+
+        self._head = (self._head + 1) % self.window
+
+        if self.count >= self.window:
+            self._add(self._observations[self._head], sign=-1.0)
+
+        self._observations[self._head] = x
+        self._observations[self._head + self.window] = x
+        self.count += 1
+
+        self._add(x)
+
+        self._n_updates += 1
+        if self._n_updates >= self.refresh_period:
+            self._refresh()
+
+    def _add(self, x: npt.NDArray[np.float64], sign: float = 1.0) -> None:
+        norm2 = x @ x
+
+        self._sum += sign * x
+        self._sum_outer += sign * np.outer(x, x)
+        self._sum_norm2_x += (sign * norm2) * x
+        self._sum_norm4 += sign * norm2 * norm2
+
+    def _refresh(self) -> None:
+        values = self.view()
+        norm2 = np.einsum("ij,ij->i", values, values)
+
+        self._sum = values.sum(axis=0)
+        self._sum_outer = values.T @ values
+        self._sum_norm2_x = norm2 @ values
+        self._sum_norm4 = norm2 @ norm2
+
+        self._n_updates = 0
+
+    def view(self) -> npt.NDArray[np.float64]:
+        """Return the window of observations (oldest first) without copying.
+
+        The view is only valid until the next update.
+        """
+        end = self._head + 1 + self.window
+
+        return self._observations[end - len(self) : end]
+
+    def mean(self) -> npt.NDArray[np.float64]:
+        return self._sum / len(self)
+
+    def covariance(self) -> npt.NDArray[np.float64]:
+        """Return the maximum likelihood covariance (normalised by `n`, not `n - 1`)."""
+        mean = self.mean()
+
+        return self._sum_outer / len(self) - np.outer(mean, mean)
+
+    def ledoit_wolf(self) -> tuple[npt.NDArray[np.float64], float]:
+        """Return the Ledoit-Wolf covariance and its shrinkage.
+
+        This matches `sklearn.covariance.LedoitWolf().fit(self.view())`, but the
+        shrinkage is computed from the running sums rather than the observations.
+
+        Returns:
+            The shrunk covariance and the shrinkage coefficient.
+        """
+        n = len(self)
+        p = self.n_features
+
+        mean = self.mean()
+        emp_cov = self.covariance()
+
+        if p == 1:
+            return emp_cov, 0.0
+
+        trace = np.trace(emp_cov)
+        mu = trace / p
+
+        # The sum over the observations of |x - mean|^4, expanded so that it only
+        # needs the running sums.
+        norm2_mean = mean @ mean
+        beta_ = (
+            self._sum_norm4
+            + 4 * (mean @ self._sum_outer @ mean)
+            - 4 * (self._sum_norm2_x @ mean)
+            + 2 * norm2_mean * np.trace(self._sum_outer)
+            - 3 * n * norm2_mean**2
+        )
+        delta_ = np.sum(emp_cov**2)
+
+        beta = (beta_ / n - delta_) / (p * n)
+        delta = (delta_ - 2 * mu * trace + p * mu**2) / p
+        beta = min(beta, delta)
+        shrinkage = 0.0 if beta == 0 else beta / delta
+
+        shrunk_cov = (1 - shrinkage) * emp_cov
+        shrunk_cov.flat[:: p + 1] += shrinkage * mu
+
+        return shrunk_cov, shrinkage
+
+    def reset(self) -> None:
+        self._head = -1
+        self.count = 0
+        self._n_updates = 0
+
+        self._sum[:] = 0
+        self._sum_outer[:] = 0
+        self._sum_norm2_x[:] = 0
+        self._sum_norm4 = 0.0
+
+
+def mahalanobis_squared(
+    u: npt.ArrayLike,
+    v: npt.ArrayLike,
+    cov: npt.NDArray[np.float64],
+) -> float:
+    """Return the squared Mahalanobis distance between two vectors.
+
+    The covariance is factorised rather than inverted: if `cov = L L^T` then the
+    distance is `|L^-1 (u - v)|^2`, which only needs a triangular solve.
+
+    Raises:
+        numpy.linalg.LinAlgError: If `cov` isn't positive definite.
+    """
+    lower = cholesky(cov, lower=True, check_finite=False)
+    z = solve_triangular(lower, np.subtract(u, v), lower=True, check_finite=False)
+
+    return float(z @ z)
@@ -0,0 +1,102 @@
+from collections.abc import Callable
+
+import numpy as np
+import numpy.typing as npt
+from nautilus_trader.core.correctness import PyCondition
+
+
+class CrossSectionalBuffer:
+    def __init__(self, n_instruments: int, window: int):
+        """A (instruments x window) matrix of the latest prices of each instrument.
+
+        Each row is a circular buffer with its own head, so instruments don't have to
+        arrive in lockstep. Like `RingBuffer`, every value is written twice, which
+        keeps each row's window contiguous.
+
+        Args:
+            n_instruments: The number of instruments (greater than zero).
+            window: The number of prices to keep per instrument (greater than zero).
+
+        Raises:
+            ValueError: If `n_instruments` or `window` is not a positive integer.
+        """
+        PyCondition.positive_int(n_instruments, "n_instruments")
+        PyCondition.positive_int(window, "window")
+
+        self.n_instruments = n_instruments
+        self.window = window
+
+        self._prices = np.full((n_instruments, 2 * window), np.nan)
+        self._heads = np.full(n_instruments, -1)
+        self._last_ts_events = np.zeros(n_instruments, dtype=np.uint64)
+        self.counts = np.zeros(n_instruments, dtype=np.int64)
+
+        self._rows = np.arange(n_instruments)[:, None]
+        self._offsets = np.arange(1, window + 1)
+
+    @property
+    def initialized(self) -> bool:
+        """Whether every instrument has a full window of prices."""
+        return bool(self.counts.min() >= self.window)
+
+    def update(self, index: int, ts_event: int, value: float) -> None:
+        """Add an instrument's price, replacing its latest one if it's a revision."""
+        if self.counts[index] == 0 or ts_event != self._last_ts_events[index]:
+            self._heads[index] = (self._heads[index] + 1) % self.window
+            self.counts[index] += 1
+
+        head = self._heads[index]
+        self._prices[index, head] = value
+        self._prices[index, head + self.window] = value
+        self._last_ts_events[index] = ts_event
+
+    def matrix(self) -> npt.NDArray[np.float64]:
+        """Return every instrument's window of prices (oldest first)."""
+        return self._prices[self._rows, self._heads[:, None] + self._offsets]
+
+    def reset(self) -> None:
+        self._prices[:] = np.nan
+        self._heads[:] = -1
+        self._last_ts_events[:] = 0
+        self.counts[:] = 0
+
+
+# These kernels reproduce the TA-Lib functions of the same name over the last axis,
+# where the prices are ordered oldest first.
+def sma(prices: npt.NDArray[np.float64], timeperiod: int) -> npt.NDArray[np.float64]:
+    return prices[..., -timeperiod:].mean(axis=-1)
+
+
+def mom(prices: npt.NDArray[np.float64], timeperiod: int) -> npt.NDArray[np.float64]:
+    return prices[..., -1] - prices[..., -timeperiod - 1]
+
+
+def roc(prices: npt.NDArray[np.float64], timeperiod: int) -> npt.NDArray[np.float64]:
+    return ((prices[..., -1] / prices[..., -timeperiod - 1]) - 1) * 100
+
+
+def rocp(prices: npt.NDArray[np.float64], timeperiod: int) -> npt.NDArray[np.float64]:
+    previous = prices[..., -timeperiod - 1]
+    return (prices[..., -1] - previous) / previous
+
+
+def rocr(prices: npt.NDArray[np.float64], timeperiod: int) -> npt.NDArray[np.float64]:
+    return prices[..., -1] / prices[..., -timeperiod - 1]
+
+
+# The kernel for each TA-Lib function, and the number of prices it needs.
+cross_sectional_kernels: dict[str, tuple[Callable, Callable[[int], int]]] = {
+    "SMA": (sma, lambda timeperiod: timeperiod),
+    "MOM": (mom, lambda timeperiod: timeperiod + 1),
+    "ROC": (roc, lambda timeperiod: timeperiod + 1),
+    "ROCP": (rocp, lambda timeperiod: timeperiod + 1),
+    "ROCR": (rocr, lambda timeperiod: timeperiod + 1),
+}
+
+
+def rank_descending(values: npt.NDArray[np.float64]) -> npt.NDArray[np.intp]:
+    """Return the indices that sort the values from highest to lowest.
+
+    Ties keep their original order, and NaNs are ranked last.
+    """
+    return np.argsort(-values, kind="stable")
@@ -1,11 +1,13 @@
 import numpy as np
+import numpy.typing as npt
 from nautilus_trader.core.correctness import PyCondition
-from nautilus_trader.indicators.base.indicator import Indicator
-from nautilus_trader.model.data import Bar, QuoteTick, TradeTick
 from nautilus_trader.model.enums import PriceType
+from scipy.signal import lfilter, lfiltic
 
+from jfdi.indicators.rolling_window import PriceIndicator
 
-class HighPass(Indicator):
+
+class HighPass(PriceIndicator):
     def __init__(
         self,
         period: int,
@@ -19,59 +21,72 @@ class HighPass(Indicator):
         """
         PyCondition.positive_int(period, "period")
 
-        super().__init__(params=[period, price_type])
+        super().__init__(params=[period, price_type], price_type=price_type)
 
         self.short_name = "hp_f"
 
         self.period = period
-        self.price_type = price_type
-
-        self._prices = np.full(3, np.nan)
-        self._high_pass = np.zeros(2)
 
         self._coefficients = compute_filter_coefficients(self.period)
+        self._high_pass = HighPassFilter(self._coefficients)
 
     @property
     def value(self) -> float:
         if not self.initialized:
             return np.nan
 
-        return self._high_pass[0]
+        return self._high_pass.value
 
-    def handle_quote_tick(self, tick: QuoteTick):
-        PyCondition.not_none(tick, "tick")
+    def update_raw(self, value: float):
+        self._high_pass.update(value)
 
-        self.update_raw(tick.extract_price(self.price_type).as_double())
+        if not self.initialized:
+            self._set_has_inputs(True)
 
-    def handle_trade_tick(self, tick: TradeTick):
-        PyCondition.not_none(tick, "tick")
+            if self._high_pass.count >= 3:
+                self._set_initialized(True)
 
-        self.update_raw(tick.price.as_double())
+    def _reset(self):
+        self._high_pass.reset()
 
-    def handle_bar(self, bar: Bar):
-        PyCondition.not_none(bar, "bar")
 
-        self.update_raw(bar.close.as_double())
+class HighPassFilter:
+    """The state of a high-pass filter, which is updated in place.
 
-    def update_raw(self, value: float):
-        self._prices[1:] = self._prices[:-1]
-        self._prices[0] = value
+    The state is held in plain floats, as NumPy scalars are slower to do arithmetic
+    with, and updating it doesn't allocate anything. The filter starts at the third
+    price, with no previous output.
+    """
 
-        if not self.initialized:
-            self._set_has_inputs(True)
+    __slots__ = ("c1", "c2", "c3", "count", "price_1", "price_2", "value", "value_1")
 
-            if not np.isnan(self._prices).any():
-                self._set_initialized(True)
+    def __init__(self, coefficients):
+        self.c1, self.c2, self.c3 = map(float, coefficients)
 
-        self._high_pass = self.update_high_pass(
-            self._prices,
-            self._high_pass,
-            self._coefficients,
-        )
+        self.reset()
 
-    def _reset(self):
-        self._prices[:] = np.nan
-        self._high_pass[:] = 0.0
+    def update(self, price: float) -> float:
+        """Add the latest price and return the filter's latest value."""
+        self.count += 1
+
+        if self.count >= 3:
+            value = (
+                self.c1 * (price - 2 * self.price_1 + self.price_2)
+                + self.c2 * self.value
+                + self.c3 * self.value_1
+            )
+            self.value_1 = self.value
+            self.value = value
+
+        self.price_2 = self.price_1
+        self.price_1 = price
+
+        return self.value
+
+    def reset(self):
+        self.count = 0
+        self.price_1 = self.price_2 = np.nan
+        self.value = self.value_1 = 0.0
 
 
 def compute_filter_coefficients(period):
@@ -92,13 +107,44 @@ def compute_filter_coefficients(period):
     return c1, c2, c3
 
 
-def update_high_pass(prices, previous_high_pass, coefficients):
-    """Incrementally compute the high-pass filter."""
+def high_pass_transfer_function(coefficients):
+    """Return the numerator and denominator of the high-pass filter's recursion."""
     c1, c2, c3 = coefficients
 
-    high_pass = (
-        c1 * (prices[0] - 2 * prices[1] + prices[2])
-        + c2 * previous_high_pass[0]
-        + c3 * previous_high_pass[1]
+    return [c1, -2 * c1, c1], [1.0, -c2, -c3]
+
+
+def apply_filter(series, transfer_function) -> npt.NDArray[np.float64]:
+    """Run a second-order filter over a series, as the streaming indicators do.
+
+    The indicators start filtering at the third price, with no previous output, so
+    the first two prices only provide the initial conditions.
+    """
+    b, a = transfer_function
+
+    x = np.asarray(series, dtype=np.float64)
+    y = np.full(len(x), np.nan)
+
+    if len(x) < 3:
+        return y
+
+    zi = lfiltic(b, a, y=[0.0, 0.0], x=x[1::-1])
+    y[2:], _ = lfilter(b, a, x[2:], zi=zi)
+
+    return y
+
+
+def high_pass(series: npt.ArrayLike, period: int) -> npt.NDArray[np.float64]:
+    """Return the high-pass filter of a series, as `HighPass` would after each value.
+
+    Values before the indicator's initialised are NaN.
+
+    Args:
+        series: The prices, oldest first.
+        period: Lookback.
+    """
+    PyCondition.positive_int(period, "period")
+
+    return apply_filter(
+        series, high_pass_transfer_function(compute_filter_coefficients(period))
     )
-    return np.array([high_pass, previous_high_pass[0]])
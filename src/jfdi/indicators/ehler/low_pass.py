@@ -1,13 +1,13 @@
 import numpy as np
+import numpy.typing as npt
 from nautilus_trader.core.correctness import PyCondition
-from nautilus_trader.indicators.base.indicator import Indicator
-from nautilus_trader.model.data import Bar, QuoteTick, TradeTick
 from nautilus_trader.model.enums import PriceType
 
-from jfdi.indicators.ehler.high_pass import compute_filter_coefficients
+from jfdi.indicators.ehler.high_pass import apply_filter, compute_filter_coefficients
+from jfdi.indicators.rolling_window import PriceIndicator
 
 
-class LowPass(Indicator):
+class LowPass(PriceIndicator):
     def __init__(
         self,
         period: int,
@@ -21,70 +21,93 @@ class LowPass(Indicator):
         """
         PyCondition.positive_int(period, "period")
 
-        super().__init__(params=[period, price_type])
+        super().__init__(params=[period, price_type], price_type=price_type)
 
         self.short_name = "bp_f"
 
         self.period = period
-        self.price_type = price_type
-
-        self._prices = np.full(3, np.nan)
-        self._low_pass = np.zeros(2)
 
         self._coefficients = compute_filter_coefficients(self.period)
+        self._low_pass = LowPassFilter(self._coefficients)
 
     @property
     def value(self) -> float:
         if not self.initialized:
             return np.nan
 
-        return self._low_pass[0]
+        return self._low_pass.value
 
-    def handle_quote_tick(self, tick: QuoteTick):
-        PyCondition.not_none(tick, "tick")
+    def update_raw(self, value: float):
+        self._low_pass.update(value)
 
-        self.update_raw(tick.extract_price(self.price_type).as_double())
+        if not self.initialized:
+            self._set_has_inputs(True)
 
-    def handle_trade_tick(self, tick: TradeTick):
-        PyCondition.not_none(tick, "tick")
+            if self._low_pass.count >= 3:
+                self._set_initialized(True)
 
-        self.update_raw(tick.price.as_double())
+    def _reset(self):
+        self._low_pass.reset()
 
-    def handle_bar(self, bar: Bar):
-        PyCondition.not_none(bar, "bar")
 
-        self.update_raw(bar.close.as_double())
+class LowPassFilter:
+    """The state of a low-pass filter, which is updated in place.
 
-    def update_raw(self, value: float):
-        self._prices[1:] = self._prices[:-1]
-        self._prices[0] = value
+    Like `HighPassFilter`, the state is held in plain floats and the filter starts at
+    the third price.
+    """
 
-        if not self.initialized:
-            self._set_has_inputs(True)
+    __slots__ = ("c1", "c2", "c3", "count", "price_1", "price_2", "value", "value_1")
 
-            if not np.isnan(self._prices).any():
-                self._set_initialized(True)
+    def __init__(self, coefficients):
+        self.c1, self.c2, self.c3 = map(float, coefficients)
 
-        self._low_pass = update_low_pass(
-            self._prices,
-            self._low_pass,
-            self._coefficients,
-        )
+        self.reset()
 
-    def _reset(self):
-        self._prices[:] = np.nan
-        self._low_pass[:] = 0.0
+    def update(self, price: float) -> float:
+        """Add the latest price and return the filter's latest value."""
+        self.count += 1
+
+        if self.count >= 3:
+            value = (
+                (1 - self.c1) * price
+                + (2 * self.c1 - self.c2) * self.price_1
+                - (self.c1 + self.c3) * self.price_2
+                + self.c2 * self.value
+                + self.c3 * self.value_1
+            )
+            self.value_1 = self.value
+            self.value = value
+
+        self.price_2 = self.price_1
+        self.price_1 = price
+
+        return self.value
+
+    def reset(self):
+        self.count = 0
+        self.price_1 = self.price_2 = np.nan
+        self.value = self.value_1 = 0.0
 
 
-def update_low_pass(prices, previous_low_pass, coefficients):
-    """Incrementally compute the low-pass filter."""
+def low_pass_transfer_function(coefficients):
+    """Return the numerator and denominator of the low-pass filter's recursion."""
     c1, c2, c3 = coefficients
 
-    low_pass = (
-        (1 - c1) * prices[0]
-        + (2 * c1 - c2) * prices[1]
-        - (c1 + c3) * prices[2]
-        + c2 * previous_low_pass[0]
-        + c3 * previous_low_pass[1]
+    return [1 - c1, 2 * c1 - c2, -(c1 + c3)], [1.0, -c2, -c3]
+
+
+def low_pass(series: npt.ArrayLike, period: int) -> npt.NDArray[np.float64]:
+    """Return the low-pass filter of a series, as `LowPass` would after each value.
+
+    Values before the indicator's initialised are NaN.
+
+    Args:
+        series: The prices, oldest first.
+        period: Lookback.
+    """
+    PyCondition.positive_int(period, "period")
+
+    return apply_filter(
+        series, low_pass_transfer_function(compute_filter_coefficients(period))
     )
-    return np.array([low_pass, previous_low_pass[0]])
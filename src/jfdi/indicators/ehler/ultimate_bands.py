@@ -1,14 +1,15 @@
 import numpy as np
+import numpy.typing as npt
 from nautilus_trader.core.correctness import PyCondition
-from nautilus_trader.indicators.base.indicator import Indicator
-from nautilus_trader.model.data import Bar, QuoteTick, TradeTick
 from nautilus_trader.model.enums import PriceType
+from numpy.lib.stride_tricks import sliding_window_view
 
 from jfdi.indicators.ehler.high_pass import compute_filter_coefficients
-from jfdi.indicators.ehler.low_pass import update_low_pass
+from jfdi.indicators.ehler.low_pass import LowPassFilter, low_pass
+from jfdi.indicators.rolling_window import RollingWindowIndicator
 
 
-class UltimateBands(Indicator):
+class UltimateBands(RollingWindowIndicator):
     def __init__(
         self,
         period: int,
@@ -28,32 +29,33 @@ class UltimateBands(Indicator):
         PyCondition.positive_int(period, "period")
         PyCondition.positive(n_deviations, "n_deviations")
 
-        super().__init__(params=[period, n_deviations, price_type])
+        super().__init__(
+            params=[period, n_deviations, price_type],
+            window=period,
+            price_type=price_type,
+        )
 
         self.short_name = "u_bnd"
 
         self.period = period
         self.n_deviations = n_deviations
-        self.price_type = price_type
-
-        self._prices = np.full(period, np.nan)
-        self._centre = np.zeros(2)
 
         self._coefficients = compute_filter_coefficients(period)
+        self._centre = LowPassFilter(self._coefficients)
 
     @property
     def standard_deviation(self) -> float:
         if not self.initialized:
             return np.nan
 
-        return np.sqrt(np.mean((self._prices - self._centre[0]) ** 2))
+        return np.sqrt(np.mean((self._prices.latest_first() - self._centre.value) ** 2))
 
     @property
     def centre(self) -> float:
         if not self.initialized:
             return np.nan
 
-        return self._centre[0]
+        return self._centre.value
 
     @property
     def upper_band(self) -> float:
@@ -69,40 +71,56 @@ class UltimateBands(Indicator):
 
         return self.centre - self.n_deviations * self.standard_deviation
 
-    def handle_quote_tick(self, tick: QuoteTick):
-        PyCondition.not_none(tick, "tick")
+    def update_raw(self, value: float):
+        self._prices.append(value)
+        self._centre.update(value)
 
-        self.update_raw(tick.extract_price(self.price_type).as_double())
+        if not self.initialized:
+            self._set_has_inputs(True)
 
-    def handle_trade_tick(self, tick: TradeTick):
-        PyCondition.not_none(tick, "tick")
+            # The filter needs three prices.
+            if self._centre.count >= 3:
+                self._set_initialized(True)
 
-        self.update_raw(tick.price.as_double())
+    def _reset(self):
+        super()._reset()
+        self._centre.reset()
 
-    def handle_bar(self, bar: Bar):
-        PyCondition.not_none(bar, "bar")
 
-        self.update_raw(bar.close.as_double())
+def ultimate_bands(
+    series: npt.ArrayLike,
+    period: int,
+    n_deviations: float = 1.0,
+) -> tuple[npt.NDArray[np.float64], ...]:
+    """Return Ehler's 'Ultimate Bands' of a series, as the indicator would.
 
-    def update_raw(self, value: float):
-        self._prices[1:] = self._prices[:-1]
-        self._prices[0] = value
+    Values before the indicator's initialised are NaN, as are the bands until there's
+    a full period of prices.
 
-        if not self.initialized:
-            self._set_has_inputs(True)
+    Args:
+        series: The prices, oldest first.
+        period: Lookback.
+        n_deviations: The number of standard deviations to take from the centre.
 
-            if np.count_nonzero(~np.isnan(self._prices)) < 3:
-                return
+    Returns:
+        The centre, upper band and lower band.
+    """
+    PyCondition.positive_int(period, "period")
+    PyCondition.positive(n_deviations, "n_deviations")
 
-        self._centre = update_low_pass(
-            self._prices,
-            self._centre,
-            self._coefficients,
-        )
+    prices = np.asarray(series, dtype=np.float64)
 
-        if not self.initialized:
-            self._set_initialized(True)
+    centre = low_pass(prices, period)
+    standard_deviation = np.full(len(prices), np.nan)
 
-    def _reset(self):
-        self._prices[:] = np.nan
-        self._centre[:] = 0.0
+    if len(prices) >= period:
+        windows = sliding_window_view(prices, period)
+        standard_deviation[period - 1 :] = np.sqrt(
+            np.mean((windows - centre[period - 1 :, None]) ** 2, axis=-1)
+        )
+
+    return (
+        centre,
+        centre + n_deviations * standard_deviation,
+        centre - n_deviations * standard_deviation,
+    )
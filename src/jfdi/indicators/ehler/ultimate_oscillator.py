@@ -1,16 +1,18 @@
 import numpy as np
+import numpy.typing as npt
 from nautilus_trader.core.correctness import PyCondition
-from nautilus_trader.indicators.base.indicator import Indicator
-from nautilus_trader.model.data import Bar, QuoteTick, TradeTick
 from nautilus_trader.model.enums import PriceType
+from numpy.lib.stride_tricks import sliding_window_view
 
 from jfdi.indicators.ehler.high_pass import (
+    HighPassFilter,
     compute_filter_coefficients,
-    update_high_pass,
+    high_pass,
 )
+from jfdi.indicators.rolling_window import PriceIndicator, RollingWindow
 
 
-class UltimateOscillator(Indicator):
+class UltimateOscillator(PriceIndicator):
     def __init__(
         self,
         edge: int,
@@ -30,82 +32,95 @@ class UltimateOscillator(Indicator):
         PyCondition.positive_int(width, "width")
         PyCondition.positive_int(root_mean_square_period, "root_mean_square_period")
 
-        super().__init__(params=[edge, width, root_mean_square_period, price_type])
+        super().__init__(
+            params=[edge, width, root_mean_square_period, price_type],
+            price_type=price_type,
+        )
 
         self.short_name = "u_osc"
 
         self.edge = edge
         self.width = width
         self.root_mean_square_period = root_mean_square_period
-        self.price_type = price_type
-
-        self._prices = np.full(3, np.nan)
 
-        self._high_pass_edge = np.zeros(2)
-        self._high_pass_width_edge = np.zeros(2)
-
-        self._signals = np.full(root_mean_square_period, np.nan)
+        self._signals = RollingWindow(root_mean_square_period)
 
         self._coefficients_edge = compute_filter_coefficients(self.edge)
         self._coefficients_width_edge = compute_filter_coefficients(
             self.width * self.edge
         )
 
+        self._high_pass_edge = HighPassFilter(self._coefficients_edge)
+        self._high_pass_width_edge = HighPassFilter(self._coefficients_width_edge)
+
     @property
     def value(self) -> float:
         if not self.initialized:
             return np.nan
 
-        signal = self._signals[0]
-        root_mean_square = np.sqrt(np.mean(self._signals**2)) or 1e-10
-
-        return signal / root_mean_square
-
-    def handle_quote_tick(self, tick: QuoteTick):
-        PyCondition.not_none(tick, "tick")
-
-        self.update_raw(tick.extract_price(self.price_type).as_double())
+        signals = self._signals.latest_first()
 
-    def handle_trade_tick(self, tick: TradeTick):
-        PyCondition.not_none(tick, "tick")
+        signal = signals[0]
+        root_mean_square = np.sqrt(np.mean(signals**2)) or 1e-10
 
-        self.update_raw(tick.price.as_double())
-
-    def handle_bar(self, bar: Bar):
-        PyCondition.not_none(bar, "bar")
-
-        self.update_raw(bar.close.as_double())
+        return signal / root_mean_square
 
     def update_raw(self, value: float):
-        self._prices[1:] = self._prices[:-1]
-        self._prices[0] = value
+        high_pass_edge = self._high_pass_edge.update(value)
+        high_pass_width_edge = self._high_pass_width_edge.update(value)
 
         if not self.initialized:
             self._set_has_inputs(True)
 
-            if np.count_nonzero(~np.isnan(self._prices)) < 3:
+            # The filters need three prices.
+            if self._high_pass_edge.count < 3:
                 return
 
-        self._high_pass_edge = update_high_pass(
-            self._prices,
-            self._high_pass_edge,
-            self._coefficients_edge,
-        )
-        self._high_pass_width_edge = update_high_pass(
-            self._prices,
-            self._high_pass_width_edge,
-            self._coefficients_width_edge,
-        )
-
-        self._signals[1:] = self._signals[:-1]
-        self._signals[0] = self._high_pass_width_edge[0] - self._high_pass_edge[0]
+        self._signals.append(high_pass_width_edge - high_pass_edge)
 
-        if not self.initialized:
-            if not np.isnan(self._signals).any():
-                self._set_initialized(True)
+        if not self.initialized and self._signals.full:
+            self._set_initialized(True)
 
     def _reset(self):
-        self._prices[:] = np.nan
-        self._high_pass_edge[:] = 0.0
-        self._high_pass_width_edge[:] = 0.0
-        self._signals[:] = np.nan
+        self._high_pass_edge.reset()
+        self._high_pass_width_edge.reset()
+        self._signals.clear()
+
+
+def ultimate_oscillator(
+    series: npt.ArrayLike,
+    edge: int,
+    width: int,
+    root_mean_square_period: int = 100,
+) -> npt.NDArray[np.float64]:
+    """Return the 'Ultimate Oscillator' of a series, as the indicator would.
+
+    Values before the indicator's initialised are NaN.
+
+    Args:
+        series: The prices, oldest first.
+        edge: Edge period for high-pass filter.
+        width: Width multiplier for high-pass filter.
+        root_mean_square_period: Lookback for root-mean-square smoothing.
+    """
+    PyCondition.positive_int(edge, "edge")
+    PyCondition.positive_int(width, "width")
+    PyCondition.positive_int(root_mean_square_period, "root_mean_square_period")
+
+    signals = high_pass(series, width * edge) - high_pass(series, edge)
+    oscillator = np.full(len(signals), np.nan)
+
+    # The first two prices don't give signals.
+    n = len(signals) - 2 - root_mean_square_period + 1
+    if n <= 0:
+        return oscillator
+
+    mean_squares = sliding_window_view(signals[2:] ** 2, root_mean_square_period).mean(
+        axis=-1
+    )
+    root_mean_squares = np.sqrt(mean_squares)
+    root_mean_squares[root_mean_squares == 0] = 1e-10
+
+    oscillator[-n:] = signals[-n:] / root_mean_squares
+
+    return oscillator
@@ -1,10 +1,12 @@
+import math
+
 import numpy as np
 from nautilus_trader.core.correctness import PyCondition
 from nautilus_trader.indicators.base.indicator import Indicator
 from nautilus_trader.model.data import Bar
 
 from jfdi.indicators.ehler.high_pass import compute_filter_coefficients
-from jfdi.indicators.ehler.low_pass import update_band_pass
+from jfdi.indicators.ehler.low_pass import LowPassFilter
 
 
 class UltimateRange(Indicator):
@@ -38,28 +40,27 @@ class UltimateRange(Indicator):
         self.period_str = period_str
         self.n_ranges = n_ranges
 
-        self._closes = np.full(self.period_centre, np.nan)
-        self._ranges = np.full(self.period_str, np.nan)
-
-        self._band_pass_centre = np.zeros(2)
-        self._band_pass_str = np.zeros(2)
+        self._previous_close = np.nan
 
         self._coefficients_centre = compute_filter_coefficients(period_centre)
         self._coefficients_str = compute_filter_coefficients(period_str)
 
+        self._band_pass_centre = LowPassFilter(self._coefficients_centre)
+        self._band_pass_str = LowPassFilter(self._coefficients_str)
+
     @property
     def simplified_true_range(self) -> float:
         if not self.initialized:
             return np.nan
 
-        return self._band_pass_str[0]
+        return self._band_pass_str.value
 
     @property
     def centre(self) -> float:
         if not self.initialized:
             return np.nan
 
-        return self._band_pass_centre[0]
+        return self._band_pass_centre.value
 
     @property
     def upper_band(self) -> float:
@@ -78,46 +79,34 @@ class UltimateRange(Indicator):
     def handle_bar(self, bar: Bar):
         PyCondition.not_none(bar, "bar")
 
-        self.update_raw(bar.close.as_double())
+        self.update_raw(
+            bar.high.as_double(),
+            bar.low.as_double(),
+            bar.close.as_double(),
+        )
 
-    def update_raw(self, bar: Bar):
-        self._closes[1:] = self._closes[:-1]
-        self._closes[0] = self.bar.close
+    def update_raw(self, high: float, low: float, close: float):
+        previous_close = self._previous_close
+        self._previous_close = close
 
         if not self.initialized:
             self._set_has_inputs(True)
 
-            if np.count_nonzero(~np.isnan(self._closes)) < 1:
+            # The true range needs the previous close.
+            if math.isnan(previous_close):
                 return
 
-        true_high = np.max(self.bar.high, self._closes[1])
-        true_low = np.max(self.bar.low, self._closes[1])
+        true_high = max(high, previous_close)
+        true_low = min(low, previous_close)
 
-        self._ranges[1:] = self._ranges[:-1]
-        self._ranges[0] = true_high - true_low
-
-        if not self.initialized:
-            self._set_has_inputs(True)
+        # Both filters start from the first bar with a true range.
+        self._band_pass_centre.update(close)
+        self._band_pass_str.update(true_high - true_low)
 
-            if np.count_nonzero(~np.isnan(self._ranges)) < 3:
-                return
-
-        self._band_pass_centre = update_band_pass(
-            self._closes,
-            self._band_pass_centre,
-            self._coefficients_centre,
-        )
-        self._band_pass_str = update_band_pass(
-            self._ranges,
-            self._band_pass_str,
-            self._coefficients_str,
-        )
-
-        if not self.initialized:
+        if not self.initialized and self._band_pass_str.count >= 3:
             self._set_initialized(True)
 
     def _reset(self):
-        self._closes[:] = np.nan
-        self._ranges[:] = np.nan
-        self._band_pass_centre[:] = 0.0
-        self._band_pass_str[:] = 0.0
+        self._previous_close = np.nan
+        self._band_pass_centre.reset()
+        self._band_pass_str.reset()
@@ -1,3 +1,5 @@
+import math
+
 import numpy as np
 import numpy.typing as npt
 from nautilus_trader.core.correctness import PyCondition
@@ -5,6 +7,10 @@ from nautilus_trader.indicators.base.indicator import Indicator
 from nautilus_trader.model.data import Bar, QuoteTick, TradeTick
 from nautilus_trader.model.enums import PriceType
 
+# The gains that are tried, from which the one with the least error is chosen.
+gains = np.arange(-5.0, 5.0, 0.1)
+_gains = gains.tolist()
+
 
 class ZLEMA(Indicator):
     def __init__(
@@ -69,14 +75,7 @@ class ZLEMA(Indicator):
         value: float,
         ema: float,
     ) -> float:
-        gains = np.arange(-5.0, 5.0, 0.1)
-
-        trials = self.calculate_zlema(self._alpha, self._ema, gains, value, self._zlema)
-        errors = np.abs(value - trials)
-
-        best_gain = gains[np.argmin(errors)]
-
-        return best_gain
+        return calculate_gain(self._alpha, ema, value, float(self._zlema[1]))
 
     def handle_quote_tick(self, tick: QuoteTick):
         PyCondition.not_none(tick, "tick")
@@ -112,7 +111,114 @@ class ZLEMA(Indicator):
         self._increment_count()
 
     def _reset(self):
-        self.count = 0
+        self._count = 0
         self._ema = np.nan
         self._zlema = np.full(2, np.nan)
         self._gain = 0.0
+
+
+def _search_gain(
+    alpha: float,
+    ema: float,
+    value: float,
+    previous_zlema: float,
+) -> float:
+    """Return the gain with the least error by trying every one of them."""
+    trials = ZLEMA.calculate_zlema(alpha, ema, gains, value, [np.nan, previous_zlema])
+    errors = np.abs(value - trials)
+
+    return _gains[np.argmin(errors)]
+
+
+def calculate_gain(
+    alpha: float,
+    ema: float,
+    value: float,
+    previous_zlema: float,
+) -> float:
+    """Return the gain (of those in `gains`) that brings the ZLEMA closest to the value.
+
+    The error is linear in the gain, so rather than trying every gain I solve for the
+    one with no error, and then look for its nearest neighbours in `gains`. Every
+    step of the ZLEMA's computation preserves the order of the gains, even in floating
+    point, so the signed errors are monotonic, and the least absolute error is found
+    where they change sign. The result is the same gain that trying every one of them
+    would give, including the first of any ties.
+    """
+    difference = value - previous_zlema
+
+    # With no difference every gain has the same error.
+    if difference == 0:
+        return _search_gain(alpha, ema, value, previous_zlema)
+
+    gain = (value - alpha * ema - (1 - alpha) * previous_zlema) / (alpha * difference)
+
+    if not math.isfinite(gain):
+        return _search_gain(alpha, ema, value, previous_zlema)
+
+    n = len(_gains)
+
+    def signed_error(i: int) -> float:
+        """The error of the `i`th gain, signed so that it decreases with `i`."""
+        trial = alpha * (ema + _gains[i] * difference) + (1 - alpha) * previous_zlema
+        return value - trial if difference > 0 else trial - value
+
+    i = min(max(round((gain - _gains[0]) / 0.1), 0), n - 1)
+
+    # Find the last gain whose error is positive, if there is one.
+    if signed_error(i) > 0:
+        while i + 1 < n and signed_error(i + 1) > 0:
+            i += 1
+    else:
+        while i > 0 and signed_error(i - 1) <= 0:
+            i -= 1
+        i -= 1
+
+    if i + 1 < n and (i < 0 or -signed_error(i + 1) < signed_error(i)):
+        return _gains[i + 1]
+
+    # The error can be the same for consecutive gains, in which case it's the first.
+    error = signed_error(i)
+    while i > 0 and signed_error(i - 1) == error:
+        i -= 1
+
+    return _gains[i]
+
+
+def zlema(series: npt.ArrayLike, period: int) -> npt.NDArray[np.float64]:
+    """Return the ZLEMA of a series, as the indicator would after each value.
+
+    Values before the indicator's initialised are NaN.
+
+    Args:
+        series: The prices, oldest first.
+        period: Indicator lookback (greater than zero).
+
+    Raises:
+        ValueError: If `period` is not a positive integer.
+    """
+    PyCondition.positive_int(period, "period")
+
+    alpha = 2.0 / (period + 1.0)
+    values = np.asarray(series, dtype=np.float64)
+    output = np.full(len(values), np.nan)
+
+    if not len(values):
+        return output
+
+    ema = zlema_0 = zlema_1 = values[0]
+
+    for i, value in enumerate(values.tolist()):
+        ema = alpha * value + (1.0 - alpha) * ema
+        gain = calculate_gain(alpha, ema, value, zlema_1)
+
+        zlema_0, zlema_1 = (
+            alpha * (ema + gain * (value - zlema_1)) + (1 - alpha) * zlema_1,
+            zlema_0,
+        )
+
+        output[i] = zlema_0
+
+    output[: period - 1] = np.nan
+
+    return output
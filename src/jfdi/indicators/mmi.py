@@ -1,11 +1,13 @@
+from bisect import bisect_left, bisect_right, insort
+
 import numpy as np
 from nautilus_trader.core.correctness import PyCondition
-from nautilus_trader.indicators.base.indicator import Indicator
-from nautilus_trader.model.data import Bar, QuoteTick, TradeTick
 from nautilus_trader.model.enums import PriceType
 
+from jfdi.indicators.rolling_window import RollingWindowIndicator
+
 
-class MMI(Indicator):
+class MMI(RollingWindowIndicator):
     def __init__(
         self,
         period: int,
@@ -18,93 +20,130 @@ class MMI(Indicator):
         time. Lower values indicate stronger trending behavior, whilst higher values
         indicate either mean-reverting or random conditions.
 
+        Rather than sorting and comparing the whole window on every update, I keep the
+        window's prices sorted, along with the latest price of every rise and of every
+        fall. The median and the number of moves above and below it are then found by
+        bisection, so each update is O(log n) comparisons and the values are O(1).
+
         Args:
-            period: Indicator lookback (greater than zero).
+            period: Indicator lookback (at least two, so that there's a move).
             price_type: The price type to extract from quote ticks.
 
         Raises:
-            ValueError: If `period` is not a positive integer.
+            ValueError: If `period` is not an integer greater than one.
         """
         PyCondition.positive_int(period, "period")
+        PyCondition.is_true(period > 1, f"period={period} must be > 1")
 
-        super().__init__(params=[period, price_type])
+        super().__init__(
+            params=[period, price_type],
+            window=period,
+            price_type=price_type,
+        )
 
         self.period = period
-        self.price_type = price_type
 
-        self._prices = np.full(self.period, np.nan)
         self.median = np.nan
 
+        self._sorted_prices: list[float] = []
+        # The latest price of each move (within the window) that rose or fell.
+        self._sorted_rises: list[float] = []
+        self._sorted_falls: list[float] = []
+
+        self._number_higher = 0
+        self._number_lower = 0
+
     @property
     def value(self) -> float:
         """The current market meanness."""
         if not self.initialized:
             return np.nan
 
-        prev = self._prices[1:]
-        curr = self._prices[:-1]
-
         # The number of lower and higher reversions that were avoided.
-        number_higher = np.sum((curr > self.median) & (curr > prev))
-        number_lower = np.sum((curr < self.median) & (curr < prev))
-
-        return (number_higher + number_lower) / (self.period - 1)
+        return (self._number_higher + self._number_lower) / (self.period - 1)
 
     @property
     def number_higher(self) -> float:
-        """The current market meanness."""
+        """The fraction of moves that rose to a price above the median."""
         if not self.initialized:
             return np.nan
 
-        prev = self._prices[1:]
-        curr = self._prices[:-1]
-
-        # The number of lower and higher reversions that were avoided.
-        number_higher = np.sum((curr > self.median) & (curr > prev))
-
-        return number_higher / (self.period - 1)
+        return self._number_higher / (self.period - 1)
 
     @property
     def number_lower(self) -> float:
-        """The current market meanness."""
+        """The fraction of moves that fell to a price below the median."""
         if not self.initialized:
             return np.nan
 
-        prev = self._prices[1:]
-        curr = self._prices[:-1]
+        return self._number_lower / (self.period - 1)
 
-        # The number of lower and higher reversions that were avoided.
-        number_lower = np.sum((curr < self.median) & (curr < prev))
+    def update_raw(self, value: float):
+        value = float(value)
 
-        return number_lower / (self.period - 1)
+        if self._prices.full:
+            oldest = float(self._prices[self.period - 1])
 
-    def handle_quote_tick(self, tick: QuoteTick):
-        PyCondition.not_none(tick, "tick")
+            _remove(self._sorted_prices, oldest)
 
-        self.update_raw(tick.extract_price(self.price_type).as_double())
+            # The oldest move leaves the window along with its starting price.
+            self._remove_move(float(self._prices[self.period - 2]), oldest)
 
-    def handle_trade_tick(self, tick: TradeTick):
-        PyCondition.not_none(tick, "tick")
+        if self._prices.count:
+            self._add_move(value, float(self._prices[0]))
 
-        self.update_raw(tick.price.as_double())
+        self._prices.append(value)
+        insort(self._sorted_prices, value)
 
-    def handle_bar(self, bar: Bar):
-        PyCondition.not_none(bar, "bar")
+        if not self.initialized:
+            self._set_has_inputs(True)
 
-        self.update_raw(bar.close.as_double())
+            if not self._prices.full:
+                return
 
-    def update_raw(self, value: float):
-        self._prices[1:] = self._prices[:-1]
-        self._prices[0] = value
+            self._set_initialized(True)
 
-        self.median = np.median(self._prices)
+        self.median = _median(self._sorted_prices)
 
-        if not self.initialized:
-            self._set_has_inputs(True)
+        self._number_higher = len(self._sorted_rises) - bisect_right(
+            self._sorted_rises, self.median
+        )
+        self._number_lower = bisect_left(self._sorted_falls, self.median)
+
+    def _add_move(self, curr: float, prev: float):
+        if curr > prev:
+            insort(self._sorted_rises, curr)
+        elif curr < prev:
+            insort(self._sorted_falls, curr)
 
-            if not np.isnan(self._prices).any():
-                self._set_initialized(True)
+    def _remove_move(self, curr: float, prev: float):
+        if curr > prev:
+            _remove(self._sorted_rises, curr)
+        elif curr < prev:
+            _remove(self._sorted_falls, curr)
 
     def _reset(self):
-        self._prices[:] = np.nan
+        super()._reset()
         self.median = np.nan
+
+        self._sorted_prices.clear()
+        self._sorted_rises.clear()
+        self._sorted_falls.clear()
+
+        self._number_higher = 0
+        self._number_lower = 0
+
+
+def _remove(sorted_values: list[float], value: float):
+    del sorted_values[bisect_left(sorted_values, value)]
+
+
+def _median(sorted_values: list[float]) -> float:
+    """Return the median of sorted values, as `np.median` would."""
+    n = len(sorted_values)
+    middle = n // 2
+
+    if n % 2:
+        return sorted_values[middle]
+
+    return (sorted_values[middle - 1] + sorted_values[middle]) / 2
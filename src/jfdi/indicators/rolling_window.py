@@ -0,0 +1,135 @@
+import numpy as np
+import numpy.typing as npt
+from nautilus_trader.core.correctness import PyCondition
+from nautilus_trader.indicators.base.indicator import Indicator
+from nautilus_trader.model.data import Bar, QuoteTick, TradeTick
+from nautilus_trader.model.enums import PriceType
+
+
+class RollingWindow:
+    __slots__ = ("_buffer", "_head", "_values", "count", "size")
+
+    def __init__(self, size: int):
+        """A fixed-size window of the latest values, with O(1) appends.
+
+        Like `RingBuffer`, every value is written twice, so the window is always a
+        contiguous slice. Index 0 is the latest value, as it was when I shifted the
+        arrays along, and slots that haven't been filled yet are NaN.
+
+        Args:
+            size: The number of values to keep (greater than zero).
+
+        Raises:
+            ValueError: If `size` is not a positive integer.
+        """
+        PyCondition.positive_int(size, "size")
+
+        self.size = size
+
+        self._values = np.full(2 * size, np.nan)
+        # Setting and getting single values is quicker through a memory view.
+        self._buffer = memoryview(self._values)
+        self._head = 0
+        self.count = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.size)
+
+    def __getitem__(self, index: int) -> float:
+        """Return the value `index` updates ago."""
+        return self._buffer[self._head + index]
+
+    @property
+    def full(self) -> bool:
+        return self.count >= self.size
+
+    def append(self, value: float) -> None:
+        """Add the latest value, dropping the oldest one if the window's full."""
+        head = (self._head or self.size) - 1
+
+        buffer = self._buffer
+        buffer[head] = value
+        buffer[head + self.size] = value
+
+        self._head = head
+        self.count += 1
+
+    def latest_first(self) -> npt.NDArray[np.float64]:
+        """Return the window (latest first) without copying.
+
+        The view is only valid until the next append.
+        """
+        return self._values[self._head : self._head + self.size]
+
+    def clear(self) -> None:
+        self._values[:] = np.nan
+        self._head = 0
+        self.count = 0
+
+
+class PriceIndicator(Indicator):
+    def __init__(
+        self,
+        params: list,
+        price_type: PriceType = PriceType.LAST,
+    ):
+        """The base class of indicators that are updated with a single price.
+
+        Ticks and bars are reduced to a price and passed to `update_raw`, which
+        subclasses implement.
+
+        Args:
+            params: The indicator's parameters.
+            price_type: The price type to extract from quote ticks.
+        """
+        super().__init__(params=params)
+
+        self.price_type = price_type
+
+    def handle_quote_tick(self, tick: QuoteTick):
+        """Update the indicator with the given quote tick."""
+        PyCondition.not_none(tick, "tick")
+
+        self.update_raw(tick.extract_price(self.price_type).as_double())
+
+    def handle_trade_tick(self, tick: TradeTick):
+        """Update the indicator with the given trade tick."""
+        PyCondition.not_none(tick, "tick")
+
+        self.update_raw(tick.price.as_double())
+
+    def handle_bar(self, bar: Bar):
+        """Update the indicator with the given bar."""
+        PyCondition.not_none(bar, "bar")
+
+        self.update_raw(bar.close.as_double())
+
+    def update_raw(self, value: float):
+        """Update the indicator with the given raw value."""
+        raise NotImplementedError("method `update_raw` must be implemented")
+
+
+class RollingWindowIndicator(PriceIndicator):
+    def __init__(
+        self,
+        params: list,
+        window: int,
+        price_type: PriceType = PriceType.LAST,
+    ):
+        """The base class of indicators that keep a window of the latest prices.
+
+        Args:
+            params: The indicator's parameters.
+            window: The number of prices to keep (greater than zero).
+            price_type: The price type to extract from quote ticks.
+
+        Raises:
+            ValueError: If `window` is not a positive integer.
+        """
+        super().__init__(params=params, price_type=price_type)
+
+        self._prices = RollingWindow(window)
+
+    def _reset(self):
+        """Reset stateful values in the class."""
+        self._prices.clear()
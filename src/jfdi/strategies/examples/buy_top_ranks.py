@@ -1,12 +1,15 @@
 import numpy as np
+from nautilus_trader.common.enums import LogColor
 from nautilus_trader.core.data import Data
 from nautilus_trader.model import DataType, InstrumentId
-from nautilus_trader.trading.strategy import StrategyConfig
 
-from jfdi.extensions.strategies.weight import WeightStrategy
+from jfdi.actors.equity import EquityTracker
+from jfdi.extensions.strategies.weight import WeightStrategy, WeightStrategyConfig
 
 
-class BuyTopRanksStrategyConfig(StrategyConfig):
+class BuyTopRanksStrategyConfig(WeightStrategyConfig, kw_only=True, frozen=True):
+    # The symbol table of the rank data, so the same list (in the same order) as the
+    # rank actor's.
     instrument_ids: list[InstrumentId]
     data_class: Data
     top: int  # rank threshold
@@ -21,45 +24,61 @@ class BuyTopRanksStrategy(WeightStrategy):
         """A strategy that ranks sectors by their momentum."""
         super().__init__(config)
 
-    def on_start(self) -> None:
-        self.subscribe_data(DataType(self.config.data_class))
-
         # The set should be traded using the same NT account (and so, be at
         # the same venue).
-        self.venue = self.config.instrument_ids[0].venue
+        self.venue = self.config.account_venue or self.config.instrument_ids[0].venue
+
+        self.equity_tracker = EquityTracker(
+            self,
+            self.venue,
+            self.config.exchange_rate_venue,
+            self.config.reporting_currency,
+        )
+
+    def on_start(self) -> None:
         self.account = self.portfolio.account(self.venue)
 
+        self.equity_tracker.start()
+
+        self.subscribe_data(DataType(self.config.data_class))
+
         self.previous_target_weights = {}
 
+        # The rank data's instruments are indices into this list of (already parsed)
+        # instrument ids.
+        self.instrument_ids = list(self.config.instrument_ids)
+
     def on_stop(self) -> None:
         for position in self.cache.positions_open(strategy_id=self.id):
             self.close_all_positions(position.instrument_id)
 
         self.unsubscribe_data(DataType(self.config.data_class))
 
+        self.equity_tracker.stop()
+
     def on_data(self, data: Data) -> None:
         if isinstance(data, self.config.data_class):
-            equities = self.get_equities()
+            equity = self.equity_tracker.equity()
+
+            if equity is None:
+                self.log.warning("NO EXCHANGE RATES AVAILABLE.", LogColor.CYAN)
+                return
 
-            current_weights = self.get_current_weights(equities)
             target_weights = self.get_target_weights(data)
-            order_weights = self.get_order_weights(current_weights, target_weights)
+            order_weights = self.get_order_weight_array(equity, target_weights)
+
+            if order_weights is None:
+                self.log.warning("NO EXCHANGE RATES AVAILABLE.", LogColor.CYAN)
+                return
 
             # Only change the portfolio when an instrument has knocked another
             # off the throne. Don't rebalance it on every data release.
-            order_weights = {
-                k: v for k, v in order_weights.items() if abs(v) > self.config.threshold
-            }
-
-            # equity = self.get_equity(equities)
-            equity = equities[self.account.base_currency]
+            order_weights[np.abs(order_weights) <= self.config.threshold] = 0
 
-            orders = self.create_orders(equity, order_weights)
+            orders = self.create_orders_from_array(equity, order_weights)
 
-            sorted_orders = sorted(orders, key=self.get_equity_released, reverse=True)
-
-            for order in sorted_orders:
-                self.submit_order(order)
+            # Free up equity before trying to spend it.
+            self.submit_rebalance(orders)
 
             self.previous_target_weights = target_weights
 
@@ -68,23 +87,22 @@ class BuyTopRanksStrategy(WeightStrategy):
         data: Data,
     ) -> dict[InstrumentId, float]:
         """Calculate the portfolio's target weights (directional)."""
-        top_instrument_ids = data.instrument_ids[
-            np.argsort(data.ranks)[: self.config.top]
+        top = min(self.config.top, len(data.ranks))
+
+        # The top ranks are found without sorting the rest.
+        top_positions = np.argpartition(data.ranks, top - 1)[:top]
+
+        top_instrument_ids = [
+            self.instrument_ids[index]
+            for index in data.instrument_indices[top_positions].tolist()
         ]
 
-        # Where you first have to type-cast from `np.str_` to `str`.
-        top_instrument_ids = np.vectorize(lambda x: InstrumentId.from_str(str(x)))(
-            top_instrument_ids
-        )
+        leverages = self.account.leverages()
 
         target_weights = {
             instrument_id: self.config.weight
             * (1.0 / self.config.top)
-            * float(
-                self.account.leverages().get(
-                    instrument_id, self.account.default_leverage
-                )
-            )
+            * float(leverages.get(instrument_id, self.account.default_leverage))
             for instrument_id in top_instrument_ids
         }
 
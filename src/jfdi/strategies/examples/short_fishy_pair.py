@@ -1,5 +1,6 @@
 from typing import Literal
 
+import numpy as np
 import pandas as pd
 from nautilus_trader.common.enums import LogColor
 from nautilus_trader.model import (
@@ -12,7 +13,12 @@ from nautilus_trader.model import (
 )
 from nautilus_trader.model.enums import AggregationSource
 
-from jfdi.actors.equity import get_all_unrealised_pnls, get_equities, get_equity
+from jfdi.actors.equity import EquityTracker
+from jfdi.extensions.aggregation.time_slice import (
+    IncompleteSlicePolicy,
+    TimeSlice,
+    TimeSliceAggregator,
+)
 from jfdi.extensions.strategies.weight import WeightStrategy, WeightStrategyConfig
 
 
@@ -26,6 +32,9 @@ class ShortFishyPairStrategyConfig(WeightStrategyConfig):
     exchange_rate_venue: Venue
     reporting_currency: Currency
     order_id_tag: str  # 000
+    # What to do when one of the pair's bars hasn't arrived.
+    incomplete_slice_policy: IncompleteSlicePolicy = IncompleteSlicePolicy.DROP
+    slice_timeout: pd.Timedelta | None = None
 
 
 class ShortFishyPairStrategy(WeightStrategy):
@@ -44,15 +53,26 @@ class ShortFishyPairStrategy(WeightStrategy):
             for k, v in self.config.instrument_ids.items()
         }
 
-        self.last_timestamps = {
-            instrument_id: pd.NaT
-            for instrument_id in self.config.instrument_ids.values()
-        }
-
         self.previous_target_weights = {}
 
+        self.equity_tracker = EquityTracker(
+            self,
+            self.config.account_venue,
+            self.config.exchange_rate_venue,
+            self.config.reporting_currency,
+        )
+
     def on_start(self) -> None:
-        self.account = self.portfolio.account(self.config.account_venue)
+        self.equity_tracker.start()
+
+        self.time_slices = TimeSliceAggregator(
+            keys=list(self.config.instrument_ids.values()),
+            callback=self.on_time_slice,
+            policy=self.config.incomplete_slice_policy,
+            clock=self.clock,
+            timeout=self.config.slice_timeout,
+            name=f"{self.id}-TIME-SLICE",
+        )
 
         for bar_type in self.bar_types.values():
             self.subscribe_bars(bar_type)
@@ -64,53 +84,48 @@ class ShortFishyPairStrategy(WeightStrategy):
         for bar_type in self.bar_types.values():
             self.unsubscribe_bars(bar_type)
 
-    def on_bar(self, bar: Bar) -> None:
-        instrument_id = bar.bar_type.instrument_id
+        self.equity_tracker.stop()
 
-        self.last_timestamps[instrument_id] = bar.ts_event
-
-        if len(set(self.last_timestamps.values())) == 1:
-            balances_total = self.account.balances_total()
-
-            venues = {instrument.id.venue for instrument in self.cache.instruments()}
-
-            unrealised_pnls = get_all_unrealised_pnls(self, venues)
+    def on_bar(self, bar: Bar) -> None:
+        self.time_slices.update(bar.bar_type.instrument_id, bar)
 
-            equities = get_equities(balances_total, unrealised_pnls)
-            equity = get_equity(
-                self,
-                equities,
-                self.config.exchange_rate_venue,
-                self.config.reporting_currency,
-            )
+    def on_time_slice(self, time_slice: TimeSlice) -> None:
+        equity = self.equity_tracker.equity()
 
-            if equity is None:
-                self.log.warning("NO EXCHANGE RATES AVAILABLE.", LogColor.CYAN)
-                return
+        if equity is None:
+            self.log.warning("NO EXCHANGE RATES AVAILABLE.", LogColor.CYAN)
+            return
 
-            current_weights = self.get_current_weights(equity)
+        target_weights = self.get_target_weights()
+        order_weights = self.get_order_weight_array(equity, target_weights)
 
-            if any(value is None for value in current_weights.values()):
-                self.log.warning("NO EXCHANGE RATES AVAILABLE.", LogColor.CYAN)
-                return
+        if order_weights is None:
+            self.log.warning("NO EXCHANGE RATES AVAILABLE.", LogColor.CYAN)
+            return
 
-            target_weights = self.get_target_weights()
-            order_weights = self.get_order_weights(current_weights, target_weights)
+        order_weights[
+            np.abs(order_weights) <= self.config.weight * self.config.threshold
+        ] = 0
 
-            order_weights = {
-                k: v
-                for k, v in order_weights.items()
-                if abs(v) > self.config.weight * self.config.threshold
-            }
+        # Instruments missing from an emitted slice (without a forward-filled bar)
+        # aren't traded until their bars arrive again.
+        unpriced_instrument_ids = [
+            instrument_id
+            for instrument_id in time_slice.missing
+            if instrument_id not in time_slice.data
+        ]
 
-            orders = self.create_orders(equity, order_weights)
+        if unpriced_instrument_ids:
+            order_weights[
+                self.instrument_index.indices(unpriced_instrument_ids, self.cache)
+            ] = 0
 
-            sorted_orders = sorted(orders, key=self.get_equity_released, reverse=True)
+        orders = self.create_orders_from_array(equity, order_weights)
 
-            for order in sorted_orders:
-                self.submit_order(order)
+        # Free up equity before trying to spend it.
+        self.submit_rebalance(orders)
 
-            self.previous_target_weights = target_weights
+        self.previous_target_weights = target_weights
 
     def get_target_weights(self) -> dict[InstrumentId, float]:
         """Calculate the portfolio's target weights (directional)."""
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.component import MessageBus, TestClock
+from nautilus_trader.model import ComponentId, TraderId, Venue
+from nautilus_trader.portfolio.portfolio import Portfolio
+
+from jfdi.actors.borrowing_fee import (
+    BorrowingFeeActor,
+    BorrowingFeeActorConfig,
+    BorrowingRates,
+)
+
+
+def tiered_fee(borrowed_funds: float) -> float:
+    """Walk the tiers, as the original actor did."""
+    rates = [
+        (100_000, 0.0583),
+        (1_000_000, 0.0533),
+        (50_000_000, 0.0508),
+        (250_000_000, 0.0483),
+        (np.inf, 0.0483),
+    ]
+
+    borrowing_fee = 0.0
+    remaining_funds = borrowed_funds
+    previous_tier_limit = 0
+
+    for tier_limit, rate in rates:
+        if remaining_funds <= 0:
+            break
+
+        tier_amount = min(tier_limit - previous_tier_limit, remaining_funds)
+        borrowing_fee += tier_amount * rate / 360
+        remaining_funds -= tier_amount
+        previous_tier_limit = tier_limit
+
+    return borrowing_fee
+
+
+@pytest.fixture
+def actor():
+    clock = TestClock()
+    msgbus = MessageBus(TraderId("TESTER-001"), clock)
+    cache = Cache()
+
+    actor = BorrowingFeeActor(
+        BorrowingFeeActorConfig(
+            venue=Venue("IB"),
+            start_time=pd.Timestamp("2024-01-01", tz="UTC"),
+            component_id=ComponentId("B"),
+            benchmark_rate_changes={pd.Timestamp("2024-06-01", tz="UTC"): 0.05},
+        )
+    )
+    actor.register_base(Portfolio(msgbus, cache, clock), msgbus, cache, clock)
+
+    return actor
+
+
+BORROWED_FUNDS = [-5.0, 0.0, 1.0, 99_999.0, 100_000.0, 750_000.0, 3e7, 1e8, 1e9]
+
+
+def test_fees_match_walking_the_tiers(actor):
+    expected = [tiered_fee(borrowed_funds) for borrowed_funds in BORROWED_FUNDS]
+
+    assert [
+        actor.calculate_borrowing_fee(borrowed_funds)
+        for borrowed_funds in BORROWED_FUNDS
+    ] == pytest.approx(expected, rel=1e-12)
+    assert actor.calculate_borrowing_fees(BORROWED_FUNDS) == pytest.approx(
+        expected, rel=1e-12
+    )
+
+
+def test_fees_broadcast_over_scenarios(actor):
+    borrowed_funds = np.array(BORROWED_FUNDS)
+    benchmark_rates = np.array([[0.03], [0.0433], [0.06]])
+
+    fees = actor.calculate_borrowing_fees(borrowed_funds, benchmark_rates)
+
+    assert fees.shape == (3, len(BORROWED_FUNDS))
+    for row, benchmark_rate in zip(fees, benchmark_rates[:, 0], strict=True):
+        assert list(row) == pytest.approx(
+            [
+                actor.calculate_borrowing_fee(funds, benchmark_rate)
+                for funds in BORROWED_FUNDS
+            ],
+            rel=1e-12,
+        )
+
+
+def test_benchmark_rate_changes(actor):
+    assert actor.get_benchmark_rate(pd.Timestamp("2024-05-31", tz="UTC").value) == (
+        actor.config.benchmark_rate
+    )
+    assert actor.get_benchmark_rate(pd.Timestamp("2024-06-01", tz="UTC").value) == 0.05
+
+
+def test_tiers_are_validated():
+    with pytest.raises(ValueError):
+        BorrowingRates([100, 10], [0.01, 0.02, 0.03])
+
+    with pytest.raises(ValueError):
+        BorrowingRates([10, 100], [0.01, 0.02])
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+from scipy.spatial import distance
+from sklearn.covariance import LedoitWolf
+
+from jfdi.indicators.covariance import RollingCovariance, mahalanobis_squared
+
+
+@pytest.fixture
+def returns():
+    rng = np.random.default_rng(11)
+    return rng.normal(loc=0.001, scale=0.01, size=(300, 8))
+
+
+@pytest.mark.parametrize("refresh_period", [None, 1_000])
+def test_ledoit_wolf_matches_sklearn(returns, refresh_period):
+    window = 50
+    covariance = RollingCovariance(
+        returns.shape[1], window, refresh_period=refresh_period
+    )
+
+    for t, x in enumerate(returns):
+        covariance.update(x)
+
+        if covariance.initialized:
+            expected = LedoitWolf().fit(returns[t - window + 1 : t + 1])
+            sigma, shrinkage = covariance.ledoit_wolf()
+
+            np.testing.assert_allclose(sigma, expected.covariance_, rtol=1e-9)
+            assert shrinkage == pytest.approx(expected.shrinkage_, rel=1e-9)
+
+
+def test_mahalanobis_squared_matches_scipy(returns):
+    sigma = LedoitWolf().fit(returns).covariance_
+    u, v = returns[0], np.median(returns, axis=0)
+
+    assert mahalanobis_squared(u, v, sigma) == pytest.approx(
+        distance.mahalanobis(u, v, np.linalg.inv(sigma)) ** 2, rel=1e-12
+    )
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+import talib
+
+from jfdi.indicators.cross_sectional import (
+    CrossSectionalBuffer,
+    cross_sectional_kernels,
+    rank_descending,
+)
+
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(7)
+    return 100 * np.exp(np.cumsum(rng.normal(scale=0.01, size=(5, 60)), axis=1))
+
+
+@pytest.mark.parametrize("name", list(cross_sectional_kernels))
+def test_kernels_match_talib(closes, name):
+    kernel, get_window = cross_sectional_kernels[name]
+    timeperiod = 10
+
+    buffer = CrossSectionalBuffer(len(closes), get_window(timeperiod))
+    for t in range(closes.shape[1]):
+        for i in range(len(closes)):
+            buffer.update(i, t + 1, closes[i, t])
+
+    expected = [getattr(talib, name)(row, timeperiod=timeperiod)[-1] for row in closes]
+
+    assert buffer.initialized
+    np.testing.assert_allclose(
+        kernel(buffer.matrix(), timeperiod), expected, rtol=1e-12
+    )
+
+
+def test_rank_descending_is_stable_and_puts_nans_last():
+    values = np.array([1.0, np.nan, 3.0, 1.0, 2.0])
+
+    np.testing.assert_array_equal(rank_descending(values), [2, 4, 0, 3, 1])
@@ -0,0 +1,332 @@
+from itertools import pairwise, product
+
+import numpy as np
+import pytest
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.component import MessageBus, TestClock
+from nautilus_trader.model import (
+    Bar,
+    BarType,
+    ComponentId,
+    Price,
+    Quantity,
+    TraderId,
+)
+from nautilus_trader.portfolio.portfolio import Portfolio
+
+from jfdi.actors.directional_changes.composite import (
+    DirectionalChangeActor,
+    DirectionalChangeActorConfig,
+)
+from jfdi.actors.directional_changes.events import directional_change_events
+from jfdi.actors.directional_changes.extrema import (
+    ExtremaActor,
+    ExtremaActorConfig,
+    ExtremaData,
+    ExtremaType,
+)
+from jfdi.actors.directional_changes.extrema_difference import (
+    ExtremaDifferenceActor,
+    ExtremaDifferenceActorConfig,
+    ExtremaDifferenceData,
+)
+from jfdi.actors.directional_changes.extrema_second_difference import (
+    ExtremaSecondDifferenceActor,
+    ExtremaSecondDifferenceActorConfig,
+    ExtremaSecondDifferenceData,
+)
+from jfdi.actors.directional_changes.overshoot_differences import (
+    OvershootDifferenceActor,
+    OvershootDifferenceActorConfig,
+    OvershootDifferenceData,
+)
+
+BAR_TYPE = BarType.from_str("SPY.ARCA-1-MINUTE-LAST-EXTERNAL")
+THRESHOLDS = [0.0005, 0.001, 0.002]
+HIGH, LOW = ExtremaType.HIGH.value, ExtremaType.LOW.value
+
+
+@pytest.fixture
+def bars():
+    rng = np.random.default_rng(11)
+    closes = 100 * np.exp(np.cumsum(rng.normal(scale=0.002, size=2_000)))
+
+    return [
+        Bar(
+            BAR_TYPE,
+            Price(close, 2),
+            Price(close * 1.001, 2),
+            Price(close * 0.999, 2),
+            Price(close, 2),
+            Quantity(1, 0),
+            i + 1,
+            i + 1,
+        )
+        for i, close in enumerate(closes)
+    ]
+
+
+def register(actor):
+    clock = TestClock()
+    msgbus = MessageBus(TraderId("TESTER-001"), clock)
+    cache = Cache()
+
+    actor.register_base(Portfolio(msgbus, cache, clock), msgbus, cache, clock)
+    actor.start()
+
+    return actor
+
+
+def run_actor(bars, **kwargs) -> list[tuple]:
+    actor = register(
+        ExtremaActor(
+            ExtremaActorConfig(
+                bar_type=BAR_TYPE, component_id=ComponentId("E"), **kwargs
+            )
+        )
+    )
+
+    events = []
+    actor.publish_data = lambda data_type, data: events.append(
+        (
+            data_type.metadata["threshold"],
+            data.ts_event,
+            data.ts_init,
+            data.extrema,
+            data.overshoot,
+            data.extrema_type,
+        )
+    )
+
+    for bar in bars:
+        actor.on_bar(bar)
+
+    return events
+
+
+def expected_events(bars, threshold: float) -> list[tuple]:
+    """Find the extrema one bar at a time, as the original actor did."""
+    events = []
+
+    is_up_trend = True
+    high_water_mark = np.log(bars[0].high.as_double())
+    low_water_mark = np.log(bars[0].low.as_double())
+    ts_start = ts_end = bars[0].ts_event
+
+    for bar in bars:
+        high = np.log(bar.high.as_double())
+        low = np.log(bar.low.as_double())
+        close = np.log(bar.close.as_double())
+
+        if is_up_trend:
+            if low < (1 - threshold) * high_water_mark:
+                events.append(
+                    (threshold, ts_start, bar.ts_event, high_water_mark, close, HIGH)
+                )
+                is_up_trend = False
+                low_water_mark, ts_end = low, bar.ts_event
+            elif high > high_water_mark:
+                high_water_mark, ts_start = high, bar.ts_event
+        else:
+            if high > (1 + threshold) * low_water_mark:
+                events.append(
+                    (threshold, ts_end, bar.ts_event, low_water_mark, close, LOW)
+                )
+                is_up_trend = True
+                high_water_mark, ts_start = high, bar.ts_event
+            elif low < low_water_mark:
+                low_water_mark, ts_end = low, bar.ts_event
+
+    return events
+
+
+def test_extrema_match_one_bar_at_a_time(bars):
+    events = run_actor(bars, threshold=THRESHOLDS[0])
+
+    assert events
+    assert events == expected_events(bars, THRESHOLDS[0])
+    # Highs and lows alternate.
+    assert all(previous[-1] != current[-1] for previous, current in pairwise(events))
+
+
+def test_multiple_thresholds_match_single_thresholds(bars):
+    expected = [
+        event
+        for threshold in THRESHOLDS
+        for event in run_actor(bars, threshold=threshold)
+    ]
+
+    assert sorted(run_actor(bars, thresholds=THRESHOLDS)) == sorted(expected)
+
+
+def test_threshold_or_thresholds_is_required():
+    with pytest.raises(ValueError):
+        ExtremaActor(
+            ExtremaActorConfig(bar_type=BAR_TYPE, component_id=ComponentId("E"))
+        )
+
+
+def test_events_match_actors(bars):
+    """Replay the bars through every actor, and compare what they publish."""
+    # In the order of the tables.
+    published = {
+        "extrema": [],
+        "differences": [],
+        "second_differences": [],
+        "overshoot_differences": [],
+    }
+
+    def record(name, *fields):
+        def publish_data(data_type, data):
+            published[name].append(
+                (
+                    data_type.metadata["threshold"],
+                    data.ts_event,
+                    data.ts_init,
+                    *(getattr(data, field) for field in fields),
+                )
+            )
+
+            key = (name, data_type.metadata["threshold"])
+            for subscriber in subscribers.get(key, []):
+                subscriber.on_data(data)
+
+        return publish_data
+
+    subscribers = {}
+    component_id = ComponentId("A")
+    types = [ExtremaType.HIGH, ExtremaType.LOW]
+
+    for threshold in THRESHOLDS:
+        for previous_type, current_type in product(types, repeat=2):
+            kwargs = {
+                "bar_type": BAR_TYPE,
+                "threshold": threshold,
+                "previous_type": previous_type,
+                "current_type": current_type,
+                "component_id": component_id,
+            }
+
+            difference_actor = register(
+                ExtremaDifferenceActor(ExtremaDifferenceActorConfig(**kwargs))
+            )
+            difference_actor.publish_data = record(
+                "differences", "difference", "lag", "previous_type", "current_type"
+            )
+            second_difference_actor = register(
+                ExtremaSecondDifferenceActor(
+                    ExtremaSecondDifferenceActorConfig(**kwargs)
+                )
+            )
+            second_difference_actor.publish_data = record(
+                "second_differences",
+                "second_difference",
+                "second_lag",
+                "previous_type",
+                "current_type",
+            )
+
+            subscribers.setdefault(("extrema", threshold), []).append(difference_actor)
+            subscribers.setdefault(("differences", threshold), []).append(
+                second_difference_actor
+            )
+
+        for current_overshoot in (False, True):
+            overshoot_actor = register(
+                OvershootDifferenceActor(
+                    OvershootDifferenceActorConfig(
+                        bar_type=BAR_TYPE,
+                        threshold=threshold,
+                        current_overshoot=current_overshoot,
+                        component_id=component_id,
+                    )
+                )
+            )
+            overshoot_actor.publish_data = record(
+                "overshoot_differences",
+                "difference",
+                "length",
+                "previous_type",
+                "current_type",
+            )
+
+            subscribers.setdefault(("extrema", threshold), []).append(overshoot_actor)
+
+    extrema_actor = register(
+        ExtremaActor(
+            ExtremaActorConfig(
+                bar_type=BAR_TYPE, thresholds=THRESHOLDS, component_id=component_id
+            )
+        )
+    )
+    extrema_actor.publish_data = record(
+        "extrema", "extrema", "overshoot", "extrema_type"
+    )
+
+    for bar in bars:
+        extrema_actor.on_bar(bar)
+
+    tables = directional_change_events(
+        high=[bar.high.as_double() for bar in bars],
+        low=[bar.low.as_double() for bar in bars],
+        close=[bar.close.as_double() for bar in bars],
+        ts_event=[bar.ts_event for bar in bars],
+        thresholds=THRESHOLDS,
+    )
+
+    for name, table in zip(published, tables, strict=True):
+        rows = [tuple(row.values()) for row in table.to_pylist()]
+
+        if name == "overshoot_differences":
+            # The table has a column for the actor's setting.
+            rows = [row[:-1] for row in rows]
+
+        assert published[name]
+        assert sorted(rows) == sorted(published[name])
+
+
+def test_composite_actor_matches_events(bars):
+    threshold = THRESHOLDS[0]
+
+    actor = register(
+        DirectionalChangeActor(
+            DirectionalChangeActorConfig(
+                bar_type=BAR_TYPE, threshold=threshold, component_id=ComponentId("C")
+            )
+        )
+    )
+    published = {}
+    actor.publish_data = lambda data_type, data: published.setdefault(
+        data_type.type, []
+    ).append(data.to_dict())
+
+    for extremum in run_actor(bars, threshold=threshold):
+        actor.on_data(
+            ExtremaData(
+                ts_event=extremum[1],
+                ts_init=extremum[2],
+                extrema=extremum[3],
+                overshoot=extremum[4],
+                extrema_type=extremum[5],
+            )
+        )
+
+    tables = directional_change_events(
+        high=[bar.high.as_double() for bar in bars],
+        low=[bar.low.as_double() for bar in bars],
+        close=[bar.close.as_double() for bar in bars],
+        ts_event=[bar.ts_event for bar in bars],
+        thresholds=[threshold],
+    )
+
+    for data_class, table in [
+        (ExtremaDifferenceData, tables.extrema_differences),
+        (ExtremaSecondDifferenceData, tables.extrema_second_differences),
+        (OvershootDifferenceData, tables.overshoot_differences),
+    ]:
+        fields = ["ts_event", "ts_init", *data_class.__annotations__]
+        expected = [tuple(row[name] for name in fields) for row in table.to_pylist()]
+
+        assert sorted(
+            tuple(data[name] for name in fields) for data in published[data_class]
+        ) == sorted(expected)
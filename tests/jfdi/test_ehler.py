@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from jfdi.indicators.ehler.high_pass import HighPass, high_pass
+from jfdi.indicators.ehler.low_pass import LowPass, low_pass
+from jfdi.indicators.ehler.ultimate_bands import UltimateBands, ultimate_bands
+from jfdi.indicators.ehler.ultimate_oscillator import (
+    UltimateOscillator,
+    ultimate_oscillator,
+)
+from jfdi.indicators.ehler.zlema import ZLEMA, _search_gain, calculate_gain, zlema
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(13)
+    # Rounding to cents gives repeated prices, for which every gain is as good.
+    return np.round(100 + np.cumsum(rng.normal(scale=0.1, size=2_000)), 2)
+
+
+def test_calculate_gain_matches_search():
+    rng = np.random.default_rng(17)
+
+    for _ in range(10_000):
+        alpha = 2 / (rng.integers(1, 200) + 1)
+        previous_zlema = 100 * np.exp(rng.normal())
+        # The scale spans moves that are far smaller and far larger than the grid.
+        scale = previous_zlema * 10 ** rng.uniform(-14, 0)
+        value = previous_zlema + scale * rng.normal()
+        ema = previous_zlema + 10 * scale * rng.normal()
+
+        assert calculate_gain(alpha, ema, value, previous_zlema) == _search_gain(
+            alpha, ema, value, previous_zlema
+        )
+
+
+def test_zlema_matches_indicator(prices):
+    indicator = ZLEMA(period=20)
+
+    expected = []
+    for price in prices:
+        indicator.update_raw(price)
+        expected.append(indicator.value)
+
+    np.testing.assert_array_equal(zlema(prices, period=20), expected)
+
+
+def replay(indicator, prices, *attributes):
+    values = []
+    for price in prices:
+        indicator.update_raw(price)
+        values.append([getattr(indicator, attribute) for attribute in attributes])
+
+    return np.array(values).T
+
+
+@pytest.mark.parametrize("period", [3, 20, 200])
+def test_filters_match_indicators(prices, period):
+    np.testing.assert_allclose(
+        high_pass(prices, period),
+        replay(HighPass(period), prices, "value")[0],
+        rtol=1e-9,
+        atol=1e-9,
+    )
+    np.testing.assert_allclose(
+        low_pass(prices, period),
+        replay(LowPass(period), prices, "value")[0],
+        rtol=1e-12,
+    )
+
+
+def test_ultimate_oscillator_matches_indicator(prices):
+    np.testing.assert_allclose(
+        ultimate_oscillator(prices, edge=20, width=2, root_mean_square_period=50),
+        replay(UltimateOscillator(20, 2, 50), prices, "value")[0],
+        rtol=1e-9,
+        atol=1e-9,
+    )
+
+
+def test_ultimate_bands_matches_indicator(prices):
+    np.testing.assert_allclose(
+        ultimate_bands(prices, period=20, n_deviations=2.0),
+        replay(
+            UltimateBands(20, n_deviations=2.0),
+            prices,
+            "centre",
+            "upper_band",
+            "lower_band",
+        ),
+        rtol=1e-12,
+    )
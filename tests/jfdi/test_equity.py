@@ -0,0 +1,201 @@
+import numpy as np
+import pandas as pd
+import pytest
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import (
+    Currency,
+    InstrumentId,
+    Money,
+    Quantity,
+    QuoteTick,
+    Venue,
+)
+from nautilus_trader.model.enums import AccountType, OmsType, OrderSide
+from nautilus_trader.model.instruments import Instrument
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.trading.strategy import Strategy
+
+from jfdi.actors.equity import (
+    EquityActor,
+    EquityActorConfig,
+    EquityData,
+    UnrealisedPnLs,
+    get_all_unrealised_pnls,
+    get_equities,
+    get_equity,
+)
+
+USD = Currency.from_str("USD")
+EUR = Currency.from_str("EUR")
+JPY = Currency.from_str("JPY")
+SPY = InstrumentId.from_str("SPY.ARCA")
+QQQ = InstrumentId.from_str("QQQ.NASDAQ")
+SAP = InstrumentId.from_str("SAP.XETR")
+SIM = Venue("SIM")
+EURUSD = TestInstrumentProvider.default_fx_ccy("EUR/USD")
+USDJPY = TestInstrumentProvider.default_fx_ccy("USD/JPY")
+
+
+def test_totals_follow_updates():
+    pnls = UnrealisedPnLs()
+
+    pnls.update(SPY, Money(10, USD))
+    pnls.update(QQQ, Money(-2.5, USD))
+    pnls.update(SAP, Money(4, EUR))
+
+    assert pnls.totals == {USD: pytest.approx(7.5), EUR: pytest.approx(4)}
+
+    # Replacing a PnL doesn't count it twice.
+    pnls.update(SPY, Money(1, USD))
+
+    assert pnls.totals[USD] == pytest.approx(-1.5)
+
+    pnls.update(SAP, None)
+
+    assert pnls.money() == {USD: Money(-1.5, USD)}
+
+
+def test_refresh_only_fetches_stale_pnls():
+    pnls = UnrealisedPnLs()
+    fetched = []
+
+    def unrealized_pnl(instrument_id):
+        fetched.append(instrument_id)
+        return Money(1, USD)
+
+    pnls.stale.update([SPY, QQQ])
+    pnls.refresh({SPY, QQQ}, unrealized_pnl)
+
+    assert sorted(fetched) == sorted([SPY, QQQ])
+    assert pnls.totals == {USD: 2}
+
+    # QQQ's position was closed.
+    fetched.clear()
+    pnls.stale.add(QQQ)
+    pnls.refresh({SPY}, unrealized_pnl)
+
+    assert fetched == []
+    assert pnls.totals == {USD: 1}
+    assert not pnls.stale
+
+
+class TradeOnSchedule(Strategy):
+    def __init__(self, schedule: dict[int, tuple[InstrumentId, OrderSide | None]]):
+        """Trade on the nth quote: buy, sell, or close (with a side of `None`)."""
+        super().__init__()
+
+        self.schedule = schedule
+        self.n_quotes = 0
+
+    def on_start(self) -> None:
+        for instrument_id in (EURUSD.id, USDJPY.id):
+            self.subscribe_quote_ticks(instrument_id)
+
+    def on_quote_tick(self, tick: QuoteTick) -> None:
+        self.n_quotes += 1
+
+        if self.n_quotes not in self.schedule:
+            return
+
+        instrument_id, side = self.schedule[self.n_quotes]
+
+        if side is None:
+            self.close_all_positions(instrument_id)
+        else:
+            self.submit_order(
+                self.order_factory.market(
+                    instrument_id, side, Quantity.from_int(100_000)
+                )
+            )
+
+
+def make_quotes(instrument: Instrument, mid: float, n: int) -> list[QuoteTick]:
+    rng = np.random.default_rng(3)
+    mids = mid * np.cumprod(1 + rng.normal(0, 0.0005, n))
+    spread = 2 * 10**-instrument.price_precision
+
+    return [
+        QuoteTick(
+            instrument.id,
+            instrument.make_price(price - spread),
+            instrument.make_price(price + spread),
+            Quantity.from_int(1_000_000),
+            Quantity.from_int(1_000_000),
+            (i + 1) * 10_000_000_000,
+            (i + 1) * 10_000_000_000,
+        )
+        for i, price in enumerate(mids)
+    ]
+
+
+def test_actor_matches_the_per_venue_equity():
+    engine = BacktestEngine(
+        BacktestEngineConfig(logging=LoggingConfig(log_level="ERROR"))
+    )
+    engine.add_venue(
+        SIM,
+        OmsType.NETTING,
+        AccountType.MARGIN,
+        [Money(1_000_000, USD), Money(100_000_000, JPY)],
+        base_currency=None,
+    )
+
+    for instrument in (EURUSD, USDJPY):
+        engine.add_instrument(instrument)
+
+    # Quotes every 10 seconds, for each pair, for an hour.
+    engine.add_data(make_quotes(EURUSD, 1.1, 360) + make_quotes(USDJPY, 150.0, 360))
+
+    actor = EquityActor(
+        EquityActorConfig(
+            account_venue=SIM,
+            exchange_rate_venue=SIM,
+            reporting_currency=USD,
+            start_time=pd.Timestamp(60_000_000_000, tz="UTC"),
+            interval=pd.Timedelta(minutes=1),
+            component_id="EQUITY",
+        )
+    )
+    engine.add_actor(actor)
+    engine.add_strategy(
+        TradeOnSchedule(
+            {
+                20: (EURUSD.id, OrderSide.BUY),
+                60: (USDJPY.id, OrderSide.SELL),
+                200: (EURUSD.id, OrderSide.BUY),
+                300: (EURUSD.id, None),
+                400: (USDJPY.id, OrderSide.SELL),
+                500: (USDJPY.id, None),
+                600: (EURUSD.id, OrderSide.SELL),
+            }
+        )
+    )
+
+    published = []
+
+    def on_equity(data: EquityData) -> None:
+        # The equity as it was calculated before the tracker: every venue's
+        # unrealised PnLs, fetched from the portfolio.
+        venues = {instrument.id.venue for instrument in actor.cache.instruments()}
+        equities = get_equities(
+            actor.portfolio.account(SIM).balances_total(),
+            get_all_unrealised_pnls(actor, venues),
+        )
+        expected = get_equity(actor, equities, SIM, USD)
+
+        published.append((data.equity, expected.as_double()))
+
+    engine.kernel.msgbus.subscribe("data.EquityData*", on_equity)
+    engine.run()
+
+    fills = engine.trader.generate_order_fills_report()
+
+    assert len(fills) == 7
+    assert len(published) == 59
+    assert len({equity for equity, _ in published}) > 1
+    assert [equity for equity, _ in published] == pytest.approx(
+        [expected for _, expected in published], rel=1e-12
+    )
+
+    engine.dispose()
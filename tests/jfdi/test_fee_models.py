@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from nautilus_trader.model import Price, Quantity
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
+
+from jfdi.fee_models.interactive_brokers import (
+    InstrumentKind,
+    InteractiveBrokersFeeModel,
+    Pricing,
+    commission_schedules,
+    commissions,
+)
+
+
+@pytest.mark.parametrize("pricing", list(Pricing))
+def test_commissions_match_the_schedules(pricing):
+    rng = np.random.default_rng(5)
+    n_fills = 5_000
+
+    fill_qty = rng.integers(1, 5_000, n_fills).astype(float)
+    fill_px = rng.choice([0.01, 0.05, 0.07, 0.10, 0.5, 3.0, 150.0], n_fills)
+    instrument_kind = rng.choice([kind.value for kind in InstrumentKind] + [0], n_fills)
+    multiplier = np.where(instrument_kind == InstrumentKind.OPTION.value, 100.0, 1.0)
+    monthly_volume = rng.choice([0, 1_000, 10_000, 300_000, 5e6, 2e8], n_fills)
+
+    expected = [
+        commission_schedules[pricing][InstrumentKind(kind)].commission(
+            qty, px, mult, volume
+        )
+        if kind
+        else 0.0
+        for qty, px, kind, mult, volume in zip(
+            fill_qty, fill_px, instrument_kind, multiplier, monthly_volume, strict=True
+        )
+    ]
+
+    assert commissions(
+        fill_qty, fill_px, instrument_kind, multiplier, monthly_volume, pricing
+    ) == pytest.approx(expected, rel=1e-12)
+
+
+def test_commissions_accept_instrument_kinds():
+    kinds = [InstrumentKind.EQUITY, None, InstrumentKind.OPTION]
+
+    assert list(commissions([100.0], [50.0], kinds, [1.0, 1.0, 100.0])) == list(
+        commissions([100.0], [50.0], [1, 0, 3], [1.0, 1.0, 100.0])
+    )
+    assert commissions([100.0], [50.0], [InstrumentKind.EQUITY])[0] > 0
+
+    with pytest.raises(ValueError):
+        commissions([100.0], [50.0], ["EQUITY"])
+
+
+def test_fixed_equity_commissions():
+    equity = commission_schedules[Pricing.FIXED][InstrumentKind.EQUITY]
+
+    # $0.005 per share, with a minimum of $1 and a maximum of 1% of the trade value.
+    assert equity.commission(1_000, 50.0) == pytest.approx(5.0)
+    assert equity.commission(10, 50.0) == pytest.approx(1.0)
+    assert equity.commission(1_000, 0.2) == pytest.approx(2.0)
+    assert equity.commission(10, 1.0) == pytest.approx(0.1)
+
+
+def test_fee_model_prices_every_kind_of_instrument():
+    fee_model = InteractiveBrokersFeeModel(Pricing.TIERED)
+
+    instruments = [
+        TestInstrumentProvider.equity("AAPL", "XNAS"),
+        TestInstrumentProvider.es_future(2024, 3),
+        TestInstrumentProvider.aapl_option(),
+    ]
+
+    for instrument in instruments:
+        order = TestExecStubs.market_order(instrument, quantity=Quantity.from_int(10))
+        commission = fee_model.get_commission(
+            order,
+            Quantity.from_int(10),
+            Price(1.0, instrument.price_precision),
+            instrument,
+        )
+
+        assert commission.as_double() > 0
+
+    assert set(fee_model.monthly_volumes) == set(InstrumentKind)
+    assert all(volume == 10 for volume in fee_model.monthly_volumes.values())
+
+
+def test_tiered_rates_fall_with_monthly_volume():
+    future = commission_schedules[Pricing.TIERED][InstrumentKind.FUTURE]
+
+    assert future.commission(1, 5_000.0, monthly_volume=1_000) == pytest.approx(0.85)
+    assert future.commission(1, 5_000.0, monthly_volume=1_001) == pytest.approx(0.65)
+    assert future.commission(1, 5_000.0, monthly_volume=50_000) == pytest.approx(0.25)
@@ -0,0 +1,144 @@
+from itertools import pairwise
+from types import SimpleNamespace
+
+import pyarrow as pa
+import pytest
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import Bar, BarType, Currency, Money, Price, Quantity, Venue
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from jfdi.backtesting.market_data import (
+    MarketData,
+    add_instruments,
+    bars_to_table,
+    materialise_market_data,
+    run_streaming,
+)
+from jfdi.strategies.examples.buy_and_hold import (
+    BuyAndHoldStrategy,
+    BuyAndHoldStrategyConfig,
+)
+
+USD = Currency.from_str("USD")
+VENUE = Venue("XNAS")
+
+
+def make_bars(bar_type: BarType, minutes: range, price: float) -> list[Bar]:
+    bars = []
+
+    for minute in minutes:
+        close = Price(price + minute * 0.25, 2)
+        ts = minute * 60_000_000_000
+        bars.append(Bar(bar_type, close, close, close, close, Quantity(1e6, 0), ts, ts))
+
+    return bars
+
+
+@pytest.fixture
+def catalog():
+    instruments = [
+        TestInstrumentProvider.equity("AAPL", "XNAS"),
+        TestInstrumentProvider.equity("MSFT", "XNAS"),
+    ]
+    bars = {
+        f"{instruments[0].id}-1-MINUTE-LAST-EXTERNAL": make_bars(
+            BarType.from_str(f"{instruments[0].id}-1-MINUTE-LAST-EXTERNAL"),
+            range(1, 41),
+            100,
+        ),
+        # Every other minute, so the bar types don't line up.
+        f"{instruments[1].id}-1-MINUTE-LAST-EXTERNAL": make_bars(
+            BarType.from_str(f"{instruments[1].id}-1-MINUTE-LAST-EXTERNAL"),
+            range(2, 41, 2),
+            200,
+        ),
+    }
+
+    return SimpleNamespace(
+        instruments=lambda instrument_ids: instruments,
+        bars=lambda bar_types, start, end: bars[bar_types[0]],
+        bar_types=[BarType.from_str(bar_type) for bar_type in bars],
+        all_bars=[bar for bar_type_bars in bars.values() for bar in bar_type_bars],
+    )
+
+
+def test_bars_to_table_requires_one_bar_type(catalog):
+    with pytest.raises(ValueError, match="one bar type"):
+        bars_to_table(catalog.all_bars)
+
+
+def test_chunks_cover_every_bar_once(catalog, tmp_path):
+    materialise_market_data(catalog, catalog.bar_types, tmp_path)
+
+    allocated_bytes = pa.total_allocated_bytes()
+    market_data = MarketData(tmp_path)
+
+    # The bars are mapped rather than read into memory.
+    assert pa.total_allocated_bytes() == allocated_bytes
+    assert [instrument.id.symbol.value for instrument in market_data.instruments] == [
+        "AAPL",
+        "MSFT",
+    ]
+
+    chunks = list(market_data.chunks(chunk_size=7))
+    ts_inits = [{bar.ts_init for bar in chunk} for chunk in chunks]
+
+    assert len(chunks) > 1
+    assert sorted(str(bar) for chunk in chunks for bar in chunk) == sorted(
+        str(bar) for bar in catalog.all_bars
+    )
+    # Windows follow each other, without splitting a timestamp between them.
+    assert all(max(earlier) < min(later) for earlier, later in pairwise(ts_inits))
+
+
+def run(catalog, market_data: MarketData | None) -> BacktestEngine:
+    engine = BacktestEngine(
+        BacktestEngineConfig(logging=LoggingConfig(log_level="ERROR"))
+    )
+    engine.add_venue(
+        VENUE,
+        OmsType.NETTING,
+        AccountType.MARGIN,
+        [Money(10_000, USD)],
+        base_currency=USD,
+    )
+    engine.add_strategy(
+        BuyAndHoldStrategy(
+            BuyAndHoldStrategyConfig(bar_type=catalog.bar_types[1], order_id_tag="000")
+        )
+    )
+
+    if market_data is None:
+        for instrument in catalog.instruments(None):
+            engine.add_instrument(instrument)
+
+        engine.add_data(catalog.all_bars)
+        engine.run()
+    else:
+        add_instruments(engine, market_data)
+        run_streaming(engine, market_data, chunk_size=7)
+
+    return engine
+
+
+def test_streaming_matches_a_single_run(catalog, tmp_path):
+    materialise_market_data(catalog, catalog.bar_types, tmp_path)
+
+    engine = run(catalog, None)
+    streaming_engine = run(catalog, MarketData(tmp_path))
+
+    fills = engine.trader.generate_order_fills_report()
+    streaming_fills = streaming_engine.trader.generate_order_fills_report()
+
+    assert len(fills) == 2
+    assert fills[["side", "filled_qty", "avg_px", "ts_last"]].equals(
+        streaming_fills[["side", "filled_qty", "avg_px", "ts_last"]]
+    )
+    assert engine.portfolio.account(VENUE).balances_total() == (
+        streaming_engine.portfolio.account(VENUE).balances_total()
+    )
+
+    engine.dispose()
+    streaming_engine.dispose()
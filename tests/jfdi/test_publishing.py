@@ -0,0 +1,89 @@
+import pytest
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.component import MessageBus, TestClock
+from nautilus_trader.model import (
+    Bar,
+    BarType,
+    ComponentId,
+    DataType,
+    Price,
+    Quantity,
+    TraderId,
+)
+from nautilus_trader.portfolio.portfolio import Portfolio
+
+from jfdi.actors.directional_changes.extrema import ExtremaActor, ExtremaActorConfig
+from jfdi.actors.equity import EquityData
+
+BAR_TYPE = BarType.from_str("SPY.ARCA-1-MINUTE-LAST-EXTERNAL")
+
+
+def make_bar(ts: int, price: float) -> Bar:
+    return Bar(
+        BAR_TYPE,
+        Price(price, 2),
+        Price(price, 2),
+        Price(price, 2),
+        Price(price, 2),
+        Quantity(1, 0),
+        ts,
+        ts,
+    )
+
+
+def make_actor() -> ExtremaActor:
+    return ExtremaActor(
+        ExtremaActorConfig(
+            bar_type=BAR_TYPE,
+            thresholds=[0.001, 0.01],
+            component_id=ComponentId("E"),
+            profile_publishing=True,
+        )
+    )
+
+
+def test_publishes_to_cached_topics_and_profiles_them():
+    clock = TestClock()
+    msgbus = MessageBus(TraderId("TESTER-001"), clock)
+    cache = Cache()
+
+    actor = make_actor()
+    actor.register_base(Portfolio(msgbus, cache, clock), msgbus, cache, clock)
+    actor.start()
+
+    received = {}
+    for data_type in actor.data_types:
+        topic = f"data.{data_type.topic}"
+        received[topic] = []
+        msgbus.subscribe(topic, received[topic].append)
+
+    # Every bar after the first reverses the trend at both thresholds.
+    for ts, price in enumerate([100.0, 90.0, 110.0, 90.0, 110.0], start=1):
+        actor.on_bar(make_bar(ts, price))
+
+    assert {topic: len(data) for topic, data in received.items()} == {
+        topic: stats.count for topic, stats in actor.publish_stats.items()
+    }
+    assert all(data for data in received.values())
+    assert all(
+        stats.max_ns >= stats.mean_ns > 0 for stats in actor.publish_stats.values()
+    )
+
+
+def test_checks_the_data_like_actor_publish_data():
+    actor = make_actor()
+    data_type = DataType(EquityData)
+    data = EquityData(ts_event=0, ts_init=0, equity=1.0)
+
+    with pytest.raises(ValueError, match="registered"):
+        actor.publish_data(data_type, data)
+
+    clock = TestClock()
+    msgbus = MessageBus(TraderId("TESTER-001"), clock)
+    cache = Cache()
+    actor.register_base(Portfolio(msgbus, cache, clock), msgbus, cache, clock)
+
+    with pytest.raises(TypeError):
+        actor.publish_data(data_type, make_bar(1, 100.0))
+    with pytest.raises(TypeError):
+        actor.publish_data(data_type, None)
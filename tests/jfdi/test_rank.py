@@ -0,0 +1,228 @@
+from types import SimpleNamespace
+
+import numpy as np
+from nautilus_trader.accounting.factory import AccountFactory
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.component import MessageBus, TestClock
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.core.data import Data
+from nautilus_trader.model import (
+    Bar,
+    BarSpecification,
+    BarType,
+    ComponentId,
+    Currency,
+    DataType,
+    InstrumentId,
+    Money,
+    Price,
+    Quantity,
+    TraderId,
+    Venue,
+)
+from nautilus_trader.model.custom import customdataclass
+from nautilus_trader.model.enums import (
+    AccountType,
+    AggregationSource,
+    OmsType,
+    OrderSide,
+)
+from nautilus_trader.model.identifiers import AccountId
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+
+from jfdi.actors.rank import RankActor, RankActorConfig
+from jfdi.strategies.examples.buy_top_ranks import (
+    BuyTopRanksStrategy,
+    BuyTopRanksStrategyConfig,
+)
+
+BAR_SPEC = BarSpecification.from_str("1-DAY-LAST")
+INSTRUMENT_IDS = [InstrumentId.from_str(f"S{i}.XNAS") for i in range(6)]
+XNAS = Venue("XNAS")
+USD = Currency.from_str("USD")
+# The daily growth (%) of each instrument, which ranks them [3, 1, 6, 4, 2, 5].
+GROWTH = [1.0, 3.0, -2.0, 0.5, 2.0, -1.0]
+
+
+@customdataclass
+class RankData(Data):
+    instrument_indices: np.ndarray = None
+    ranks: np.ndarray = None
+
+
+def make_bars(n_days: int) -> list[Bar]:
+    bars = []
+
+    for t in range(n_days):
+        ts = (t + 1) * 86_400_000_000_000
+
+        for instrument_id, rate in zip(INSTRUMENT_IDS, GROWTH, strict=True):
+            price = Price(100 * (1 + rate / 100) ** t, 2)
+            bars.append(
+                Bar(
+                    BarType(instrument_id, BAR_SPEC, AggregationSource.EXTERNAL),
+                    price,
+                    price,
+                    price,
+                    price,
+                    Quantity(1, 0),
+                    ts,
+                    ts,
+                )
+            )
+
+    return bars
+
+
+def make_rank_actor() -> RankActor:
+    return RankActor(
+        RankActorConfig(
+            instrument_ids=INSTRUMENT_IDS,
+            bar_spec=BAR_SPEC,
+            indicator_class="ROC_3",
+            data_class=RankData,
+            dtype_instrument_index="uint16",
+            dtype_rank="uint16",
+            component_id=ComponentId("R"),
+            cross_sectional=True,
+        )
+    )
+
+
+def make_strategy() -> BuyTopRanksStrategy:
+    return BuyTopRanksStrategy(
+        BuyTopRanksStrategyConfig(
+            instrument_ids=INSTRUMENT_IDS,
+            data_class=RankData,
+            top=2,
+            weight=0.5,
+            threshold=0.0,
+            exchange_rate_venue=XNAS,
+            reporting_currency=USD,
+            order_id_tag="000",
+        )
+    )
+
+
+def test_ranks_line_up_with_the_symbol_table():
+    clock = TestClock()
+    msgbus = MessageBus(TraderId("TESTER-001"), clock)
+    cache = Cache()
+
+    actor = make_rank_actor()
+    actor.register_base(Portfolio(msgbus, cache, clock), msgbus, cache, clock)
+    actor.start()
+
+    published = []
+    actor.publish_data = lambda data_type, data: published.append(data)
+
+    for bar in make_bars(5):
+        actor.on_bar(bar)
+
+    data = published[-1]
+
+    np.testing.assert_array_equal(data.instrument_indices, range(len(INSTRUMENT_IDS)))
+    np.testing.assert_array_equal(data.ranks, [3, 1, 6, 4, 2, 5])
+
+    # The strategy picks the top ranks out of the same symbol table.
+    strategy = BuyTopRanksStrategy(
+        BuyTopRanksStrategyConfig(
+            instrument_ids=INSTRUMENT_IDS,
+            data_class=RankData,
+            top=2,
+            weight=1.0,
+            threshold=0.0,
+            exchange_rate_venue=XNAS,
+            reporting_currency=USD,
+            order_id_tag="000",
+        )
+    )
+    strategy.instrument_ids = INSTRUMENT_IDS
+    strategy.account = SimpleNamespace(leverages=dict, default_leverage=1)
+
+    assert strategy.get_target_weights(data) == {
+        INSTRUMENT_IDS[1]: 0.5,
+        INSTRUMENT_IDS[4]: 0.5,
+    }
+
+
+def test_rank_release_submits_orders_for_the_top_ranks():
+    engine = BacktestEngine(
+        BacktestEngineConfig(logging=LoggingConfig(log_level="ERROR"))
+    )
+    engine.add_venue(
+        XNAS,
+        OmsType.NETTING,
+        AccountType.MARGIN,
+        [Money(1_000_000, USD)],
+        base_currency=USD,
+    )
+
+    for instrument_id in INSTRUMENT_IDS:
+        engine.add_instrument(
+            TestInstrumentProvider.equity(instrument_id.symbol.value, "XNAS")
+        )
+
+    engine.add_data(make_bars(5))
+    engine.add_actor(make_rank_actor())
+    engine.add_strategy(make_strategy())
+    engine.run()
+
+    orders = engine.cache.orders()
+
+    # The strategy buys the top two, and only trades them from then on.
+    assert orders
+    assert {order.instrument_id for order in orders} == {
+        INSTRUMENT_IDS[1],
+        INSTRUMENT_IDS[4],
+    }
+    assert orders[0].side == OrderSide.BUY
+
+    engine.dispose()
+
+
+def test_running_strategy_buys_the_top_ranks_by_index():
+    clock = TestClock()
+    msgbus = MessageBus(TraderId("TESTER-001"), clock)
+    cache = Cache()
+    portfolio = Portfolio(msgbus, cache, clock)
+
+    submitted = []
+    msgbus.register("RiskEngine.execute", lambda command: submitted.append(command))
+
+    for instrument_id in INSTRUMENT_IDS:
+        cache.add_instrument(
+            TestInstrumentProvider.equity(instrument_id.symbol.value, "XNAS")
+        )
+
+    for bar in make_bars(1):
+        cache.add_bar(bar)
+
+    cache.add_account(
+        AccountFactory.create(
+            TestEventStubs.margin_account_state(account_id=AccountId("XNAS-001"))
+        )
+    )
+
+    strategy = make_strategy()
+    strategy.register(TraderId("TESTER-001"), portfolio, msgbus, cache, clock)
+    strategy.start()
+
+    # The ranks refer to the symbol table by index, in any order: S4 and S1 are
+    # ranked first and second.
+    data = RankData(
+        ts_event=1,
+        ts_init=1,
+        instrument_indices=np.array([5, 4, 3, 2, 1, 0], dtype=np.uint16),
+        ranks=np.array([6, 1, 3, 4, 2, 5], dtype=np.uint16),
+    )
+    msgbus.publish(f"data.{DataType(RankData).topic}", data)
+
+    assert {command.order.instrument_id for command in submitted} == {
+        INSTRUMENT_IDS[4],
+        INSTRUMENT_IDS[1],
+    }
+    assert all(command.order.side == OrderSide.BUY for command in submitted)
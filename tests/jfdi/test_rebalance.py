@@ -0,0 +1,29 @@
+import numpy as np
+
+from jfdi.extensions.strategies.rebalance import RebalancePlan, get_cash_released
+
+
+def test_cash_released():
+    cash_released = get_cash_released(
+        net_positions=np.array([10.0, 10.0, -10.0, 0.0, 10.0]),
+        order_quantities=np.array([-4.0, 5.0, 4.0, -3.0, -15.0]),
+        unit_costs=np.array([2.0, 2.0, 2.0, 2.0, 2.0]),
+    )
+
+    # Selling longs and covering shorts release cash, buying and shorting take it,
+    # and reversing a position does both.
+    assert list(cash_released) == [8.0, -10.0, 8.0, -6.0, 10.0]
+
+
+def test_plan_releases_cash_before_taking_it():
+    orders = ["a", "b", "c", "d", "e"]
+    plan = RebalancePlan(orders, np.array([-30.0, 5.0, -10.0, 20.0, -20.0]))
+
+    assert plan.first_wave == ["d", "b"]
+    assert len(plan) == 3
+
+    # The cheapest orders go first, as far as the free margin goes.
+    assert plan.next_wave(35.0) == ["c", "e"]
+    assert plan.next_wave(29.0) == []
+    assert plan.next_wave(30.0) == ["a"]
+    assert not plan
@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from jfdi.indicators.alma import ALMA
+from jfdi.indicators.mmi import MMI
+from jfdi.indicators.rolling_window import RollingWindow
+
+
+def test_rolling_window_is_latest_first():
+    window = RollingWindow(3)
+
+    for value in [1.0, 2.0]:
+        window.append(value)
+
+    assert not window.full
+    np.testing.assert_array_equal(window.latest_first(), [2.0, 1.0, np.nan])
+
+    for value in [3.0, 4.0, 5.0]:
+        window.append(value)
+
+    assert window.full
+    assert window[0] == 5.0
+    np.testing.assert_array_equal(window.latest_first(), [5.0, 4.0, 3.0])
+
+
+def test_alma_matches_weighted_window():
+    rng = np.random.default_rng(3)
+    prices = 100 + np.cumsum(rng.normal(size=50))
+
+    alma = ALMA(period=10)
+    for i, price in enumerate(prices):
+        alma.update_raw(price)
+
+        assert alma.initialized == (i >= 9)
+
+    np.testing.assert_allclose(alma.value, np.dot(prices[-10:], alma._weights))
+
+
+def test_mmi_matches_full_window():
+    rng = np.random.default_rng(5)
+    # Rounding the prices makes sure that ties are handled too.
+    prices = np.round(100 + np.cumsum(rng.normal(size=200)))
+    period = 20
+
+    mmi = MMI(period=period)
+    for i, price in enumerate(prices):
+        mmi.update_raw(price)
+
+        if i < period - 1:
+            assert np.isnan(mmi.value)
+            continue
+
+        window = prices[i - period + 1 : i + 1][::-1]
+        median = np.median(window)
+        curr, prev = window[:-1], window[1:]
+        number_higher = np.sum((curr > median) & (curr > prev))
+        number_lower = np.sum((curr < median) & (curr < prev))
+
+        assert mmi.median == median
+        assert mmi.value == (number_higher + number_lower) / (period - 1)
+        assert mmi.number_higher == number_higher / (period - 1)
+        assert mmi.number_lower == number_lower / (period - 1)
+
+
+def test_mmi_needs_a_move():
+    with pytest.raises(ValueError, match="period"):
+        MMI(period=1)
@@ -0,0 +1,140 @@
+import math
+from types import SimpleNamespace
+
+import numpy as np
+import pandas as pd
+import pytest
+from nautilus_trader.backtest.engine import BacktestEngine, BacktestEngineConfig
+from nautilus_trader.config import LoggingConfig
+from nautilus_trader.model import Bar, BarType, Currency, Money, Price, Quantity, Venue
+from nautilus_trader.model.enums import AccountType, OmsType
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+from nautilus_trader.test_kit.stubs.execution import TestExecStubs
+
+from jfdi.actors.equity import EquityActor, EquityActorConfig, EquityData
+from jfdi.backtesting.sweep import (
+    ParameterSweepConfig,
+    RunSummary,
+    expand_grid,
+    run_sweep,
+)
+from jfdi.strategies.examples.buy_and_hold import (
+    BuyAndHoldStrategy,
+    BuyAndHoldStrategyConfig,
+)
+
+USD = Currency.from_str("USD")
+VENUE = Venue("XNAS")
+
+
+def setup(engine: BacktestEngine, drift: float) -> None:
+    """Buy and hold an equity whose price drifts by the same amount every minute."""
+    engine.add_venue(
+        VENUE,
+        OmsType.NETTING,
+        AccountType.MARGIN,
+        [Money(10_000, USD)],
+        base_currency=USD,
+    )
+
+    instrument = TestInstrumentProvider.equity("AAPL", "XNAS")
+    engine.add_instrument(instrument)
+
+    bar_type = BarType.from_str(f"{instrument.id}-1-MINUTE-LAST-EXTERNAL")
+    bars = []
+
+    for minute in range(1, 31):
+        price = Price(100 + drift * minute, 2)
+        ts = minute * 60_000_000_000
+        bars.append(Bar(bar_type, price, price, price, price, Quantity(1e6, 0), ts, ts))
+
+    engine.add_data(bars)
+
+    engine.add_actor(
+        EquityActor(
+            EquityActorConfig(
+                account_venue=VENUE,
+                exchange_rate_venue=VENUE,
+                reporting_currency=USD,
+                start_time=pd.Timestamp(120_000_000_000, tz="UTC"),
+                interval=pd.Timedelta(minutes=1),
+                component_id="EQUITY",
+            )
+        )
+    )
+    engine.add_strategy(
+        BuyAndHoldStrategy(
+            BuyAndHoldStrategyConfig(bar_type=bar_type, order_id_tag="000")
+        )
+    )
+
+
+def test_expand_grid():
+    grid = {"top": [3, 5], "indicator_class": ["ROC_10", "ROC_20"], "weight": [0.1]}
+
+    assert expand_grid(grid) == [
+        {"top": 3, "indicator_class": "ROC_10", "weight": 0.1},
+        {"top": 3, "indicator_class": "ROC_20", "weight": 0.1},
+        {"top": 5, "indicator_class": "ROC_10", "weight": 0.1},
+        {"top": 5, "indicator_class": "ROC_20", "weight": 0.1},
+    ]
+
+
+def test_summary():
+    instrument = TestInstrumentProvider.equity("AAPL", "XNAS")
+    cache = SimpleNamespace(instrument=lambda instrument_id: instrument)
+    summary = RunSummary(cache, VENUE, USD)
+
+    for equity in (100.0, 110.0, 99.0, 121.0):
+        summary.on_equity(EquityData(ts_event=0, ts_init=0, equity=equity))
+
+    for weights in ([0.5, 0.5], [0.25, 0.5], [0.0, -0.25]):
+        summary.on_weights(SimpleNamespace(weights=np.array(weights)))
+
+    order = TestExecStubs.limit_order(instrument=instrument)
+    fill = TestEventStubs.order_filled(
+        order, instrument, last_qty=Quantity(10, 0), last_px=Price(100, 2)
+    )
+    summary.on_order_event(fill)
+
+    row = summary.to_dict()
+
+    assert row["error"] is None
+    assert row["start_equity"] == 100.0
+    assert row["end_equity"] == 121.0
+    assert row["total_return"] == pytest.approx(0.21)
+    assert row["max_drawdown"] == pytest.approx(-0.1)
+    assert row["mean_gross_weight"] == pytest.approx(2 / 3)
+    assert row["max_gross_weight"] == pytest.approx(1.0)
+    assert row["mean_turnover"] == pytest.approx(0.625)
+    assert row["fills"] == 1
+    assert row["traded_notional"] == pytest.approx(1_000)
+    assert row["commissions"] == pytest.approx(fill.commission.as_double())
+
+
+def test_sweep_collects_a_row_per_grid_point():
+    config = ParameterSweepConfig(
+        setup_path=f"{__name__}:setup",
+        grid={"drift": [0.5, -0.5, None]},
+        exchange_rate_venue=VENUE,
+        reporting_currency=USD,
+        engine=BacktestEngineConfig(logging=LoggingConfig(log_level="ERROR")),
+        max_workers=2,
+    )
+
+    table = run_sweep(config).to_pylist()
+
+    assert [row["drift"] for row in table] == [0.5, -0.5, None]
+
+    rising, falling, bad = table
+
+    assert rising["error"] is None
+    # The strategy buys on the first bar and sells when it stops.
+    assert rising["fills"] == 2
+    assert rising["total_return"] > 0
+    assert rising["max_drawdown"] == 0
+    assert falling["total_return"] < 0
+    assert falling["max_drawdown"] < 0
+    assert "TypeError" in bad["error"]
+    assert math.isnan(bad["end_equity"])
@@ -0,0 +1,197 @@
+import numpy as np
+import pytest
+import talib
+from nautilus_trader.model import Bar, BarType, Price, Quantity
+
+from jfdi.extensions.indicators.ta_lib.buffer import ChunkedArray, RingBuffer
+from jfdi.extensions.indicators.ta_lib.manager import (
+    TAFunctionWrapper,
+    TALibIndicatorManager,
+)
+from jfdi.extensions.indicators.ta_lib.registry import TALibIndicatorRegistry
+
+BAR_TYPE = BarType.from_str("SPY.ARCA-1-DAY-LAST-EXTERNAL")
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(42)
+    close = np.round(100 + np.cumsum(rng.normal(size=200)), 2)
+    high = close + np.round(rng.uniform(0.01, 1.0, size=200), 2)
+    low = close - np.round(rng.uniform(0.01, 1.0, size=200), 2)
+    volume = np.round(rng.uniform(1_000, 10_000, size=200))
+    return {
+        "open": close.copy(),
+        "high": high,
+        "low": low,
+        "close": close,
+        "volume": volume,
+    }
+
+
+@pytest.fixture
+def bars(prices):
+    return [
+        Bar(
+            bar_type=BAR_TYPE,
+            open=Price(prices["open"][i], 2),
+            high=Price(prices["high"][i], 2),
+            low=Price(prices["low"][i], 2),
+            close=Price(prices["close"][i], 2),
+            volume=Quantity(prices["volume"][i], 0),
+            ts_event=i + 1,
+            ts_init=i + 1,
+        )
+        for i in range(len(prices["close"]))
+    ]
+
+
+def test_ring_buffer_views_are_ordered_and_contiguous():
+    buffer = RingBuffer([("value", "float64")], capacity=3)
+
+    for value in range(5):
+        buffer.append((float(value),))
+
+    view = buffer.view("value")
+    np.testing.assert_array_equal(view, [2.0, 3.0, 4.0])
+    assert view.flags.c_contiguous
+    assert view.base is not None
+
+    buffer.replace((9.0,))
+    np.testing.assert_array_equal(buffer.view("value"), [2.0, 3.0, 9.0])
+
+
+@pytest.mark.parametrize(
+    "indicator",
+    ["SMA_10", "ROC_5", "BBANDS_20_2.0_2.0_0_UPPER", "AROON_14_UP", "WILLR_14"],
+)
+def test_manager_matches_talib(prices, bars, indicator):
+    taf = TAFunctionWrapper.from_str(indicator)
+    manager = TALibIndicatorManager(bar_type=BAR_TYPE, period=1)
+    manager.set_indicators((taf,))
+
+    values = []
+    for bar in bars:
+        manager.handle_bar(bar)
+        if manager.initialized:
+            values.append(manager.value(indicator))
+
+    # TA-Lib's own abstract API, over the whole series.
+    output_index = taf.output_names.index(indicator)
+    expected = taf.fn(prices)
+    if len(taf.output_names) > 1:
+        expected = expected[output_index]
+
+    np.testing.assert_allclose(values, expected[-len(values) :])
+
+    # The wrapper's latest value over the trailing window agrees with the manager's.
+    window = {name: prices[name][-(taf.fn.lookback + 1) :] for name in taf.input_names}
+    assert taf.compute_last(window)[output_index] == pytest.approx(
+        manager.value(indicator)
+    )
+
+
+def test_chunked_array_tail_is_a_view_across_chunks():
+    array = ChunkedArray([("value", "float64")], window=3, chunk_size=6)
+
+    for value in range(14):
+        array.append()["value"] = value
+
+    tail = array.tail(3)
+    np.testing.assert_array_equal(tail["value"], [11.0, 12.0, 13.0])
+    assert tail.base is not None
+
+    np.testing.assert_array_equal(array.to_array()["value"], np.arange(14.0))
+
+
+def test_chunked_array_max_rows_bounds_memory():
+    array = ChunkedArray([("value", "float64")], window=2, max_rows=5, chunk_size=4)
+
+    for value in range(100):
+        array.append()["value"] = value
+
+    assert len(array._chunks) <= 3
+    np.testing.assert_array_equal(array.to_array()["value"], np.arange(95.0, 100.0))
+
+
+def test_output_array_is_a_snapshot(bars):
+    manager = TALibIndicatorManager(bar_type=BAR_TYPE, period=3)
+    manager.set_indicators((TAFunctionWrapper.from_str("SMA_10"),))
+
+    for bar in bars[:20]:
+        manager.handle_bar(bar)
+
+    before = manager.output_array
+    latest = before["SMA_10"][-1]
+
+    # A bar with the same timestamp replaces the latest output.
+    last = bars[19]
+    close = Price(last.close.as_double() + 10, 2)
+    manager.handle_bar(
+        Bar(
+            bar_type=BAR_TYPE,
+            open=last.open,
+            high=close,
+            low=last.low,
+            close=close,
+            volume=last.volume,
+            ts_event=last.ts_event,
+            ts_init=last.ts_init,
+        )
+    )
+
+    assert manager.value("SMA_10") == pytest.approx(latest + 1)
+    assert before["SMA_10"][-1] == latest
+
+
+@pytest.mark.parametrize("indicator", ["SMA_10", "EMA_10", "MACD_12_26_9"])
+def test_handle_bars_batch_matches_streaming(bars, indicator):
+    taf = TAFunctionWrapper.from_str(indicator)
+
+    streamed = TALibIndicatorManager(bar_type=BAR_TYPE, period=3, buffer_size=50)
+    streamed.set_indicators((taf,))
+    for bar in bars:
+        streamed.handle_bar(bar)
+
+    # Warm up in a batch, duplicating a bar to check that it replaces its original,
+    # then stream the remainder.
+    batched = TALibIndicatorManager(bar_type=BAR_TYPE, period=3, buffer_size=50)
+    batched.set_indicators((taf,))
+    batched.handle_bars_batch([*bars[:120], bars[119]])
+    for bar in bars[120:]:
+        batched.handle_bar(bar)
+
+    assert batched.count == streamed.count
+    assert batched.initialized == streamed.initialized
+    np.testing.assert_array_equal(
+        batched._input_buffer.view("close"), streamed._input_buffer.view("close")
+    )
+    np.testing.assert_allclose(
+        batched.generate_output_array(truncate=False)[indicator],
+        streamed.generate_output_array(truncate=False)[indicator],
+    )
+
+
+def test_registry_computes_shared_outputs_once(bars):
+    registry = TALibIndicatorRegistry()
+    managers = [
+        TALibIndicatorManager(bar_type=BAR_TYPE, registry=registry) for _ in range(3)
+    ]
+    for manager in managers:
+        manager.set_indicators(TAFunctionWrapper.from_list_of_str(["SMA_10", "EMA_5"]))
+
+    solo = TALibIndicatorManager(bar_type=BAR_TYPE)
+    solo.set_indicators(TAFunctionWrapper.from_list_of_str(["SMA_10", "EMA_5"]))
+
+    for bar in bars:
+        solo.handle_bar(bar)
+        for manager in managers:
+            manager.handle_bar(bar)
+
+    assert registry.misses == 2 * len(bars)
+    assert registry.hits == 2 * 2 * len(bars)
+    expected = solo.generate_output_array(truncate=False)
+    for manager in managers:
+        result = manager.generate_output_array(truncate=False)
+        for name in solo.output_names:
+            np.testing.assert_array_equal(result[name], expected[name])
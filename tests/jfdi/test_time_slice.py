@@ -0,0 +1,82 @@
+import pandas as pd
+import pytest
+from nautilus_trader.common.component import TestClock
+from nautilus_trader.core.data import Data
+from nautilus_trader.model.custom import customdataclass
+
+from jfdi.extensions.aggregation.time_slice import (
+    IncompleteSlicePolicy,
+    TimeSliceAggregator,
+)
+
+
+@customdataclass
+class PriceData(Data):
+    price: float = 0
+
+
+def make_data(ts: int, price: float = 0.0) -> PriceData:
+    return PriceData(ts_event=ts, ts_init=ts, price=price)
+
+
+def test_completes_one_slice_per_timestamp():
+    slices = []
+    aggregator = TimeSliceAggregator(keys=["A", "B", "C"], callback=slices.append)
+
+    for ts in (1, 2):
+        for key in ("A", "B", "B", "C"):
+            aggregator.update(key, make_data(ts))
+
+    assert [time_slice.ts_event for time_slice in slices] == [1, 2]
+    assert all(time_slice.complete for time_slice in slices)
+
+
+@pytest.mark.parametrize(
+    ("policy", "expected"),
+    [
+        (IncompleteSlicePolicy.DROP, []),
+        (IncompleteSlicePolicy.EMIT, [{"A": 2.0}]),
+        (IncompleteSlicePolicy.FORWARD_FILL, [{"A": 2.0, "B": 1.0}]),
+    ],
+)
+def test_incomplete_slice_policies(policy, expected):
+    slices = []
+    aggregator = TimeSliceAggregator(
+        keys=["A", "B"], callback=slices.append, policy=policy
+    )
+
+    aggregator.update("A", make_data(1, 1.0))
+    aggregator.update("B", make_data(1, 1.0))
+    # B skips a bar.
+    aggregator.update("A", make_data(2, 2.0))
+    aggregator.update("A", make_data(3, 3.0))
+
+    incomplete = [time_slice for time_slice in slices if not time_slice.complete]
+    assert [
+        {key: data.price for key, data in time_slice.data.items()}
+        for time_slice in incomplete
+    ] == expected
+    assert all(time_slice.missing == ("B",) for time_slice in incomplete)
+
+
+def test_timeout_emits_incomplete_slice():
+    slices = []
+    clock = TestClock()
+    aggregator = TimeSliceAggregator(
+        keys=["A", "B"],
+        callback=slices.append,
+        policy=IncompleteSlicePolicy.EMIT,
+        clock=clock,
+        timeout=pd.Timedelta(seconds=5),
+    )
+
+    aggregator.update("A", make_data(1))
+    for event in clock.advance_time(pd.Timedelta(seconds=10).value):
+        event.handle()
+
+    assert len(slices) == 1
+    assert slices[0].missing == ("B",)
+
+    # B's bar is now late.
+    aggregator.update("B", make_data(1))
+    assert aggregator.n_late == 1
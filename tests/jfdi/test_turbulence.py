@@ -0,0 +1,182 @@
+import numpy as np
+import pytest
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.component import MessageBus, TestClock
+from nautilus_trader.model import (
+    Bar,
+    BarSpecification,
+    BarType,
+    ComponentId,
+    InstrumentId,
+    Price,
+    Quantity,
+    TraderId,
+)
+from nautilus_trader.model.enums import AggregationSource
+from nautilus_trader.portfolio.portfolio import Portfolio
+from scipy.spatial import distance
+from sklearn.covariance import LedoitWolf
+
+from jfdi.actors.turbulence import (
+    TurbulenceActor,
+    TurbulenceActorConfig,
+    TurbulenceData,
+)
+from jfdi.extensions.aggregation.time_slice import IncompleteSlicePolicy
+
+INSTRUMENT_IDS = [
+    InstrumentId.from_str(f"{symbol}.ARCA") for symbol in ("SPY", "TLT", "GLD")
+]
+BAR_SPEC = BarSpecification.from_str("1-MINUTE-LAST")
+FAST_PERIOD = 5
+SLOW_PERIOD = 30
+
+
+class BaselineTurbulence:
+    def __init__(self) -> None:
+        """The turbulence calculation of the original `TurbulenceActor`, per bar."""
+        self.last_closes = dict.fromkeys(INSTRUMENT_IDS, np.nan)
+        self.last_timestamps = dict.fromkeys(INSTRUMENT_IDS)
+        self.returns = {
+            instrument_id: np.full(SLOW_PERIOD, np.nan)
+            for instrument_id in INSTRUMENT_IDS
+        }
+
+    def on_bar(self, bar: Bar) -> float | None:
+        instrument_id = bar.bar_type.instrument_id
+        close = bar.close.as_double()
+
+        self.returns[instrument_id][1:] = self.returns[instrument_id][:-1]
+        self.returns[instrument_id][0] = (
+            close - self.last_closes[instrument_id]
+        ) / self.last_closes[instrument_id]
+
+        self.last_closes[instrument_id] = close
+        self.last_timestamps[instrument_id] = bar.ts_event
+
+        if any(np.isnan(returns).any() for returns in self.returns.values()):
+            return None
+        if len(set(self.last_timestamps.values())) != 1:
+            return None
+
+        matrix_returns = np.vstack(list(self.returns.values()))
+
+        r = np.prod(1 + matrix_returns[:, :FAST_PERIOD][:, ::-1], axis=1) - 1
+        mu = np.median(matrix_returns, axis=1)
+        sigma = LedoitWolf().fit(matrix_returns.T).covariance_
+
+        return (1 / (len(INSTRUMENT_IDS) * FAST_PERIOD)) * distance.mahalanobis(
+            r, mu, np.linalg.inv(sigma)
+        ) ** 2
+
+
+def make_bars(n_minutes: int) -> list[Bar]:
+    rng = np.random.default_rng(7)
+    prices = 100 * np.cumprod(
+        1 + rng.normal(0, 0.002, size=(n_minutes, len(INSTRUMENT_IDS))), axis=0
+    )
+
+    bars = []
+
+    for minute, minute_prices in enumerate(prices, start=1):
+        ts = minute * 60_000_000_000
+
+        for instrument_id, price in zip(INSTRUMENT_IDS, minute_prices, strict=True):
+            close = Price(price, 2)
+            bars.append(
+                Bar(
+                    BarType(instrument_id, BAR_SPEC, AggregationSource.EXTERNAL),
+                    close,
+                    close,
+                    close,
+                    close,
+                    Quantity(1, 0),
+                    ts,
+                    ts,
+                )
+            )
+
+    return bars
+
+
+def run_actor(bars: list[Bar], policy: IncompleteSlicePolicy) -> list[TurbulenceData]:
+    clock = TestClock()
+    msgbus = MessageBus(TraderId("TESTER-001"), clock)
+    cache = Cache()
+
+    actor = TurbulenceActor(
+        TurbulenceActorConfig(
+            instrument_ids=INSTRUMENT_IDS,
+            bar_spec=BAR_SPEC,
+            fast_period=FAST_PERIOD,
+            slow_period=SLOW_PERIOD,
+            component_id=ComponentId("TURBULENCE"),
+            incomplete_slice_policy=policy,
+        )
+    )
+    actor.register_base(Portfolio(msgbus, cache, clock), msgbus, cache, clock)
+    actor.start()
+
+    published = []
+    msgbus.subscribe(f"data.{actor.turbulence_data_type.topic}", published.append)
+
+    for bar in bars:
+        actor.on_bar(bar)
+
+    return published
+
+
+def run_baseline(bars: list[Bar]) -> list[tuple[int, float]]:
+    baseline = BaselineTurbulence()
+    expected = []
+
+    for bar in bars:
+        turbulence = baseline.on_bar(bar)
+        if turbulence is not None:
+            expected.append((bar.ts_event, turbulence))
+
+    return expected
+
+
+def test_actor_matches_the_baseline_calculation():
+    bars = make_bars(100)
+
+    published = run_actor(bars, IncompleteSlicePolicy.DROP)
+    expected = run_baseline(bars)
+
+    # The first slice has no returns, so the window is full after SLOW_PERIOD + 1.
+    assert len(expected) == 100 - SLOW_PERIOD
+    assert [data.ts_event for data in published] == [ts for ts, _ in expected]
+    assert [data.turbulence for data in published] == pytest.approx(
+        [turbulence for _, turbulence in expected], rel=1e-9
+    )
+
+
+@pytest.mark.parametrize(
+    "policy", [IncompleteSlicePolicy.EMIT, IncompleteSlicePolicy.FORWARD_FILL]
+)
+def test_missing_bars_are_unchanged_prices(policy):
+    bars = make_bars(100)
+    # GLD's bar is missing from the 60th minute.
+    missing = 60 * len(INSTRUMENT_IDS) - 1
+
+    published = run_actor(bars[:missing] + bars[missing + 1 :], policy)
+
+    # The baseline sees a bar at GLD's previous close instead.
+    previous = bars[missing - len(INSTRUMENT_IDS)]
+    filled = Bar(
+        bars[missing].bar_type,
+        previous.open,
+        previous.high,
+        previous.low,
+        previous.close,
+        previous.volume,
+        bars[missing].ts_event,
+        bars[missing].ts_init,
+    )
+    expected = run_baseline([*bars[:missing], filled, *bars[missing + 1 :]])
+
+    assert [data.ts_event for data in published] == [ts for ts, _ in expected]
+    assert [data.turbulence for data in published] == pytest.approx(
+        [turbulence for _, turbulence in expected], rel=1e-9
+    )
@@ -0,0 +1,78 @@
+from types import SimpleNamespace
+
+import pytest
+from nautilus_trader.model import Currency, Money, Venue
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+
+from jfdi.actors.weight import get_weight, get_weights
+
+USD = Currency.from_str("USD")
+VENUE = Venue("SIM")
+
+
+class Portfolio:
+    def __init__(self, exposures):
+        self.exposures = exposures
+
+    def is_flat(self, instrument_id):
+        return self.exposures.get(instrument_id, 0) == 0
+
+    def is_net_long(self, instrument_id):
+        return self.exposures.get(instrument_id, 0) > 0
+
+    def net_exposure(self, instrument_id):
+        return Money(abs(self.exposures.get(instrument_id, 0)), USD)
+
+
+class Cache:
+    def __init__(self, xrates):
+        self.xrates = xrates
+        self.lookups = 0
+
+    def get_xrate(self, venue, from_currency, to_currency):
+        self.lookups += 1
+        return self.xrates.get(from_currency.code)
+
+
+@pytest.fixture
+def instruments():
+    return [
+        TestInstrumentProvider.equity("AAPL", "XNAS"),
+        TestInstrumentProvider.equity("MSFT", "XNAS"),
+        TestInstrumentProvider.equity("SPY", "ARCA"),
+    ]
+
+
+def test_weights_match_weight(instruments):
+    actor = SimpleNamespace(
+        portfolio=Portfolio({instruments[0].id: 1_000.0, instruments[2].id: -250.0}),
+        cache=Cache({"USD": 1.0}),
+    )
+
+    weights = get_weights(actor, instruments, 10_000.0, VENUE, USD)
+
+    assert list(weights) == [
+        get_weight(actor, instrument, 10_000.0, VENUE, USD)
+        for instrument in instruments
+    ]
+    assert list(weights) == [0.1, 0.0, -0.025]
+
+
+def test_weights_look_up_each_exchange_rate_once(instruments):
+    cache = Cache({"USD": 1.0})
+    actor = SimpleNamespace(
+        portfolio=Portfolio({instrument.id: 100.0 for instrument in instruments}),
+        cache=cache,
+    )
+
+    get_weights(actor, instruments, 10_000.0, VENUE, USD)
+
+    assert cache.lookups == 1
+
+
+def test_weights_need_exchange_rates(instruments):
+    actor = SimpleNamespace(
+        portfolio=Portfolio({instruments[0].id: 100.0}), cache=Cache({})
+    )
+
+    assert get_weights(actor, instruments, 10_000.0, VENUE, USD) is None
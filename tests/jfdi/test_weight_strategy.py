@@ -0,0 +1,361 @@
+from decimal import Decimal
+
+import numpy as np
+import pytest
+from nautilus_trader.accounting.factory import AccountFactory
+from nautilus_trader.cache.cache import Cache
+from nautilus_trader.common.component import MessageBus, TestClock
+from nautilus_trader.core.uuid import UUID4
+from nautilus_trader.model import (
+    AccountBalance,
+    Currency,
+    Money,
+    Position,
+    Price,
+    Quantity,
+    TraderId,
+    Venue,
+)
+from nautilus_trader.model.data import TradeTick
+from nautilus_trader.model.enums import (
+    AccountType,
+    AggressorSide,
+    OmsType,
+    OrderSide,
+    PriceType,
+)
+from nautilus_trader.model.events import AccountState
+from nautilus_trader.model.identifiers import AccountId, PositionId, TradeId
+from nautilus_trader.model.orders.base import Order
+from nautilus_trader.portfolio.portfolio import Portfolio
+from nautilus_trader.test_kit.providers import TestInstrumentProvider
+from nautilus_trader.test_kit.stubs.events import TestEventStubs
+
+from jfdi.extensions.strategies.weight import WeightStrategy, WeightStrategyConfig
+from shared.data.rounding import round_directional
+
+N_INSTRUMENTS = 50
+XNAS = Venue("XNAS")
+USD = Currency.from_str("USD")
+JPY = Currency.from_str("JPY")
+
+
+@pytest.fixture
+def strategy():
+    clock = TestClock()
+    msgbus = MessageBus(TraderId("TESTER-001"), clock)
+    cache = Cache()
+
+    strategy = WeightStrategy(
+        WeightStrategyConfig(
+            exchange_rate_venue=Venue("XNAS"),
+            reporting_currency=Currency.from_str("USD"),
+        )
+    )
+    strategy.register(
+        TraderId("TESTER-001"), Portfolio(msgbus, cache, clock), msgbus, cache, clock
+    )
+
+    rng = np.random.default_rng(3)
+    for i in range(N_INSTRUMENTS):
+        instrument = TestInstrumentProvider.equity(f"S{i}", "XNAS")
+        cache.add_instrument(instrument)
+        cache.add_trade_tick(
+            TradeTick(
+                instrument.id,
+                Price(float(rng.uniform(10, 500)), 2),
+                Quantity(1, 0),
+                AggressorSide.BUYER,
+                TradeId(str(i)),
+                1,
+                1,
+            )
+        )
+
+    return strategy
+
+
+@pytest.fixture
+def order_weights(strategy):
+    rng = np.random.default_rng(4)
+    instrument_ids = [instrument.id for instrument in strategy.cache.instruments()]
+
+    weights = rng.uniform(-0.01, 0.01, len(instrument_ids)).tolist()
+
+    return dict(zip(instrument_ids, weights, strict=True))
+
+
+def test_instrument_index_is_stable(strategy, order_weights):
+    index = strategy.instrument_index
+    instrument_ids = list(order_weights)
+
+    first = index.indices(instrument_ids[:10], strategy.cache)
+    second = index.indices(instrument_ids[::-1], strategy.cache)
+
+    assert list(first) == list(range(10))
+    assert list(second[::-1][:10]) == list(first)
+    assert len(index) == len(instrument_ids)
+
+    with pytest.raises(ValueError):
+        index.indices([TestInstrumentProvider.equity("X", "XNAS").id], strategy.cache)
+
+
+def test_orders_from_array_match_orders_from_dict(strategy, order_weights):
+    equity = 1_000_000.0
+
+    orders = strategy.create_orders(equity, order_weights)
+    array_orders = strategy.create_orders_from_array(
+        equity, strategy.instrument_index.to_array(order_weights, strategy.cache)
+    )
+
+    assert orders
+    assert [(order.instrument_id, order.side, order.quantity) for order in orders] == [
+        (order.instrument_id, order.side, order.quantity) for order in array_orders
+    ]
+
+    for order in orders:
+        instrument = strategy.cache.instrument(order.instrument_id)
+        order_weight = order_weights[order.instrument_id]
+
+        assert order.side == (OrderSide.BUY if order_weight > 0 else OrderSide.SELL)
+        assert order.quantity == Quantity(
+            round_directional(
+                equity
+                * abs(order_weight)
+                / strategy.cache.price(order.instrument_id, PriceType.LAST).as_double(),
+                instrument.size_precision,
+            ),
+            instrument.size_precision,
+        )
+
+
+class Rebalancing:
+    def __init__(
+        self,
+        balances: list[Money],
+        account_type: AccountType = AccountType.CASH,
+        account_venue: Venue = XNAS,
+    ):
+        """A registered strategy with three instruments and an account.
+
+        The strategy's orders are captured rather than executed, and filled by hand.
+        """
+        clock = TestClock()
+        self.msgbus = MessageBus(TraderId("TESTER-001"), clock)
+        self.cache = Cache()
+        self.portfolio = Portfolio(self.msgbus, self.cache, clock)
+
+        self.submitted = []
+        self.msgbus.register(
+            "RiskEngine.execute", lambda command: self.submitted.append(command.order)
+        )
+
+        self.strategy = WeightStrategy(
+            WeightStrategyConfig(
+                exchange_rate_venue=XNAS,
+                reporting_currency=USD,
+                account_venue=account_venue,
+            )
+        )
+        self.strategy.register(
+            TraderId("TESTER-001"), self.portfolio, self.msgbus, self.cache, clock
+        )
+        self.strategy.start()
+
+        self.instruments = {}
+        for symbol in ("A", "B", "C"):
+            instrument = TestInstrumentProvider.equity(symbol, "XNAS")
+            self.cache.add_instrument(instrument)
+            self.cache.add_trade_tick(
+                TradeTick(
+                    instrument.id,
+                    Price(100, 2),
+                    Quantity(1, 0),
+                    AggressorSide.BUYER,
+                    TradeId(symbol),
+                    1,
+                    1,
+                )
+            )
+            self.instruments[symbol] = instrument
+
+        self.account = AccountFactory.create(
+            AccountState(
+                account_id=AccountId("XNAS-001"),
+                account_type=account_type,
+                base_currency=None,
+                reported=True,
+                balances=[
+                    AccountBalance(balance, Money(0, balance.currency), balance)
+                    for balance in balances
+                ],
+                margins=[],
+                info={},
+                event_id=UUID4(),
+                ts_event=0,
+                ts_init=0,
+            )
+        )
+        self.cache.add_account(self.account)
+
+    def order(self, symbol: str, side: OrderSide, quantity: int) -> Order:
+        return self.strategy.order_factory.market(
+            self.instruments[symbol].id, side, Quantity(quantity, 0)
+        )
+
+    def hold(self, symbol: str, quantity: int) -> None:
+        """Open a long position, without an order."""
+        instrument = self.instruments[symbol]
+        order = self.order(symbol, OrderSide.BUY, quantity)
+        fill = TestEventStubs.order_filled(
+            order, instrument, last_px=Price(100, 2), position_id=PositionId(symbol)
+        )
+        position = Position(instrument, fill)
+
+        self.cache.add_position(position, OmsType.NETTING)
+        self.portfolio.update_position(TestEventStubs.position_opened(position))
+
+    def fill(self, order: Order, free_cash: float) -> None:
+        """Fill a submitted order, leaving the account with some free cash."""
+        self.account.update_balances(
+            [
+                AccountBalance(
+                    Money(free_cash, USD), Money(0, USD), Money(free_cash, USD)
+                )
+            ]
+        )
+
+        for event in (
+            TestEventStubs.order_submitted(order),
+            TestEventStubs.order_accepted(order),
+            TestEventStubs.order_filled(
+                order, self.instruments[order.instrument_id.symbol.value]
+            ),
+        ):
+            order.apply(event)
+            self.cache.update_order(order)
+            self.msgbus.publish(f"events.order.{self.strategy.id}", event)
+
+
+def symbols(orders: list[Order]) -> list[str]:
+    return [order.instrument_id.symbol.value for order in orders]
+
+
+def test_rebalance_waves():
+    rebalancing = Rebalancing([Money(1_000, USD)])
+    rebalancing.hold("A", 10)
+
+    sell_a = rebalancing.order("A", OrderSide.SELL, 10)
+    buy_b = rebalancing.order("B", OrderSide.BUY, 8)
+    buy_c = rebalancing.order("C", OrderSide.BUY, 5)
+
+    rebalancing.strategy.submit_rebalance([buy_b, sell_a, buy_c])
+
+    # Only the order that releases cash goes first.
+    assert symbols(rebalancing.submitted) == ["A"]
+
+    # Once it's closed, the cheapest order that the free cash covers goes next.
+    rebalancing.fill(sell_a, free_cash=1_000)
+
+    assert symbols(rebalancing.submitted) == ["A", "C"]
+
+    # B costs more than what's left, so it's never submitted.
+    rebalancing.fill(buy_c, free_cash=500)
+
+    assert symbols(rebalancing.submitted) == ["A", "C"]
+
+
+def test_empty_first_wave_goes_straight_to_the_next():
+    rebalancing = Rebalancing([Money(1_000, USD)])
+
+    rebalancing.strategy.submit_rebalance(
+        [
+            rebalancing.order("B", OrderSide.BUY, 8),
+            rebalancing.order("C", OrderSide.BUY, 5),
+        ]
+    )
+
+    assert symbols(rebalancing.submitted) == ["C"]
+
+
+def test_new_rebalance_replaces_the_pending_plan():
+    rebalancing = Rebalancing([Money(1_000, USD)])
+    rebalancing.hold("A", 10)
+
+    sell_a = rebalancing.order("A", OrderSide.SELL, 10)
+    rebalancing.strategy.submit_rebalance(
+        [sell_a, rebalancing.order("B", OrderSide.BUY, 8)]
+    )
+    rebalancing.strategy.submit_rebalance([rebalancing.order("C", OrderSide.BUY, 5)])
+
+    # A still holds margin, so C waits for it to close.
+    assert symbols(rebalancing.submitted) == ["A"]
+
+    # A's plan was replaced, so B isn't submitted when A closes.
+    rebalancing.fill(sell_a, free_cash=2_000)
+
+    assert symbols(rebalancing.submitted) == ["A", "C"]
+
+
+def test_rebalance_aborts_without_an_exchange_rate():
+    rebalancing = Rebalancing([Money(1_000, USD)])
+    instrument = TestInstrumentProvider.default_fx_ccy("USD/JPY", XNAS)
+    rebalancing.cache.add_instrument(instrument)
+
+    rebalancing.strategy.submit_rebalance(
+        [
+            rebalancing.order("B", OrderSide.BUY, 8),
+            rebalancing.strategy.order_factory.market(
+                instrument.id, OrderSide.BUY, Quantity(1_000, 0)
+            ),
+        ]
+    )
+
+    assert rebalancing.submitted == []
+
+
+def test_rebalance_aborts_without_an_exchange_rate_for_the_free_margin():
+    # The account's JPY can't be converted.
+    rebalancing = Rebalancing([Money(1_000, USD), Money(100_000, JPY)])
+
+    rebalancing.strategy.submit_rebalance([rebalancing.order("B", OrderSide.BUY, 8)])
+
+    assert rebalancing.submitted == []
+
+
+def test_rebalance_aborts_without_an_account():
+    rebalancing = Rebalancing([Money(1_000, USD)], account_venue=Venue("NYSE"))
+
+    rebalancing.strategy.submit_rebalance([rebalancing.order("B", OrderSide.BUY, 8)])
+
+    assert rebalancing.submitted == []
+
+
+def test_margin_accounts_charge_initial_margin():
+    rebalancing = Rebalancing([Money(1_000, USD)], AccountType.MARGIN)
+    instrument = TestInstrumentProvider.default_fx_ccy("EUR/USD", XNAS)
+    rebalancing.cache.add_instrument(instrument)
+    rebalancing.cache.add_trade_tick(
+        TradeTick(
+            instrument.id,
+            Price(1.1, 5),
+            Quantity(1, 0),
+            AggressorSide.BUYER,
+            TradeId("EURUSD"),
+            1,
+            1,
+        )
+    )
+    rebalancing.account.set_leverage(instrument.id, Decimal(10))
+
+    cash_released = rebalancing.strategy.get_cash_released(
+        [
+            rebalancing.strategy.order_factory.market(
+                instrument.id, OrderSide.BUY, Quantity(10_000, 0)
+            ),
+            rebalancing.order("B", OrderSide.SELL, 8),
+        ]
+    )
+
+    # EUR/USD at 10x, with a 3% margin rate, and B (which has no margin rate).
+    assert list(cash_released) == pytest.approx([-10_000 * 1.1 * 0.03 / 10, 0])